@@ -0,0 +1,163 @@
+from __future__ import annotations
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import tempfile
+import zlib
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# kayitlari imzalayan anahtar; cache dizininin disinda, sadece kullanicinin okuyabildigi dosya
+DEFAULT_KEY_PATH = os.path.join(os.path.expanduser("~"), ".excel_reporter", "cache.key")
+
+_SUFFIX = ".pkl.z"
+_KEY_BYTES = 32
+_SIG_BYTES = hashlib.sha256().digest_size
+
+
+def file_digest(path: str, block_size: int = 1024 * 1024) -> str:
+    """Dosya iceriginin sha256 ozeti (parca parca okunur)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_signing_key(key_path: str) -> bytes:
+    """Imza anahtarini okur; yoksa rastgele uretip 0600 izinle yazar."""
+    try:
+        with open(key_path, "rb") as f:
+            key = f.read()
+        if len(key) >= _KEY_BYTES:
+            return key
+        raise ValueError(f"Cache anahtari gecersiz (cok kisa): {key_path}")
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(key_path) or ".", mode=0o700, exist_ok=True)
+    key = secrets.token_bytes(_KEY_BYTES)
+    try:
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return load_signing_key(key_path)  # baska process ayni anda uretti
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def make_key(*parts) -> str:
+    """Ayarlar + icerik ozetinden deterministik cache anahtari."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ProfileCache:
+    """
+    Diskte icerik adresli sonuc cache'i.
+
+    Her kayit ayri bir dosyadir (pickle + zlib) ve basinda HMAC-SHA256 imzasi
+    vardir. Yazma gecici dosya + os.replace ile atomiktir; ayni dizini kullanan
+    birden fazla process birbirinin yarim yazilmis kaydini goremez. Okunan
+    kaydin mtime'i guncellenir; toplam boyut max_bytes'i asarsa en eski
+    kullanilanlar silinir (LRU).
+
+    Guven varsayimi: cache_dir'e yazabilen biri kayit ekleyebilir ama imza
+    anahtari olmadan gecerli kayit uretemez; imzasi tutmayan kayit pickle'a
+    verilmeden silinir. Anahtar key_path'te (varsayilan ~/.excel_reporter/cache.key,
+    0600) cache_dir disinda tutulur; anahtari okuyabilen herkes bu kullanicinin
+    yetkisiyle kod calistirabilir, bu yuzden anahtar paylasilmamali.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, key_path: str | None = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_bytes)
+        key_path = os.path.abspath(key_path or DEFAULT_KEY_PATH)
+        cache_root = os.path.abspath(cache_dir)
+        if os.path.commonpath([key_path, cache_root]) == cache_root:
+            raise ValueError("Cache imza anahtari cache_dir icinde olamaz.")
+        os.makedirs(cache_dir, exist_ok=True)
+        self._key = load_signing_key(key_path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _SUFFIX)
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        sig, body = data[:_SIG_BYTES], data[_SIG_BYTES:]
+        if not hmac.compare_digest(sig, self._sign(body)):
+            # imzasiz/degistirilmis kayit: pickle'a verilmez
+            self._remove(path)
+            return None
+        try:
+            obj = pickle.loads(zlib.decompress(body))
+        except Exception:
+            # bozuk kayit: miss say ve temizle
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path, None)  # LRU: son kullanim
+        except OSError:
+            pass
+        return obj
+
+    def put(self, key: str, obj) -> None:
+        body = zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        data = self._sign(body) + body
+        if len(data) > self.max_bytes:
+            return
+
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            self._remove(tmp)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(_SUFFIX) or name.startswith(".tmp-"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue  # baska process silmis
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            self._remove(path)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(self._key, body, hashlib.sha256).digest()
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
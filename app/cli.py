@@ -0,0 +1,260 @@
+"""
+Headless komut satiri (tkinter import etmez).
+
+    python -m app profile <dosya|klasor|glob> ... --out DIR --workers N --format xlsx,html,json,parquet,arrow,ndjson
+"""
+from __future__ import annotations
+import argparse
+import csv
+import glob
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import traceback
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(PROJECT_ROOT, "templates")
+
+INPUT_EXTENSIONS = (".xlsx", ".xlsm", ".xls", ".csv", ".tsv", ".parquet")
+
+
+def expand_inputs(patterns: list) -> list:
+    """Dosya, klasor ve glob'lari tekil dosya listesine cevirir."""
+    seen = set()
+    files = []
+    for pat in patterns:
+        if os.path.isdir(pat):
+            matches = [os.path.join(root, name)
+                       for root, _, names in os.walk(pat) for name in names]
+        elif glob.has_magic(pat):
+            matches = glob.glob(pat, recursive=True)
+        else:
+            matches = [pat]
+
+        for m in sorted(matches):
+            name = os.path.basename(m)
+            if name.startswith("~$") or not os.path.isfile(m):
+                continue
+            if os.path.isdir(pat) or glob.has_magic(pat):
+                if not name.lower().endswith(INPUT_EXTENSIONS):
+                    continue
+            key = os.path.abspath(m)
+            if key not in seen:
+                seen.add(key)
+                files.append(m)
+    return files
+
+
+def _profile_one(path: str, output_dir: str, options: dict, conn) -> None:
+    # child process: sonucu (ya da hatayi) pipe'tan gonderir
+    try:
+        from .core import generate_reports
+
+        t0 = time.perf_counter()
+        res = generate_reports(excel_path=path, output_dir=output_dir, **options)
+        res["seconds"] = round(time.perf_counter() - t0, 3)
+        failed = {f: w["error"] for f, w in res.get("writers", {}).items() if w["error"]}
+        if failed:
+            res["error"] = "; ".join(f"{f}: {err}" for f, err in failed.items())
+            conn.send(("error", res))
+        else:
+            conn.send(("ok", res))
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+
+def _output_dirs(files: list, out_dir: str) -> dict:
+    # ayni isimli dosyalar (farkli klasorler) ayni saniyede cakismasin
+    counts = {}
+    for f in files:
+        b = os.path.splitext(os.path.basename(f))[0]
+        counts[b] = counts.get(b, 0) + 1
+    dirs = {}
+    for i, f in enumerate(files):
+        b = os.path.splitext(os.path.basename(f))[0]
+        dirs[f] = out_dir if counts[b] == 1 else os.path.join(out_dir, f"{b}_{i + 1}")
+    return dirs
+
+
+def run_batch(files: list, out_dir: str, options: dict, workers: int = 1,
+              timeout: float | None = None, log=print) -> list:
+    """
+    Dosyalari process havuzunda isler: en buyuk dosyalar once, dosya basina
+    timeout (asilirsa process sonlandirilir), hata olursa digerleriyle devam.
+    Process'ler daemon degildir (dosya isi kendi havuzunu acabilir, ör. options
+    icinde workers>1); cikista/hatada calisanlar acikca sonlandirilir.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    files = sorted(files, key=lambda f: os.path.getsize(f), reverse=True)
+    dirs = _output_dirs(files, out_dir)
+
+    pending = list(files)
+    active = {}   # path -> (process, conn, start)
+    results = {}
+    total = len(files)
+    done = 0
+
+    try:
+        while pending or active:
+            while pending and len(active) < max(1, workers):
+                path = pending.pop(0)
+                parent, child = mp.Pipe(duplex=False)
+                p = mp.Process(target=_profile_one, args=(path, dirs[path], options, child))
+                p.start()
+                child.close()
+                active[path] = (p, parent, time.perf_counter())
+
+            time.sleep(0.05)
+
+            for path, (p, conn, start) in list(active.items()):
+                elapsed = time.perf_counter() - start
+                entry = None
+
+                # once canlilik, sonra pipe: process poll'dan sonra sonucu yazip cikarsa
+                # basarili dosya "cikis kodu 0" hatasi sayilmasin
+                alive = p.is_alive()
+                if conn.poll():
+                    try:
+                        status, payload = conn.recv()
+                    except EOFError:
+                        status, payload = "error", "worker beklenmedik sekilde kapandi"
+                    entry = {"status": status, "seconds": round(elapsed, 3)}
+                    if isinstance(payload, dict):
+                        # yazici hatasi: diger ciktilar yine de listelenir
+                        entry["result"] = payload
+                        if payload.get("error"):
+                            entry["error"] = payload["error"]
+                    else:
+                        entry["error"] = payload
+                    p.join()
+                elif not alive:
+                    p.join()
+                    entry = {"status": "error", "seconds": round(elapsed, 3),
+                             "error": f"worker cikis kodu {p.exitcode}"}
+                elif timeout and elapsed > timeout:
+                    p.terminate()
+                    p.join()
+                    entry = {"status": "timeout", "seconds": round(elapsed, 3),
+                             "error": f"{timeout}s timeout asildi"}
+
+                if entry is None:
+                    continue
+
+                conn.close()
+                del active[path]
+                done += 1
+                results[path] = entry
+                log(f"[{done}/{total}] {entry['status']:<7} {path} ({entry['seconds']}s)")
+    finally:
+        # Ctrl+C / beklenmedik hata: daemon olmayan process'ler geride kalmasin
+        for p, conn, _ in active.values():
+            if p.is_alive():
+                p.terminate()
+            p.join()
+            conn.close()
+
+    return [dict(path=f, size_bytes=os.path.getsize(f), **results[f]) for f in files]
+
+
+def write_index(out_dir: str, rows: list) -> tuple[str, str]:
+    flat = []
+    for r in rows:
+        res = r.get("result") or {}
+        s = res.get("summary") or {}
+        flat.append({
+            "dosya": r["path"],
+            "durum": r["status"],
+            "sure_sn": res.get("seconds", r["seconds"]),
+            "boyut_byte": r["size_bytes"],
+            "sheet_sayisi": s.get("sheet_sayisi"),
+            "toplam_satir": s.get("toplam_satir"),
+            "warn": s.get("warn"),
+            "error": s.get("error"),
+            "out_xlsx": res.get("out_xlsx"),
+            "out_html": res.get("out_html"),
+            "out_json": res.get("out_json"),
+            "out_parquet": res.get("out_parquet"),
+            "out_arrow": res.get("out_arrow"),
+            "out_ndjson": res.get("out_ndjson"),
+            "yazici_sureleri": json.dumps({f: w["seconds"] for f, w in res.get("writers", {}).items()}),
+            "hata": (r.get("error") or "").strip().splitlines()[0] if r.get("error") else "",
+        })
+
+    json_path = os.path.join(out_dir, "index.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(flat, f, ensure_ascii=False, indent=1)
+
+    csv_path = os.path.join(out_dir, "index.csv")
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(flat[0].keys()) if flat else ["dosya"])
+        w.writeheader()
+        w.writerows(flat)
+
+    return json_path, csv_path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m app", description="Excel Data Profiler (headless)")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    prof = sub.add_parser("profile", help="dosya/klasor/glob'lari profille")
+    prof.add_argument("paths", nargs="+", help="dosya, klasor ya da glob (ör. 'data/**/*.xlsx')")
+    prof.add_argument("--out", required=True, help="cikti klasoru")
+    prof.add_argument("--workers", type=int, default=1, help="ayni anda islenecek dosya sayisi")
+    prof.add_argument("--format", default="xlsx,html", help="virgulle: xlsx,html,json,parquet,arrow,ndjson")
+    prof.add_argument("--timeout", type=float, default=None, help="dosya basina saniye")
+    prof.add_argument("--auto-header", action="store_true", help="header satirini otomatik bul")
+    prof.add_argument("--streaming", action="store_true", help="sheet'leri parca parca oku")
+    prof.add_argument("--no-compact", action="store_true", help="okuma sonrasi dtype sikistirmayi kapat")
+    prof.add_argument("--no-type-inference", action="store_true",
+                      help="metin kolonlarda sayi/tarih/EVET-HAYIR tanimayi kapat (sadece pandas dtype'i)")
+    prof.add_argument("--columns", default=None,
+                      help="virgulle: sadece bu kolonlari profille (parquet digerlerini diskten okumaz)")
+    prof.add_argument("--plan", choices=("auto", "manual"), default="auto",
+                      help="auto: sheet boyutu + bellek butcesine gore okuma/ornekleme; manual: streaming/esik")
+    prof.add_argument("--memory-budget-mb", type=float, default=None, help="varsayilan: bos RAM'in yarisi")
+    prof.add_argument("--sample-threshold", type=int, default=200_000)
+    prof.add_argument("--sample-n-each", type=int, default=5_000)
+    prof.add_argument("--cache-dir", default=None)
+    prof.add_argument("--template-dir", default=TEMPLATE_DIR)
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    files = expand_inputs(args.paths)
+    if not files:
+        print("Islenecek dosya bulunamadi.", file=sys.stderr)
+        return 2
+
+    formats = tuple(f.strip() for f in args.format.split(",") if f.strip())
+    options = {
+        "template_dir": args.template_dir,
+        "sample_threshold": args.sample_threshold,
+        "sample_n_each": args.sample_n_each,
+        "auto_header": args.auto_header,
+        "streaming": args.streaming,
+        "compact_dtypes": not args.no_compact,
+        "columns": [c.strip() for c in args.columns.split(",") if c.strip()] if args.columns else None,
+        "profile_options": {"type_inference": False} if args.no_type_inference else None,
+        "plan": args.plan,
+        "memory_budget_mb": args.memory_budget_mb,
+        "cache_dir": args.cache_dir,
+        "formats": formats,
+    }
+
+    log = lambda m: print(m, file=sys.stderr)  # noqa: E731
+    log(f"{len(files)} dosya, workers={args.workers}, format={','.join(formats)}")
+
+    t0 = time.perf_counter()
+    rows = run_batch(files, args.out, options, workers=args.workers, timeout=args.timeout, log=log)
+    json_path, _ = write_index(args.out, rows)
+
+    ok = sum(1 for r in rows if r["status"] == "ok")
+    log(f"Bitti: {ok}/{len(rows)} basarili, {time.perf_counter() - t0:.1f}s. Ozet: {json_path}")
+    return 0 if ok == len(rows) else 1
@@ -0,0 +1,393 @@
+from __future__ import annotations
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .sketches import HyperLogLog, KLLSketch, SpaceSaving
+from .type_inference import apply_text_rule, infer_text_rule
+
+# Profil ciktisini etkileyen her degisiklikte artirilir (cache anahtarlarinda kullanilir)
+PROFILER_VERSION = 9
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.75, 0.95, 0.99)
+
+
+def guess_dtype(series: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(series):
+        return "bool"
+    if pd.api.types.is_integer_dtype(series):
+        return "int"
+    if pd.api.types.is_float_dtype(series):
+        return "float"
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "date"
+    return "text"
+
+
+class ColumnStats:
+    """
+    Tek kolon icin birlestirilebilir (merge) istatistik toplayici.
+
+    Parca parca update() edilir; iki toplayici merge() ile birlesir ve merge
+    birlesmelidir (associative): ayni veriyi hangi parcalara bolersen bol
+    sonuc ayni olur. Tek parcada sonuc eski profile_columns ile birebir aynidir.
+
+    distinct_mode="hll": unique sayisi tam kume yerine sabit bellekli
+    HyperLogLog ile tahmin edilir (hll_precision register bit sayisi).
+    topk_mode="sketch": en sik degerler sinirli bellekli Space-Saving ozetinden
+    gelir (topk_capacity tutulan deger sayisi); sayilar garanti alt sinirla verilir.
+    quantile_mode="kll": median ve `quantiles` yuzdelikleri KLL sketch'inden
+    gelir (kll_k; rank hatasi ~2.3/k). Tarih kolonlarinda epoch degerleri kullanilir.
+    type_inference=True: metin kolonlardaki sayi/tarih/EVET-HAYIR degerleri taninir
+    ve sayisal/tarih istatistik yoluna girer. Kural (tip + ayirici) ilk dolu metin
+    parcasinda bir kez secilir (text_rule); sonraki parcalar ona gore okunur, uymayan
+    parca "text" sayilir ve kolon metin olur.
+    En sik degerler her parcanin ham degerlerinden sayilir (tipi ne olursa olsun):
+    kolon sonunda karisik cikip "text" olursa sayisal parcalar da listede yer alir.
+    """
+
+    def __init__(self, name, distinct_mode: str = "exact", hll_precision: int = 14,
+                 topk_mode: str = "exact", topk_capacity: int = 64,
+                 quantile_mode: str = "exact", kll_k: int = 200, quantiles=DEFAULT_QUANTILES,
+                 type_inference: bool = True):
+        if distinct_mode not in ("exact", "hll"):
+            raise ValueError(f"Bilinmeyen distinct_mode: {distinct_mode}")
+        if topk_mode not in ("exact", "sketch"):
+            raise ValueError(f"Bilinmeyen topk_mode: {topk_mode}")
+        if quantile_mode not in ("exact", "kll"):
+            raise ValueError(f"Bilinmeyen quantile_mode: {quantile_mode}")
+        self.name = name
+        self.distinct_mode = distinct_mode
+        self.hll_precision = hll_precision
+        self.topk_mode = topk_mode
+        self.quantile_mode = quantile_mode
+        self.quantiles = tuple(quantiles)
+        self.type_inference = type_inference
+        self.count = 0
+        self.missing = 0
+        self.type_counts = Counter()   # tip etiketi -> dolu deger sayisi
+        self.first_label = None
+        self.text_rule = None          # metin kolonda ilk parcada secilen tip kurali
+        self.rule_conflict = False     # merge edilen parcalar farkli kural secmis
+
+        # sayisal: Welford/Chan ortalama-varyans + min/max
+        self.num_n = 0
+        self.num_mean = 0.0
+        self.num_m2 = 0.0
+        self.num_min = None
+        self.num_max = None
+        # median/yuzdelikler: exact modda degerler tutulur, kll modda sabit bellek
+        if quantile_mode == "kll":
+            self._num_values = KLLSketch(kll_k)
+            self._date_values = KLLSketch(kll_k)
+        else:
+            self._num_values = []
+            self._date_values = []
+
+        # tarih
+        self.date_min = None
+        self.date_max = None
+
+        # deger sayimlari: exact modda ham deger -> sayi (en sik degerler sonucta metne gore
+        # gruplanir); distinct de exact ise ayni sozluk kullanilir, ayrica kume tutulmaz
+        self.top_counts = SpaceSaving(max(3, topk_capacity)) if topk_mode == "sketch" else Counter()
+        if distinct_mode == "hll":
+            self.distinct = HyperLogLog(hll_precision)
+        else:
+            self.distinct = self.top_counts if topk_mode == "exact" else set()
+        self.examples = []
+
+    # -----------------------------
+    # update
+    # -----------------------------
+    def update(self, s: pd.Series) -> "ColumnStats":
+        label = guess_dtype(s)
+        n = len(s)
+        non_na = s.dropna()
+        filled = len(non_na)
+
+        converted = None
+        if label == "text" and filled and self.type_inference:
+            if self.text_rule is None:
+                self.text_rule, label, converted = infer_text_rule(non_na)
+            else:
+                label, converted = apply_text_rule(non_na, self.text_rule)
+        if self.first_label is None:
+            self.first_label = label
+
+        self.count += n
+        self.missing += n - filled
+        if filled == 0:
+            return self
+
+        self.type_counts[label] += filled
+        self._count_values(non_na)
+
+        if len(self.examples) < 3:
+            self.examples.extend(non_na.head(3 - len(self.examples)).tolist())
+
+        if converted is not None:
+            non_na = converted  # metinden donusen sayi/tarih degerleri
+
+        if label in ("int", "float"):
+            nums = pd.to_numeric(non_na, errors="coerce").dropna()
+            if len(nums):
+                vals = nums.to_numpy(dtype="float64")
+                mean = float(nums.mean())
+                self._merge_moments(len(vals), mean, float(((vals - mean) ** 2).sum()))
+                lo, hi = float(nums.min()), float(nums.max())
+                self.num_min = lo if self.num_min is None else min(self.num_min, lo)
+                self.num_max = hi if self.num_max is None else max(self.num_max, hi)
+                self._add_values(self._num_values, vals)
+        elif label == "date":
+            dates = pd.to_datetime(non_na, errors="coerce").dropna()
+            if len(dates):
+                lo, hi = dates.min(), dates.max()
+                self.date_min = lo if self.date_min is None else min(self.date_min, lo)
+                self.date_max = hi if self.date_max is None else max(self.date_max, hi)
+                epoch = dates.to_numpy(dtype="datetime64[ns]").view("int64").astype("float64")
+                self._add_values(self._date_values, epoch)
+
+        return self
+
+    def _count_values(self, non_na: pd.Series) -> None:
+        # ham degerler (donusumden once)
+        if self.topk_mode == "sketch":
+            self.top_counts.update(non_na)
+        else:
+            vc = non_na.value_counts(sort=False)
+            vc = vc[vc > 0]  # category: kullanilmayan kategoriler
+            self.top_counts.update(dict(zip(vc.index.tolist(), vc.values.tolist())))
+        if self.distinct is self.top_counts:
+            return
+        if self.distinct_mode == "hll":
+            self.distinct.add(non_na)
+        else:
+            self.distinct.update(non_na.unique().tolist())
+
+    def _add_values(self, target, vals: np.ndarray) -> None:
+        if self.quantile_mode == "kll":
+            target.update_values(vals)
+        else:
+            target.append(vals)
+
+    def _quantiles(self, target, qs) -> list:
+        if self.quantile_mode == "kll":
+            return target.quantiles(qs)
+        if not target:
+            return [None for _ in qs]
+        vals = np.concatenate(target)
+        return [float(v) for v in np.quantile(vals, qs)]
+
+    def _merge_moments(self, n: int, mean: float, m2: float) -> None:
+        # Chan et al. paralel varyans birlestirme
+        if n == 0:
+            return
+        if self.num_n == 0:
+            self.num_n, self.num_mean, self.num_m2 = n, mean, m2
+            return
+        total = self.num_n + n
+        delta = mean - self.num_mean
+        self.num_mean = self.num_mean + delta * n / total
+        self.num_m2 = self.num_m2 + m2 + delta * delta * self.num_n * n / total
+        self.num_n = total
+
+    # -----------------------------
+    # merge
+    # -----------------------------
+    def merge(self, other: "ColumnStats") -> "ColumnStats":
+        if self.first_label is None:
+            self.first_label = other.first_label
+        if self.text_rule is None:
+            self.text_rule = other.text_rule
+        elif other.text_rule is not None and other.text_rule != self.text_rule:
+            self.rule_conflict = True
+        self.rule_conflict = self.rule_conflict or other.rule_conflict
+        self.count += other.count
+        self.missing += other.missing
+        self.type_counts.update(other.type_counts)
+
+        self._merge_moments(other.num_n, other.num_mean, other.num_m2)
+        if other.num_min is not None:
+            self.num_min = other.num_min if self.num_min is None else min(self.num_min, other.num_min)
+            self.num_max = other.num_max if self.num_max is None else max(self.num_max, other.num_max)
+        if self.quantile_mode == "kll":
+            self._num_values.merge(other._num_values)
+            self._date_values.merge(other._date_values)
+        else:
+            self._num_values.extend(other._num_values)
+            self._date_values.extend(other._date_values)
+
+        if other.date_min is not None:
+            self.date_min = other.date_min if self.date_min is None else min(self.date_min, other.date_min)
+            self.date_max = other.date_max if self.date_max is None else max(self.date_max, other.date_max)
+
+        if self.topk_mode == "sketch":
+            self.top_counts.merge(other.top_counts)
+        else:
+            self.top_counts.update(other.top_counts)
+        if self.distinct_mode == "hll":
+            self.distinct.merge(other.distinct)
+        elif self.distinct is not self.top_counts:
+            self.distinct.update(other.distinct)
+        if len(self.examples) < 3:
+            self.examples.extend(other.examples[:3 - len(self.examples)])
+
+        return self
+
+    # -----------------------------
+    # sonuc
+    # -----------------------------
+    @property
+    def dtype_label(self) -> str:
+        labels = [k for k, v in self.type_counts.items() if v > 0]
+        if self.rule_conflict:
+            return "text"  # ayni kolonun parcalari farkli ayiriciyla okunmus
+        if not labels:
+            return self.first_label or "float"
+        if len(labels) == 1:
+            return labels[0]
+        if set(labels) <= {"int", "float"}:
+            return "float"
+        return "text"
+
+    @property
+    def filled(self) -> int:
+        return self.count - self.missing
+
+    @property
+    def variance(self) -> float | None:
+        # orneklem varyansi (ddof=1), pandas .var() ile ayni tanim
+        if self.num_n < 2:
+            return None
+        return self.num_m2 / (self.num_n - 1)
+
+    @property
+    def unique_count(self) -> int:
+        if self.distinct_mode == "hll":
+            # tahmin dolu deger sayisini asamaz
+            return min(int(round(self.distinct.estimate())), self.filled)
+        return len(self.distinct)
+
+    @property
+    def unique_error(self) -> float:
+        # unique_sayi icin goreli standart hata (%), exact modda 0
+        if self.distinct_mode == "hll":
+            return round(self.distinct.relative_error * 100, 2)
+        return 0.0
+
+    def top_values(self, n: int = 3) -> list[tuple]:
+        """(deger, sayi, garanti_alt_sinir); exact modda alt sinir = sayi."""
+        if self.topk_mode == "sketch":
+            return self.top_counts.top(n)
+        # ham degerler metne gore gruplanir (1 ve "1" ayni deger, tek parcadaki gibi)
+        by_text = Counter()
+        for k, c in self.top_counts.items():
+            by_text[str(k)] += c
+        return [(k, c, c) for k, c in by_text.most_common(n)]
+
+    def result(self) -> dict:
+        n = self.count
+        filled = self.filled
+        miss_ratio = (self.missing / n) if n > 0 else 0.0
+        unique = self.unique_count
+        uniq_ratio = (unique / filled) if filled > 0 else 0.0
+
+        dtype_label = self.dtype_label
+
+        min_v = max_v = mean_v = median_v = None
+        pcts = [None for _ in self.quantiles]
+        top = []
+
+        if dtype_label in ("int", "float"):
+            if self.num_n:
+                min_v = self.num_min
+                max_v = self.num_max
+                mean_v = float(self.num_mean)
+                if self.quantile_mode == "kll":
+                    median_v, *pcts = self._quantiles(self._num_values, (0.5,) + self.quantiles)
+                else:
+                    vals = np.concatenate(self._num_values)
+                    median_v = float(np.median(vals))
+                    pcts = [float(v) for v in np.quantile(vals, self.quantiles)]
+        elif dtype_label == "date":
+            if self.date_min is not None:
+                min_v = str(self.date_min.date())
+                max_v = str(self.date_max.date())
+                qv = self._quantiles(self._date_values, self.quantiles)
+                pcts = [None if v is None else str(pd.Timestamp(int(round(v))).date()) for v in qv]
+        else:
+            top = self.top_values(3)
+
+        row = {
+            "kolon_adi": str(self.name),
+            "tahmini_tip": dtype_label,
+            "dolu_sayi": int(filled),
+            "bos_sayi": int(self.missing),
+            "bos_oran": round(miss_ratio * 100, 2),
+            "unique_sayi": int(unique),
+            "unique_oran": round(uniq_ratio * 100, 2),
+            "unique_hata_payi": self.unique_error,
+            "min": min_v,
+            "max": max_v,
+            "ortalama": mean_v,
+            "median": median_v,
+        }
+        for q, v in zip(self.quantiles, pcts):
+            row[f"p{q * 100:g}"] = v
+        for i in range(3):
+            value, cnt, lower = top[i] if i < len(top) else (None, None, None)
+            row[f"en_sik_{i + 1}"] = value
+            row[f"en_sik_{i + 1}_sayi"] = cnt
+            row[f"en_sik_{i + 1}_alt_sinir"] = lower
+        row["ornek_degerler"] = ", ".join([str(x) for x in self.examples])
+        return row
+
+
+class SheetStats:
+    """Bir sheet'in tum kolonlari icin ColumnStats kumesi; parca parca beslenir."""
+
+    def __init__(self, **options):
+        self.options = options  # ColumnStats'e aktarilir (distinct_mode, hll_precision, ...)
+        self.rows = 0
+        self.columns = {}   # kolon -> ColumnStats (sira korunur)
+
+    def _new_column(self, col) -> ColumnStats:
+        cs = ColumnStats(col, **self.options)
+        # sonradan gelen kolon: onceki satirlarda yoktu, bos sayilir
+        cs.count = cs.missing = self.rows
+        return cs
+
+    def _column(self, col) -> ColumnStats:
+        cs = self.columns.get(col)
+        if cs is None:
+            cs = self._new_column(col)
+            self.columns[col] = cs
+        return cs
+
+    def update(self, df: pd.DataFrame) -> "SheetStats":
+        for col in df.columns:
+            self._column(col).update(df[col])
+        for col, cs in self.columns.items():
+            if col not in df.columns:
+                cs.count += len(df)
+                cs.missing += len(df)
+        self.rows += len(df)
+        return self
+
+    def merge(self, other: "SheetStats") -> "SheetStats":
+        for col, ocs in other.columns.items():
+            if col not in self.columns:
+                self.columns[col] = self._new_column(col)
+            self.columns[col].merge(ocs)
+        for col, cs in self.columns.items():
+            if col not in other.columns:
+                cs.count += other.rows
+                cs.missing += other.rows
+        self.rows += other.rows
+        return self
+
+    def to_frame(self, sheet_name: str) -> pd.DataFrame:
+        rows = [{"sheet_adi": sheet_name, **cs.result()} for cs in self.columns.values()]
+        return pd.DataFrame(rows)
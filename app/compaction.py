@@ -0,0 +1,82 @@
+"""
+Okuma sonrasi bellek sikistirma (dtype compaction).
+
+pd.read_excel metin kolonlarini object, sayilari int64/float64 olarak getirir.
+Burada profil ciktisini degistirmeyen donusumler yapilir:
+- dusuk kardinaliteli metin kolonlari -> category
+- int64 -> en kucuk kayipsiz isaretli tam sayi tipi
+- diger metin kolonlari -> pyarrow destekli string dtype (pyarrow varsa)
+
+Bilincli olarak dokunulmayanlar: float kolonlar (float32'de hem degerler hem
+pandas'in ortalama toplami float32'ye duser, profil degisir), bool/tarih
+kolonlari ve karisik tipli object kolonlar (guess_dtype "text" kalmali).
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# unique / dolu deger orani bunun altindaysa category
+CATEGORY_MAX_RATIO = 0.5
+
+_STRING_DTYPE = False  # henuz bakilmadi
+
+
+def _compact_string_dtype():
+    """pyarrow destekli string dtype; pyarrow yoksa None (object'ten kucuk olmaz)."""
+    global _STRING_DTYPE
+    if _STRING_DTYPE is False:
+        import importlib.util
+        if importlib.util.find_spec("pyarrow") is None:
+            _STRING_DTYPE = None
+        else:
+            try:
+                # pandas >= 2.3: eksik deger NaN kalir (object kolondaki gibi)
+                _STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+            except TypeError:
+                _STRING_DTYPE = pd.StringDtype("pyarrow")
+    return _STRING_DTYPE
+
+
+def compact_series(s: pd.Series, category_max_ratio: float = CATEGORY_MAX_RATIO) -> pd.Series:
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+        return s
+    if pd.api.types.is_integer_dtype(dtype):
+        if isinstance(dtype, np.dtype) and dtype.itemsize > 1:
+            return pd.to_numeric(s, downcast="integer")  # deger araligina gore, kayipsiz
+        return s
+    if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+        return s
+    # sadece tamami metin olan kolonlar; karisik kolonlar object kalir
+    if pd.api.types.infer_dtype(s, skipna=True) != "string":
+        return s
+
+    filled = int(s.count())
+    if filled and s.nunique(dropna=True) <= category_max_ratio * filled:
+        return s.astype("category")
+    string_dtype = _compact_string_dtype()
+    if string_dtype is not None and dtype != string_dtype:
+        return s.astype(string_dtype)
+    return s
+
+
+def compact_frame(df: pd.DataFrame, category_max_ratio: float = CATEGORY_MAX_RATIO) -> tuple[pd.DataFrame, int, int]:
+    """
+    Kolon kolon sikistirir; yer kazandirmayan donusum geri alinir.
+    Donus: (yeni DataFrame, onceki byte, sonraki byte) — memory_usage(deep=True).
+    """
+    out = df.copy(deep=False)
+    before = after = 0
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        size = int(s.memory_usage(index=False, deep=True))
+        compacted = compact_series(s, category_max_ratio)
+        new_size = int(compacted.memory_usage(index=False, deep=True)) if compacted is not s else size
+        if new_size < size:
+            out.isetitem(i, compacted)  # ayni isimli kolonlarda da pozisyonla
+        else:
+            new_size = size
+        before += size
+        after += new_size
+    return out, before, after
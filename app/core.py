@@ -1,14 +1,35 @@
 from __future__ import annotations
 
 import os
+import time
+from functools import partial
+from types import MappingProxyType
+
 import pandas as pd
 
-from .excel_reader import read_excel_all_sheets
-from .sampler import sample_df
+from .excel_reader import (
+    DEFAULT_CHUNK_SIZE,
+    list_sheet_names,
+    read_excel_all_sheets,
+    read_excel_sheet,
+    stream_excel_all_sheets,
+    sheet_dimensions,
+    sheet_fingerprints,
+    stream_excel_sheet,
+)
+from .cache import DEFAULT_MAX_BYTES, ProfileCache, file_digest, make_key
+from .compaction import compact_frame
+from .column_stats import PROFILER_VERSION, SheetStats
+from .sampler import StreamSampler, sample_df
 from .profiler import profile_columns
-from .quality_checks import quality_warnings, duplicate_analysis
-from .report_xlsx import write_report_xlsx
-from .report_html import write_report_html
+from .quality_checks import quality_warnings, duplicate_report
+from .duplicates import DuplicateIndex
+from .writers import ReportData, run_writers
+from .perf import PerfRecorder, Stopwatch
+from .progress import CancelToken, ProgressTracker
+from .planner import describe_plans, memory_budget_bytes, plan_workbook
+
+REPORT_FORMATS = ("xlsx", "html", "json", "parquet", "arrow", "ndjson")
 
 
 def generate_reports(
@@ -19,17 +40,82 @@ def generate_reports(
     sample_threshold: int = 200_000,
     sample_n_each: int = 5_000,
     auto_header: bool = False,
+    profile_options: dict | None = None,
+    streaming: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dedup_confirm: bool = False,
+    workers: int = 1,
+    compact_dtypes: bool = True,
+    columns: list | None = None,
+    plan: str = "auto",
+    memory_budget_mb: float | None = None,
+    cache_dir: str | None = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    formats=("xlsx", "html"),
     log_cb=None,  # UI'ye log basmak iç in callback
+    perf_cb=None,
+    progress_cb=None,
+    cancel_token: CancelToken | None = None,
 ) -> dict:
     """
     Excel'den rapor üretir: report.xlsx + report.html
     Büyük tablolarda örnekleme yapar.
+
+    profile_options: profiler ayarlari, ör. {"distinct_mode": "hll", "hll_precision": 14}
+    (yaklasik unique sayimi, sabit bellek).
+    streaming=True: sheet'ler chunk_size'lik parcalarla okunur ve ornekleme okuma
+    sirasinda yapilir; orneklenmeyen satirlar bellekte tutulmaz.
+    dedup_confirm=True: duplicate hash eslesmeleri satir degerleriyle dogrulanir; sadece
+    tekrar eden hash'lerin satirlari tutulur (streaming'de sheet ikinci kez okunur).
+    workers>1: her sheet (okuma dahil) ayri process'te islenir; sonuclar ve
+    loglar sheet sirasiyla birlestirilir.
+    compact_dtypes=True: okunan sheet profilden once kayipsiz kucuk dtype'lara
+    cevrilir (category / kucuk int / pyarrow string); streaming parcalarinda yapilmaz.
+    columns: verilirse her sheet'te sadece bu kolonlar profillenir (hepsi her sheet'te
+    bulunmali, yoksa KeyError); parquet diger kolonlari diskten hic okumaz.
+    plan="auto": her sheet icin yuklemeden once boyut (xlsx <dimension> ya da sheet
+    XML boyutu) ile bellek tahmini yapilir ve memory_budget_mb (verilmezse bos RAM'in
+    yarisi) icinde bellek_tam / streaming_tam / streaming_ornekleme secilir; boyut
+    bilinmiyorsa streaming / sample_threshold kullanilir. plan="manual": eski
+    davranis, sadece streaming / sample_threshold. Secilen plan ve nedeni sheet
+    listesinde ve HTML ornekleme notunda gorunur.
+    cache_dir: verilirse sheet sonuclari dosya icerigi + ayarlar anahtariyla diskte
+    saklanir; ayni dosya tekrar gelirse okuma/profil atlanip direkt rapor yazilir.
+    Dosya degismisse xlsx sheet part parmak izleri ayni olan sheet'ler yine
+    cache'ten gelir, sadece degisen sheet'ler okunur. Izler ortak sharedStrings /
+    styles part'larini da icerir: herhangi bir metin degisikligi tum sheet'leri
+    yeniden okutur (bkz. sheet_fingerprints).
+    Kayitlar pickle'dir ve cache_dir disindaki bir anahtarla (~/.excel_reporter/cache.key)
+    HMAC imzalanir; imzasi tutmayan kayit okunmaz. cache_dir'e yazabilen biri bu
+    yuzden kod calistiramaz ama anahtar dosyasini okuyabilen biri calistirabilir.
+    perf_cb: her asama (sheet bazinda okuma, header tespiti, ornekleme, profil,
+    duplicate, yazma...) bitince sure/CPU/RSS/satir-per-sn olayi (dict) alir.
+    Olaylar 05_Performans sheet'ine, HTML zamanlama paneline ve sonuc
+    sozlugundeki "perf" listesine de yazilir.
+    progress_cb: {"asama", "sheet_adi", "satir", "toplam_satir", "oran"} alir; toplam
+    satir xlsx <dimension> kayitlarindan tahmin edilir (yoksa oran None).
+    cancel_token: CancelToken; iptal edilirse okuma parcalari ve asamalar arasinda
+    Cancelled firlatilir (paralel modda worker process'ler de ayni bayragi kontrol eder).
     """
 
     def log(msg: str):
         if callable(log_cb):
             log_cb(msg)
 
+    perf = PerfRecorder(perf_cb)
+    progress = ProgressTracker(progress_cb, cancel_token)
+    progress.stage("hazirlik")
+    total_sw = Stopwatch(cpu_clock=time.process_time).start()
+
+    formats = tuple(formats)
+    unknown = [f for f in formats if f not in REPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen rapor formati: {', '.join(unknown)}")
+    if {"parquet", "arrow"} & set(formats):
+        import importlib.util
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("Parquet/Arrow ciktisi icin pyarrow gerekli (pip install pyarrow).")
+
     # Çıktı klasörü hazırla
     os.makedirs(output_dir, exist_ok=True)
 
@@ -37,53 +123,128 @@ def generate_reports(
     base_name = os.path.splitext(os.path.basename(excel_path))[0]
     stamp = pd.Timestamp.now().strftime("%Y-%m-%d_%H-%M-%S")
 
-    out_xlsx = os.path.join(output_dir, f"{base_name}_report_{stamp}.xlsx")
-    out_html = os.path.join(output_dir, f"{base_name}_report_{stamp}.html")
-
-    # Excel oku
-    log(f"auto_header={auto_header}")
-    log("Excel okunuyor...")
-    sheets_data = read_excel_all_sheets(excel_path, auto_header=auto_header)
-    log(f"{len(sheets_data)} sheet bulundu.")
-
-    sheet_rows = []
-    all_profiles = []   
-    all_warnings = []
-    all_dups = []
-    sampling_any = False
-
-    for sheet_name, info in sheets_data.items():
-        df = info["df"]
-        header_row = info.get("header_row", 1)
-
-        log(f"Sheet isleniyor: {sheet_name} (satir={len(df)}, sutun={df.shape[1]}, header_satiri={header_row})")
-
-        # Big data örnekleme
-        df_for_profile, sampled = sample_df(df, threshold=sample_threshold, n_each=sample_n_each)
-        sampling_any = sampling_any or sampled
-
-        sheet_rows.append({
-            "sheet_adi": sheet_name,
-            "satir_sayisi": int(len(df)),
-            "sutun_sayisi": int(df.shape[1]),
-            "header_satiri": int(header_row),
-            "header_confidence": float(info.get("header_confidence", 0.0)),
-        })
+    out_xlsx = os.path.join(output_dir, f"{base_name}_report_{stamp}.xlsx") if "xlsx" in formats else None
+    out_html = os.path.join(output_dir, f"{base_name}_report_{stamp}.html") if "html" in formats else None
+    out_json = os.path.join(output_dir, f"{base_name}_report_{stamp}.json") if "json" in formats else None
+    # parquet/arrow: tablo basina bir dosya, klasor icinde
+    out_parquet = os.path.join(output_dir, f"{base_name}_report_{stamp}_parquet") if "parquet" in formats else None
+    out_arrow = os.path.join(output_dir, f"{base_name}_report_{stamp}_arrow") if "arrow" in formats else None
+    out_ndjson = os.path.join(output_dir, f"{base_name}_report_{stamp}.ndjson") if "ndjson" in formats else None
+
+    # sheet bazli isin ayarlari (worker process'lere de bu sozluk gider)
+    settings = {
+        "auto_header": auto_header,
+        "streaming": streaming,
+        "chunk_size": chunk_size,
+        "sample_threshold": sample_threshold,
+        "sample_n_each": sample_n_each,
+        "profile_options": profile_options,
+        "dedup_confirm": dedup_confirm,
+        "compact_dtypes": compact_dtypes,
+        "columns": list(columns) if columns else None,
+        "plan": plan,
+        "memory_budget_mb": memory_budget_mb,
+    }
 
-        # Kolon profili
-        prof = profile_columns(sheet_name, df_for_profile)
-        all_profiles.append(prof)
+    # plan cache'ten once secilir: ayni ayarlar farkli butcede (bos RAM, workers) farkli plan
+    # (ör. ornekleme) secebilir; cache anahtarinda ham ayarlar degil secilen plan olmali
+    dimensions = sheet_dimensions(excel_path)
+    budget = memory_budget_bytes(memory_budget_mb, workers if workers and workers > 1 else 1)
+    all_plans = plan_workbook(dimensions, list_sheet_names(excel_path),
+                              budget, chunk_size, sample_n_each, streaming, sample_threshold, mode=plan)
+
+    cache = None
+    cache_key = None
+    if cache_dir:
+        cache = ProfileCache(cache_dir, max_bytes=cache_max_bytes)
+        cache_key = make_key("workbook", file_digest(excel_path), PROFILER_VERSION, _key_settings(settings),
+                             {sn: _plan_key(p) for sn, p in all_plans.items()})
+
+    sheet_results = None
+    fingerprints = {}
+    reused = {}
+    if cache is not None:
+        with perf.stage("cache_okuma"):
+            sheet_results = cache.get(cache_key)
+            # sheet bazli cache: degismeyen sheet'ler (zip part CRC'si ayni) tekrar islenmez
+            if sheet_results is None:
+                fingerprints = sheet_fingerprints(excel_path)
+                for sn, fp in fingerprints.items():
+                    r = cache.get(_sheet_cache_key(sn, fp, settings, all_plans.get(sn)))
+                    if r is not None:
+                        reused[sn] = r
+    cache_hit = sheet_results is not None
+    todo = [sn for sn in fingerprints if sn not in reused] if reused else None
+
+    plans = {}
+    if not cache_hit:
+        progress.set_estimates(dimensions, todo)
+        plans = all_plans if todo is None else {sn: all_plans[sn] for sn in todo}
+    # cache'ten gelen sheet'ler islenmis sayilir
+    for r in (sheet_results if cache_hit else reused.values()):
+        progress.finish_sheet(r["sheet_row"]["sheet_adi"], r["sheet_row"]["satir_sayisi"])
 
-        # Kalite uyarıları
-        warns = quality_warnings(sheet_name, df_for_profile, prof)
-        all_warnings.append(warns)
+    # Excel oku
+    log(f"auto_header={auto_header}, streaming={streaming}, workers={workers}")
+    if cache_hit:
+        log(f"Cache'ten alindi ({len(sheet_results)} sheet), okuma atlandi.")
+    else:
+        if reused:
+            log(f"Degismeyen {len(reused)} sheet cache'ten alindi: {', '.join(reused)}")
+
+        computed = []
+        if plans:
+            for sn, p in plans.items():
+                log(f"Plan: {sn} -> {p['plan']} ({p['plan_nedeni']})")
+            sheet_settings = {sn: _plan_settings(settings, p) for sn, p in plans.items()}
+            log("Excel okunuyor...")
+            if workers and workers > 1:
+                log(f"{len(plans)} sheet bulundu.")
+                computed = _run_parallel(excel_path, sheet_settings, workers, log, perf, progress)
+            else:
+                in_memory = [sn for sn, st in sheet_settings.items() if not st["streaming"]]
+                streamed = [sn for sn, st in sheet_settings.items() if st["streaming"]]
+                for sheets_iter in _planned_sheets(excel_path, auto_header, chunk_size, settings["columns"],
+                                                   in_memory, streamed, progress, log):
+                    for sheet_name, info in sheets_iter:
+                        computed.append(_process_sheet(sheet_name, info, sheet_settings[sheet_name], log, perf,
+                                                       progress))
+                        progress.finish_sheet(sheet_name)
+                        info = None  # parcalar/DataFrame bir sonraki sheet'ten once birakilsin
+                    del sheets_iter
+                # bellek ve streaming gruplari ayri okunur; sonuclar workbook sirasina
+                order = {sn: i for i, sn in enumerate(plans)}
+                computed.sort(key=lambda r: order[r["sheet_row"]["sheet_adi"]])
+
+        if reused:
+            by_name = {r["sheet_row"]["sheet_adi"]: r for r in computed}
+            sheet_results = [reused[sn] if sn in reused else by_name[sn] for sn in fingerprints]
+        else:
+            sheet_results = computed
+
+        if cache is not None:
+            for r in computed:
+                sn = r["sheet_row"]["sheet_adi"]
+                if sn in fingerprints:
+                    cache.put(_sheet_cache_key(sn, fingerprints[sn], settings, all_plans.get(sn)), r)
+            cache.put(cache_key, sheet_results)
+
+    # raporda hangi sheet'lerin cache'ten geldigi gorunsun
+    reused_names = [r["sheet_row"]["sheet_adi"] for r in sheet_results] if cache_hit else list(reused)
+    sheet_results = [
+        {**r, "sheet_row": {**r["sheet_row"],
+                            "yeniden_kullanildi": "EVET" if r["sheet_row"]["sheet_adi"] in reused_names else "HAYIR"}}
+        for r in sheet_results
+    ]
 
-        # Duplicate analizi
-        dups = duplicate_analysis(sheet_name, df_for_profile)
-        all_dups.append(dups)
+    sheet_rows = [r["sheet_row"] for r in sheet_results]
+    sampling_any = any(r["sampled"] for r in sheet_results)
 
     # Birleştir
     sheet_list_df = pd.DataFrame(sheet_rows)
+    all_profiles = [r["profile"] for r in sheet_results]
+    all_warnings = [r["warnings"] for r in sheet_results]
+    all_dups = [r["dups"] for r in sheet_results]
     col_profile_df = pd.concat(all_profiles, ignore_index=True) if all_profiles else pd.DataFrame()
     warnings_df = pd.concat(all_warnings, ignore_index=True) if all_warnings else pd.DataFrame()
     dup_df = pd.concat(all_dups, ignore_index=True) if all_dups else pd.DataFrame()
@@ -91,11 +252,9 @@ def generate_reports(
     # Benzersiz kolon sayisi (bos ve 'Unnamed' kolonlari hariç)
     unique_cols = set()
 
-    for info in sheets_data.values():
-        df0 = info["df"]
-
+    for res in sheet_results:
         cols = []
-        for c in df0.columns:
+        for c in res["columns"]:
             if c is None:
                 continue
 
@@ -134,12 +293,103 @@ def generate_reports(
         "ornekleme": "EVET" if sampling_any else "HAYIR",
     }])
 
-    # Excel raporunu yaz
-    log("report.xlsx yaziliyor...")
-    write_report_xlsx(out_xlsx, genel_ozet, sheet_list_df, col_profile_df, warnings_df, dup_df)
+    summary = {
+        "sheet_sayisi": int(len(sheet_list_df)),
+        "toplam_satir": total_rows,
+        "toplam_kolon": total_cols,
+        "warn": warn_count,
+        "error": err_count,
+        "ornekleme": sampling_any,
+    }
+
+    sampling_note = _sampling_note(sheet_results, all_plans, sample_threshold, sample_n_each)
+
+    if reused_names:
+        reused_note = f"Degismeyen sheetler cache'ten kullanildi: {', '.join(reused_names)}"
+    else:
+        reused_note = ""
+
+    html_context = {}
+    if out_html:
+        html_context = _html_context(
+            excel_path, stamp, sheet_results, sheet_list_df, col_profile_df, warnings_df,
+            summary, total_unique_cols, sampling_note, reused_note, perf.summary(),
+        )
+
+    # Yazicilar: istenen formatlar paralel, ayni degismez girdiden
+    data = ReportData(
+        genel_ozet=genel_ozet,
+        sheet_list=sheet_list_df,
+        col_profile=col_profile_df,
+        warnings=warnings_df,
+        duplicates=dup_df,
+        template_dir=template_dir,
+        template_name=template_name,
+        html_context=MappingProxyType(html_context),
+        perf=perf.to_frame(),
+    )
+    outputs = {
+        "xlsx": out_xlsx,
+        "html": out_html,
+        "json": out_json,
+        "parquet": out_parquet,
+        "arrow": out_arrow,
+        "ndjson": out_ndjson,
+    }
+    log(f"Raporlar yaziliyor: {', '.join(f for f, p in outputs.items() if p)}")
+    progress.stage("yazma")
+    writer_results = run_writers(data, outputs, log=log, perf=perf, progress=progress)
+    # yazilamayan ciktinin yolu dondurulmez
+    outputs = {f: (p if p and not writer_results[f]["error"] else None) for f, p in outputs.items()}
+
+    total_sw.stop()
+    perf.add("toplam", "", total_sw, rows=total_rows)
+    progress.stage("bitti")
+    log(f"Bitti ✅ ({total_sw.wall:.1f}s)")
+
+    return {
+        "out_xlsx": outputs["xlsx"],
+        "out_html": outputs["html"],
+        "out_json": outputs["json"],
+        "out_parquet": outputs["parquet"],
+        "out_arrow": outputs["arrow"],
+        "out_ndjson": outputs["ndjson"],
+        "writers": writer_results,
+        "perf": list(perf.events),
+        "summary": summary,
+    }
+
+
+def _sampling_note(sheet_results: list, plans: dict, sample_threshold: int, sample_n_each: int) -> str:
+    # esik her sheet'in planindan (streaming_ornekleme butceden kendi esigini hesaplar)
+    sheet_rows = [r["sheet_row"] for r in sheet_results]
+    sampled = [r["sheet_row"] for r in sheet_results if r["sampled"]]
+    if sampled:
+        parts = []
+        for r in sampled:
+            threshold = (plans.get(r["sheet_adi"]) or {}).get("sample_threshold") or sample_threshold
+            parts.append(f"{r['sheet_adi']}: {r['satir_sayisi']:,} satir > esik {threshold:,}")
+        note = (f"Buyuk sheetler orneklenerek analiz edildi ({'; '.join(parts)}; "
+                f"bas/orta/son icin {sample_n_each:,} satir).")
+    else:
+        note = "Tum satirlar analiz edildi, ornekleme kullanilmadi."
+    plan_note = describe_plans({r["sheet_adi"]: r for r in sheet_rows if r.get("plan")})
+    return f"{note} {plan_note}" if plan_note else note
+
 
-    # HTML raporu yaz
-    log("report.html yaziliyor...")
+# -----------------------------
+# HTML context
+# -----------------------------
+
+def _html_context(excel_path: str, stamp: str, sheet_results: list, sheet_list_df: pd.DataFrame,
+                  col_profile_df: pd.DataFrame, warnings_df: pd.DataFrame, summary: dict,
+                  total_unique_cols: int, sampling_note: str, reused_note: str, perf_rows: list) -> dict:
+    """HTML raporu icin context (sadece html istendiginde kurulur)."""
+    sheet_rows = [r["sheet_row"] for r in sheet_results]
+    total_rows = summary["toplam_satir"]
+    total_cols = summary["toplam_kolon"]
+    warn_count = summary["warn"]
+    err_count = summary["error"]
 
     cards = [
         {"label": "Sheet sayisi", "value": len(sheet_list_df)},
@@ -210,17 +460,14 @@ def generate_reports(
         "type_dist": {"labels": type_labels, "values": type_values},
     }
 
-    # pick biggest sheet df for preview/KPIs
-    biggest_name = None
+    # pick biggest sheet for preview/KPIs
+    main_res = None
     biggest_rows = -1
-    for sn, info in sheets_data.items():
-        dfi = info["df"]
-        if len(dfi) > biggest_rows:
-            biggest_rows = len(dfi)
-            biggest_name = sn
-
-    main_df = sheets_data[biggest_name]["df"] if biggest_name else None
-    
+    for res in sheet_results:
+        if res["sheet_row"]["satir_sayisi"] > biggest_rows:
+            biggest_rows = res["sheet_row"]["satir_sayisi"]
+            main_res = res
+
     # KPIs + preview
     rows_count = 0
     cols_count = 0
@@ -230,31 +477,17 @@ def generate_reports(
     preview_cols = []
     preview_rows = []
 
-    if main_df is not None:
-        rows_count = int(main_df.shape[0])
-        cols_count = int(main_df.shape[1])
+    if main_res is not None:
+        kpi = main_res["kpi"]
+        rows_count = int(main_res["sheet_row"]["satir_sayisi"])
+        cols_count = int(main_res["sheet_row"]["sutun_sayisi"])
+        missing_total = kpi["missing_total"]
+        total_cells = max(1, rows_count * max(1, cols_count))
+        missing_pct = round((missing_total / total_cells) * 100, 2)
+        dup_rows = kpi["dup_rows"]
+        preview_cols = kpi["preview_cols"]
+        preview_rows = kpi["preview_rows"]
 
-        try:
-            missing_total = int(main_df.isna().sum().sum())
-            total_cells = max(1, rows_count * max(1, cols_count))
-            missing_pct = round((missing_total / total_cells) * 100, 2)
-        except Exception:
-            missing_total = 0
-            missing_pct = 0.0
-
-        try:
-            dup_rows = int(main_df.duplicated().sum())
-        except Exception:
-            dup_rows = 0
-
-        try:
-            preview_df = main_df.head(15).copy()
-            preview_cols = [str(c) for c in list(preview_df.columns)[:20]]
-            preview_rows = preview_df[preview_cols].fillna("").astype(str).to_dict(orient="records")
-        except Exception:
-            preview_cols = []
-            preview_rows = []
-            
     # -----------------------------
     # Data Quality Score (0-100)
     # -----------------------------
@@ -276,14 +509,6 @@ def generate_reports(
         "quality_score": quality_score,
     }
 
-    if sampling_any:
-        sampling_note = (
-            f"Buyuk sheetler orneklenerek analiz edildi "
-            f"(esik={sample_threshold}, her tip icin ornek={sample_n_each})."
-        )
-    else:
-        sampling_note = "Tum satirlar analiz edildi, ornekleme kullanilmadi."
-
     # top issues (simdilik warnings'dan ilk 8)
     top_issues = []
     if len(warnings_df):
@@ -299,6 +524,7 @@ def generate_reports(
         "file_name": os.path.basename(excel_path),
         "run_time": stamp,
         "sampling_note": sampling_note,
+        "reused_note": reused_note,
         "cards": cards,
         "sheets": sheets_ctx,
         "warnings": warnings_ctx,
@@ -307,23 +533,380 @@ def generate_reports(
         "preview_cols": preview_cols,
         "preview_rows": preview_rows,
         "top_issues": top_issues,
+        "perf_rows": perf_rows,
     }
 
+    return context
+
+
+# -----------------------------
+# Sheet bazli isleme
+# -----------------------------
+
+def _plan_key(sheet_plan: dict | None) -> dict | None:
+    # plan'in sonuca etkisi: okuma yolu, ornekleme esigi, profil modlari
+    if sheet_plan is None:
+        return None
+    return {k: sheet_plan.get(k) for k in ("streaming", "sample_threshold", "profile_options")}
+
 
+def _sheet_cache_key(sheet_name: str, fingerprint: str, settings: dict, sheet_plan: dict | None = None) -> str:
+    return make_key("sheet", sheet_name, fingerprint, PROFILER_VERSION, _key_settings(settings),
+                    _plan_key(sheet_plan))
 
-    write_report_html(template_dir, template_name, out_html, context)
 
-    log("Bitti ✅")
+def _key_settings(settings: dict) -> dict:
+    # plan modu ve butce sonucu sadece secilen plan uzerinden etkiler; plan anahtarda ayrica var
+    return {k: v for k, v in settings.items() if k not in ("plan", "memory_budget_mb")}
+
+
+def _process_sheet(sheet_name: str, info: dict, settings: dict, log, perf: PerfRecorder,
+                   progress: ProgressTracker | None = None) -> dict:
+    for stage, sw in info.get("timings", {}).items():
+        if stage != "acilis":  # streaming: okuma asamasina eklenir
+            perf.add(stage, sheet_name, sw, rows=len(info["df"]) if "df" in info and stage == "okuma" else None)
+
+    if settings["streaming"]:
+        log(f"Sheet okunuyor (streaming): {sheet_name} (header_satiri={info['header_row']})")
+        res = _process_stream(sheet_name, info, settings["sample_threshold"], settings["sample_n_each"],
+                              settings["profile_options"], settings["dedup_confirm"], perf, progress)
+    else:
+        res = _process_loaded(sheet_name, info, settings, log, perf, progress)
+
+    sheet_plan = settings.get("sheet_plan")
+    if sheet_plan:
+        res["sheet_row"]["plan"] = sheet_plan["plan"]
+        res["sheet_row"]["plan_nedeni"] = sheet_plan["plan_nedeni"]
+    return res
+
+
+def _process_loaded(sheet_name: str, info: dict, settings: dict, log, perf: PerfRecorder,
+                    progress: ProgressTracker | None = None) -> dict:
+    df = info["df"]
+    log(f"Sheet isleniyor: {sheet_name} (satir={len(df)}, sutun={df.shape[1]}, header_satiri={info.get('header_row', 1)})")
+    if settings.get("compact_dtypes"):
+        with perf.stage("sikistirma", sheet_name, rows=len(df)):
+            df, before, after = compact_frame(df)
+        info["df"] = df  # orijinal frame birakilsin
+        log(f"{sheet_name}: bellek {before / 2 ** 20:.1f} MB -> {after / 2 ** 20:.1f} MB (dtype sikistirma)")
+    return _process_frame(sheet_name, info, settings["sample_threshold"], settings["sample_n_each"],
+                          settings["profile_options"], settings["dedup_confirm"], perf, progress)
+
+
+def _plan_settings(settings: dict, sheet_plan: dict) -> dict:
+    # sheet'e ozel ayarlar: plan okuma yolunu, ornekleme esigini ve (streaming_tam'da)
+    # sinirli bellekli profil modlarini belirler
+    out = {**settings, "streaming": sheet_plan["streaming"], "sample_threshold": sheet_plan["sample_threshold"],
+           "sheet_plan": sheet_plan}
+    if sheet_plan.get("profile_options"):
+        out["profile_options"] = {**(settings["profile_options"] or {}), **sheet_plan["profile_options"]}
+    return out
+
+
+def _planned_sheets(excel_path: str, auto_header: bool, chunk_size: int, columns: list | None,
+                    in_memory: list, streamed: list, progress: ProgressTracker, log):
+    """Bellek planli sheet'ler tek parse'ta, streaming planlilar parca parca okunur."""
+    if in_memory:
+        progress.stage("okuma")
+        sheets_data = read_excel_all_sheets(excel_path, auto_header=auto_header, sheet_names=in_memory,
+                                            progress=progress.rows, columns=columns)
+        log(f"{len(sheets_data)} sheet bellege okundu.")
+        yield _drain(sheets_data)
+        del sheets_data
+    if streamed:
+        yield _timed_sheets(stream_excel_all_sheets(excel_path, auto_header=auto_header, chunk_size=chunk_size,
+                                                    sheet_names=streamed, progress=progress.rows,
+                                                    columns=columns),
+                            partial(_reread_chunks, excel_path, auto_header=auto_header, chunk_size=chunk_size,
+                                    columns=columns))
+
+
+def _drain(sheets: dict):
+    # sheet'ler sozlukten cikarilarak verilir: islenen DataFrame'e baska referans kalmaz
+    while sheets:
+        sheet_name = next(iter(sheets))
+        yield sheet_name, sheets.pop(sheet_name)
+
+
+def _reread_chunks(excel_path: str, sheet_name: str, auto_header: bool, chunk_size: int,
+                   columns: list | None):
+    # streaming sheet'in parcalari ayni ayarlarla bastan (dedup_confirm ikinci gecisi)
+    return stream_excel_sheet(excel_path, sheet_name, auto_header=auto_header, chunk_size=chunk_size,
+                              columns=columns)["chunks"]
+
+
+def _timed_sheets(sheets, reread=None):
+    # streaming: workbook acilisi/sheet'e gecis suresi de o sheet'in okumasina sayilsin
+    it = iter(sheets)
+    while True:
+        sw = Stopwatch()
+        with sw:
+            item = next(it, None)
+        if item is None:
+            return
+        sheet_name, info = item
+        timings = info.setdefault("timings", {})
+        header_sw = timings.get("header_tespiti")
+        timings["acilis"] = sw.exclude(header_sw) if header_sw is not None else sw
+        if reread is not None:
+            info["reread"] = partial(reread, sheet_name)
+        yield sheet_name, info
+
+
+# worker process'te _init_worker ile kurulan, ana process'le paylasilan iptal bayragi
+_worker_cancel = None
+
+
+def _init_worker(cancel_event) -> None:
+    global _worker_cancel
+    _worker_cancel = cancel_event
+
+
+def _sheet_task(excel_path: str, sheet_name: str, settings: dict) -> dict:
+    # worker process'te calisir: sheet'i kendisi okur, loglari ve olcumleri sonuca ekler;
+    # iptal bayragi okuma parcalari ve asamalar arasinda kontrol edilir
+    logs = []
+    perf = PerfRecorder()
+    progress = ProgressTracker(token=CancelToken(_worker_cancel) if _worker_cancel is not None else None)
+    progress.check()
+    read_sw = Stopwatch()
+    with read_sw:
+        if settings["streaming"]:
+            info = stream_excel_sheet(excel_path, sheet_name, auto_header=settings["auto_header"],
+                                      chunk_size=settings["chunk_size"], columns=settings["columns"],
+                                      progress=progress.rows)
+            info["reread"] = partial(_reread_chunks, excel_path, sheet_name, auto_header=settings["auto_header"],
+                                     chunk_size=settings["chunk_size"], columns=settings["columns"])
+        else:
+            info = read_excel_sheet(excel_path, sheet_name, auto_header=settings["auto_header"],
+                                    columns=settings["columns"], progress=progress.rows)
+    if settings["streaming"]:
+        header_sw = info["timings"].get("header_tespiti")
+        info["timings"]["acilis"] = read_sw.exclude(header_sw) if header_sw is not None else read_sw
+    res = _process_sheet(sheet_name, info, settings, logs.append, perf, progress)
+    res["logs"] = logs
+    res["perf"] = perf.events
+    return res
+
+
+def _run_parallel(excel_path: str, sheet_settings: dict, workers: int, log,
+                  perf: PerfRecorder, progress: ProgressTracker | None = None) -> list:
+    """sheet_settings: sheet_adi -> o sheet'in ayarlari (plan dahil), workbook sirasinda."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+    progress = progress if progress is not None else ProgressTracker()
+    sheet_names = list(sheet_settings)
+    n_workers = max(1, min(int(workers), len(sheet_names)))
+    results = []
+    ctx = multiprocessing.get_context()
+    cancel_event = ctx.Event()
+    pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx, initializer=_init_worker,
+                               initargs=(cancel_event,))
+    try:
+        progress.stage("okuma")
+        futures = [pool.submit(_sheet_task, excel_path, sn, sheet_settings[sn]) for sn in sheet_names]
+        # sonuclar ve loglar sheet sirasiyla alinir; cikti zamanlamadan bagimsiz
+        for sn, fut in zip(sheet_names, futures):
+            while True:
+                progress.check()  # iptal: worker'lara asagida bildirilir
+                try:
+                    res = fut.result(timeout=0.2)
+                    break
+                except FutureTimeout:
+                    continue
+            for msg in res.pop("logs", []):
+                log(msg)
+            perf.extend(res.pop("perf", []))
+            progress.finish_sheet(sn, res["sheet_row"]["satir_sayisi"])
+            results.append(res)
+    except BaseException:
+        # iptal/hata: kuyruktakiler atilir, calisanlar bir sonraki parcada Cancelled ile durur
+        cancel_event.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+    return results
+
+
+def _preview(df: pd.DataFrame) -> tuple[list, list]:
+    try:
+        preview_df = df.head(15).copy()
+        # category kolonlarda fillna("") yeni kategori ister; onizleme icin object yeterli
+        for i in range(preview_df.shape[1]):
+            if isinstance(preview_df.dtypes.iloc[i], pd.CategoricalDtype):
+                preview_df.isetitem(i, preview_df.iloc[:, i].astype(object))
+        preview_cols = [str(c) for c in list(preview_df.columns)[:20]]
+        preview_rows = preview_df[preview_cols].fillna("").astype(str).to_dict(orient="records")
+    except Exception:
+        preview_cols = []
+        preview_rows = []
+    return preview_cols, preview_rows
+
+
+def _sheet_result(sheet_name: str, info: dict, df_for_profile: pd.DataFrame, sampled: bool,
+                  n_rows: int, columns: list, missing: dict, dup_index: DuplicateIndex,
+                  preview_df: pd.DataFrame, profile_options: dict | None, perf: PerfRecorder,
+                  progress: ProgressTracker, prof: pd.DataFrame | None = None) -> dict:
+    # prof verilmisse (streaming tam profil) df_for_profile sadece onizlemedir
+    exact_rows = None if prof is None else n_rows
+    if prof is None:
+        progress.stage("profil", sheet_name)
+        with perf.stage("profil", sheet_name, rows=len(df_for_profile)):
+            prof = profile_columns(sheet_name, df_for_profile, **(profile_options or {}))
+
+    if len(prof):
+        # unique_sayi/unique_oran profillenen satirlardan: orneklemede payda ornegin dolu
+        # sayisidir (asagida tum satirlara cekilen dolu_sayi degil)
+        prof.insert(prof.columns.get_loc("unique_hata_payi") + 1, "unique_kaynagi",
+                    "ornek" if sampled else "tum")
+    if sampled and len(prof):
+        # dolu/bos sayilari ornek yerine tum satirlardan (streaming'de tam sayim)
+        miss = prof["kolon_adi"].map({str(k): v for k, v in missing.items()}).fillna(0).astype(int)
+        prof["bos_sayi"] = miss
+        prof["dolu_sayi"] = n_rows - miss
+        prof["bos_oran"] = (miss / n_rows * 100).round(2) if n_rows else 0.0
+
+    progress.stage("kalite_kontrol", sheet_name)
+    with perf.stage("kalite_kontrol", sheet_name, rows=len(df_for_profile)):
+        warns = quality_warnings(sheet_name, df_for_profile, prof, n_rows=exact_rows)
+    # duplicate sonucu sheet basina bir kez: hem 04_Duplicate_Analizi hem KPI
+    dups = duplicate_report(sheet_name, dup_index)
+    preview_cols, preview_rows = _preview(preview_df)
 
     return {
-        "out_xlsx": out_xlsx,
-        "out_html": out_html,
-        "summary": {
-            "sheet_sayisi": int(len(sheet_list_df)),
-            "toplam_satir": total_rows,
-            "toplam_kolon": total_cols,
-            "warn": warn_count,
-            "error": err_count,
-            "ornekleme": sampling_any,
-        }
+        "sheet_row": {
+            "sheet_adi": sheet_name,
+            "satir_sayisi": int(n_rows),
+            "sutun_sayisi": int(len(columns)),
+            "header_satiri": int(info.get("header_row", 1)),
+            "header_confidence": float(info.get("header_confidence", 0.0)),
+        },
+        "columns": list(columns),
+        "sampled": bool(sampled),
+        "profile": prof,
+        "warnings": warns,
+        "dups": dups,
+        "kpi": {
+            "missing_total": int(sum(missing.values())),
+            "dup_rows": int(dup_index.dup_count),
+            "preview_cols": preview_cols,
+            "preview_rows": preview_rows,
+        },
     }
+
+
+def _process_frame(sheet_name: str, info: dict, sample_threshold: int, sample_n_each: int,
+                   profile_options: dict | None, dedup_confirm: bool = False,
+                   perf: PerfRecorder | None = None, progress: ProgressTracker | None = None) -> dict:
+    perf = perf if perf is not None else PerfRecorder()
+    progress = progress if progress is not None else ProgressTracker()
+    # bellekteki tam DataFrame
+    df = info["df"]
+    progress.stage("ornekleme", sheet_name)
+
+    # Big data örnekleme (sample_threshold None: plan tam profil secti)
+    with perf.stage("ornekleme", sheet_name, rows=len(df)):
+        if sample_threshold is None:
+            df_for_profile, sampled = df, False
+        else:
+            df_for_profile, sampled = sample_df(df, threshold=sample_threshold, n_each=sample_n_each)
+
+    with perf.stage("bos_sayim", sheet_name, rows=len(df)):
+        try:
+            missing = {c: int(v) for c, v in df.isna().sum().items()}
+        except Exception:
+            missing = {}
+    progress.stage("duplicate", sheet_name)
+    with perf.stage("duplicate", sheet_name, rows=len(df)):
+        dup_index = DuplicateIndex(confirm=dedup_confirm).update(df)
+        if dup_index.needs_confirm:
+            dup_index.confirm_rows([df])
+
+    return _sheet_result(sheet_name, info, df_for_profile, sampled, len(df), list(df.columns),
+                         missing, dup_index, df, profile_options, perf, progress)
+
+
+def _process_stream(sheet_name: str, info: dict, sample_threshold: int | None, sample_n_each: int,
+                    profile_options: dict | None, dedup_confirm: bool = False,
+                    perf: PerfRecorder | None = None, progress: ProgressTracker | None = None) -> dict:
+    perf = perf if perf is not None else PerfRecorder()
+    progress = progress if progress is not None else ProgressTracker()
+    progress.stage("okuma", sheet_name)
+    if sample_threshold is None:
+        return _process_stream_exact(sheet_name, info, profile_options, dedup_confirm, perf, progress)
+    # parcalar okunurken orneklenir; tam satir/bos/duplicate sayilari akarken hesaplanir
+    sampler = StreamSampler(threshold=sample_threshold, n_each=sample_n_each)
+    dup_index = DuplicateIndex(confirm=dedup_confirm)
+
+    # okuma/ornekleme/duplicate parcalar arasinda serpistirilmis: sureler biriktirilir
+    read_sw, sample_sw, dup_sw = Stopwatch(), Stopwatch(), Stopwatch()
+    chunks = iter(info["chunks"])
+    while True:
+        with read_sw:
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        progress.check()  # parcalar arasinda iptal kontrolu
+        with sample_sw:
+            sampler.update(chunk)
+        with dup_sw:
+            dup_index.update(chunk)
+    _confirm_duplicates(dup_index, info, dup_sw)
+    df_for_profile, sampled = sampler.result()
+
+    opening = info.get("timings", {}).get("acilis")
+    if opening is not None:
+        read_sw.include(opening)
+    perf.add("okuma", sheet_name, read_sw, rows=sampler.rows)
+    perf.add("ornekleme", sheet_name, sample_sw, rows=sampler.rows)
+    perf.add("duplicate", sheet_name, dup_sw, rows=sampler.rows)
+
+    return _sheet_result(sheet_name, info, df_for_profile, sampled, sampler.rows,
+                         list(df_for_profile.columns), sampler.missing, dup_index,
+                         df_for_profile, profile_options, perf, progress)
+
+
+def _confirm_duplicates(dup_index: DuplicateIndex, info: dict, dup_sw: Stopwatch) -> None:
+    # dedup_confirm: tekrar eden hash'ler icin sheet ikinci kez akitilir (parcalar tutulmadi)
+    if dup_index.needs_confirm and info.get("reread") is not None:
+        with dup_sw:
+            dup_index.confirm_rows(info["reread"]())
+
+
+def _process_stream_exact(sheet_name: str, info: dict, profile_options: dict | None, dedup_confirm: bool,
+                          perf: PerfRecorder, progress: ProgressTracker) -> dict:
+    # tum satirlar birlestirilebilir istatistiklerle profillenir; sadece onizleme satirlari tutulur
+    stats = SheetStats(**(profile_options or {}))
+    dup_index = DuplicateIndex(confirm=dedup_confirm)
+    preview = None
+
+    read_sw, prof_sw, dup_sw = Stopwatch(), Stopwatch(), Stopwatch()
+    chunks = iter(info["chunks"])
+    while True:
+        with read_sw:
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        progress.check()  # parcalar arasinda iptal kontrolu
+        if preview is None:
+            preview = chunk.head(15)
+        with prof_sw:
+            stats.update(chunk)
+        with dup_sw:
+            dup_index.update(chunk)
+    _confirm_duplicates(dup_index, info, dup_sw)
+
+    opening = info.get("timings", {}).get("acilis")
+    if opening is not None:
+        read_sw.include(opening)
+    perf.add("okuma", sheet_name, read_sw, rows=stats.rows)
+    with prof_sw:
+        prof = stats.to_frame(sheet_name)
+    perf.add("profil", sheet_name, prof_sw, rows=stats.rows)
+    perf.add("duplicate", sheet_name, dup_sw, rows=stats.rows)
+
+    preview = preview if preview is not None else pd.DataFrame()
+    missing = {col: cs.missing for col, cs in stats.columns.items()}
+    return _sheet_result(sheet_name, info, preview, False, stats.rows, list(stats.columns), missing,
+                         dup_index, preview, profile_options, perf, progress, prof=prof)
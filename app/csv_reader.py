@@ -0,0 +1,211 @@
+"""
+CSV/TSV okuyucu motoru (excel_reader ENGINES["csv"]).
+
+Dosya tek sheet sayilir (sheet adi = uzantisiz dosya adi). Kodlama ve ayirici
+dosyanin ilk SNIFF_BYTES'indan tahmin edilir; header tespiti xlsx ile ayni
+preview kuraliyla yapilir. Veri pandas'in C okuyucusuyla okunur: streaming'de
+chunk_size satirlik parcalar halinde, bellek modunda tek seferde.
+
+Tum hucreler metin okunur (dtype=str): "00123" gibi degerler pandas'ta 123'e
+donmez, tip cikarimi (type_inference) xlsx yoluyla ayni kurallarla karar verir.
+Kolon sayisi ornekteki en genis satirdir; ornekten sonra gelen daha genis
+satirlar okumayi durdurmaz, atlanir ve sayisi uyari (warnings) olarak bildirilir.
+"""
+from __future__ import annotations
+import codecs
+import csv
+import os
+import warnings
+from collections import Counter
+from functools import partial
+from itertools import islice
+from typing import Iterator
+
+import pandas as pd
+from pandas.errors import ParserWarning
+
+from .excel_reader import DEFAULT_CHUNK_SIZE, _make_columns, single_sheet
+from .header_detector import detect_header_row
+from .perf import Stopwatch
+
+SNIFF_BYTES = 64 * 1024
+DELIMITERS = ",;\t|"
+# BOM yoksa sirayla denenir; Turkce Excel'in "CSV" ciktisi genelde cp1254
+ENCODINGS = ("utf-8", "cp1254", "latin-1")
+_TAB_EXTENSIONS = (".tsv", ".tab")
+
+
+def _sample(path: str) -> tuple[bytes, bool]:
+    # (ilk SNIFF_BYTES, dosya daha uzun mu)
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+        return head, bool(f.read(1))
+
+
+def sniff_encoding(head: bytes) -> str:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    for enc in ENCODINGS:
+        try:
+            # incremental: ornegin sonunda yarim kalan cok byte'li karakter hata sayilmaz
+            codecs.getincrementaldecoder(enc)().decode(head)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return ENCODINGS[-1]
+
+
+def sniff_delimiter(lines: list) -> str:
+    """
+    En cok satirda ayni sayida (>1) alan ureten ayirici; esitlikte daha genis olan.
+    Header ustundeki tek hucreli baslik satirlari sayilmaz.
+    """
+    best, best_score = ",", (0, 0)
+    for d in DELIMITERS:
+        widths = Counter(len(r) for r in csv.reader(lines, delimiter=d) if len(r) > 1)
+        if not widths:
+            continue
+        width, freq = widths.most_common(1)[0]
+        if (freq, width) > best_score:
+            best, best_score = d, (freq, width)
+    return best
+
+
+def _sniff(path: str) -> dict:
+    head, truncated = _sample(path)
+    encoding = sniff_encoding(head)
+    lines = head.decode(encoding, errors="replace").splitlines()
+    if truncated and lines:
+        lines = lines[:-1]  # yarim satir
+    if os.path.splitext(path)[1].lower() in _TAB_EXTENSIONS:
+        delimiter = "\t"
+    else:
+        delimiter = sniff_delimiter(lines[:200])
+    return {"encoding": encoding, "delimiter": delimiter, "lines": lines, "truncated": truncated,
+            "sample_bytes": len(head)}
+
+
+def csv_sheet_names(path: str) -> list:
+    return single_sheet(path, None)
+
+
+def csv_dimensions(path: str) -> dict:
+    """
+    Satir sayisi ornekteki ortalama satir uzunlugundan tahmin edilir (dosya ornekten
+    kisaysa kesin); kolon sayisi ornekteki en sik alan sayisi.
+    """
+    s = _sniff(path)
+    records = [r for r in csv.reader(s["lines"], delimiter=s["delimiter"]) if r]
+    if not records:
+        return {}
+    widths = Counter(len(r) for r in records)
+    cols = widths.most_common(1)[0][0]
+    if s["truncated"]:
+        rows = int(os.path.getsize(path) / (s["sample_bytes"] / len(records)))
+    else:
+        rows = len(records)
+    name = single_sheet(path, None)[0]
+    return {name: {"rows": rows, "cols": cols, "xml_bytes": 0, "source": "ornek"}}
+
+
+def stream_csv(path: str, auto_header: bool = True, preview_rows: int = 30,
+               chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_names: list | None = None,
+               progress=None, columns: list | None = None) -> Iterator[tuple[str, dict]]:
+    for name in single_sheet(path, sheet_names):
+        sheet_progress = partial(progress, name) if progress is not None else None
+        yield name, _sheet_info(path, auto_header, preview_rows, chunk_size, sheet_progress, columns)
+
+
+def _sheet_info(path: str, auto_header: bool, preview_rows: int, chunk_size: int, progress,
+                columns: list | None) -> dict:
+    s = _sniff(path)
+    with open(path, encoding=s["encoding"], errors="replace", newline="") as f:
+        preview = list(islice(csv.reader(f, delimiter=s["delimiter"]), max(preview_rows, 1)))
+
+    header_row_0 = 0
+    confidence = 0.0
+    timings = {}
+    if auto_header:
+        with Stopwatch() as header_sw:
+            preview_df = pd.DataFrame(preview) if preview else pd.DataFrame()
+            header_row_0, confidence = detect_header_row(preview_df, max_rows=preview_rows)
+        timings["header_tespiti"] = header_sw
+
+    return {
+        "chunks": _chunks(path, s, preview, header_row_0, chunk_size, progress, columns),
+        "header_row": int(header_row_0 + 1),  # 1-based for humans
+        "header_confidence": float(confidence),
+        "timings": timings,
+    }
+
+
+def _chunks(path: str, s: dict, preview: list, header_row_0: int, chunk_size: int, progress,
+            columns: list | None) -> Iterator[pd.DataFrame]:
+    if len(preview) <= header_row_0:
+        return  # bos dosya
+
+    # kolon adlari xlsx yoluyla ayni kuralla (Unnamed: i, x.1); genislik preview ve ornekteki en
+    # genis satir (header ustu baslik satirlari daha dar, genisligi buyutmez)
+    header = preview[header_row_0]
+    width = max(max(len(r) for r in preview[header_row_0:]),
+                max((len(r) for r in csv.reader(s["lines"], delimiter=s["delimiter"])), default=0))
+    names = _make_columns([v if v.strip() else None for v in header], width)
+    if columns:
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError(f"Kolon bulunamadi: {missing}")
+
+    kwargs = dict(
+        sep=s["delimiter"], encoding=s["encoding"],
+        encoding_errors="replace",  # ornek disinda gecersiz byte: tum okuma dusmesin
+        # skiprows bos satirlari da sayar (preview ile ayni numaralama); veri icindeki
+        # bos satirlar atlanir ki tam sayi kolonlari NaN yuzunden float'a donmesin
+        header=None, names=names, skiprows=header_row_0 + 1,
+        skip_blank_lines=True, index_col=False,
+        # hepsi metin: tip cikarimi karar verir ("00123" kod olarak kalir)
+        dtype=str,
+        # genislikten fazla alanli satir tum okumayi dusurmesin; atlanan satirlar sayilir.
+        # usecols kullanilmaz: names'ten dar satirlardan olusan parcada C okuyucu hata veriyor
+        on_bad_lines="warn",
+    )
+    reader = None
+    if chunk_size >= os.path.getsize(path):
+        # her satir en az 1 byte: dosya tek parcaya sigar (bellek modu); okuma ilk next'te
+        parts = iter([partial(pd.read_csv, path, low_memory=False, **kwargs)])
+    else:
+        reader = pd.read_csv(path, chunksize=max(1, int(chunk_size)), **kwargs)
+        parts = iter(reader)
+
+    rows = 0
+    skipped = []
+    try:
+        while True:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ParserWarning)
+                df = _next_part(parts)
+            skipped += [str(w.message).strip() for w in caught if issubclass(w.category, ParserWarning)]
+            if df is None:
+                break
+            rows += len(df)
+            if progress is not None:
+                progress(rows)
+            if columns:
+                df = df[list(columns)]
+            yield df.dropna(how="all")
+    finally:
+        if reader is not None:
+            reader.close()
+    if skipped:
+        warnings.warn(f"{os.path.basename(path)}: {width} kolondan genis {len(skipped)} satir atlandi "
+                      f"(ilki: {skipped[0]})", stacklevel=2)
+
+
+def _next_part(parts) -> pd.DataFrame | None:
+    # parts: tek seferlik okuma (callable) ya da TextFileReader parcalari
+    try:
+        part = next(parts)
+    except StopIteration:
+        return None
+    return part() if callable(part) else part
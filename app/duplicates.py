@@ -0,0 +1,166 @@
+from __future__ import annotations
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array
+
+# bos deger her dtype'ta ayni hash'i alir (pandas duplicated NaN/None/NaT'yi esit sayar)
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+# tarih ve diger (sayi/metin olmayan) degerler ayni bitli tam sayi/metinle cakismasin
+_DATE_TAG = np.uint64(0x5BD1E9955BD1E995)
+_OTHER_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+_INT64_LIMIT = 2.0 ** 63
+
+
+def _number_hash(values: np.ndarray) -> np.ndarray:
+    # tam sayilar int64 olarak; float'lar sadece tam degerliyse int ile esitlenir
+    # (parcalar arasinda int64 <-> float64 dtype farki hash'i degistirmesin)
+    if values.dtype.kind in "biu":
+        return hash_array(values.astype("int64", copy=False))
+    values = values.astype("float64", copy=False)
+    h = hash_array(values)
+    integral = np.isfinite(values) & (np.floor(values) == values) & (np.abs(values) < _INT64_LIMIT)
+    if integral.any():
+        h[integral] = hash_array(values[integral].astype("int64"))
+    return h
+
+
+def _object_hash(values: np.ndarray, null: np.ndarray) -> np.ndarray:
+    # karisik kolon: tip etiketi ile (1 ve "1" farkli satir, pandas duplicated gibi)
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind in ("string", "empty"):
+        return hash_array(values)
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    is_num = np.fromiter((isinstance(v, (int, float, np.number)) for v in values), dtype=bool,
+                         count=len(values)) & ~null
+    other = ~(is_str | is_num | null)
+    h = np.zeros(len(values), dtype="uint64")
+    if is_str.any():
+        h[is_str] = hash_array(values[is_str])
+    if is_num.any():
+        nums = pd.to_numeric(pd.Series(values[is_num]), errors="coerce").to_numpy()
+        h[is_num] = _number_hash(nums if nums.dtype != object else nums.astype("float64"))
+    if other.any():
+        tagged = np.array([f"{type(v).__name__}:{v}" for v in values[other]], dtype=object)
+        h[other] = hash_array(tagged) ^ _OTHER_TAG
+    return h
+
+
+def _column_hash(s: pd.Series) -> np.ndarray:
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        if len(s.cat.categories) == 0:
+            return np.full(len(s), _NULL_HASH, dtype="uint64")
+        cats = _column_hash(pd.Series(s.cat.categories))
+        return np.where(codes >= 0, cats[codes], _NULL_HASH)
+
+    null = s.isna().to_numpy()
+    if pd.api.types.is_bool_dtype(s) or pd.api.types.is_integer_dtype(s):
+        h = _number_hash(s.to_numpy(dtype="int64", na_value=0))
+    elif pd.api.types.is_float_dtype(s):
+        h = _number_hash(s.to_numpy(dtype="float64", na_value=np.nan))
+    elif pd.api.types.is_datetime64_any_dtype(s):
+        if getattr(s.dt, "tz", None) is not None:
+            s = s.dt.tz_convert(None)
+        h = hash_array(s.to_numpy(dtype="datetime64[ns]").view("int64")) ^ _DATE_TAG
+    else:
+        h = _object_hash(s.to_numpy(dtype=object), null)
+    h[null] = _NULL_HASH
+    return h
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Her satir icin 64-bit hash (vektorel). Kolonlar dtype'ina gore hash'lenir:
+    tam sayilar int64 (2**53 ustu de ayri), tam degerli float'lar ayni int ile esit,
+    object kolonlarda deger tipi de hash'e girer. Kolon hash'leri pandas'in satir
+    birlestirmesiyle tek hash'e indirilir.
+    """
+    if df.shape[1] == 0:
+        return np.zeros(len(df), dtype="uint64")
+    cols = pd.DataFrame({i: _column_hash(df.iloc[:, i]) for i in range(df.shape[1])}, index=df.index)
+    return pd.util.hash_pandas_object(cols, index=False).to_numpy(dtype="uint64")
+
+
+def _row_key(row: tuple) -> tuple:
+    # NaN != NaN oldugu icin bos degerler None'a cevrilir (pandas duplicated ile ayni)
+    return tuple(None if (v is None or (isinstance(v, float) and v != v) or v is pd.NaT) else v for v in row)
+
+
+class DuplicateIndex:
+    """
+    Tam satir duplicate sayaci; parca parca beslenir.
+
+    Her satir 64-bit hash'e cevrilir ve gorulen hash'ler sirali bir uint64
+    dizisinde tutulur (satir basina 8 byte). confirm=True ise birden cok satirda
+    gorulen hash'ler de ayrica tutulur; confirm_rows ile veri ikinci kez
+    verildiginde sadece bu hash'lere sahip satirlarin degerleri saklanip
+    karsilastirilir. Hash cakismasi duplicate sayilmaz (collisions).
+    """
+
+    def __init__(self, confirm: bool = False):
+        self.confirm = confirm
+        self.rows = 0
+        self.dup_count = 0
+        self.collisions = 0
+        self.confirmed = False
+        self._seen = np.empty(0, dtype="uint64")
+        self._repeated = np.empty(0, dtype="uint64")   # confirm modu: tekrar eden hash'ler
+
+    def update(self, chunk: pd.DataFrame) -> "DuplicateIndex":
+        n = len(chunk)
+        if n == 0:
+            return self
+        self.rows += n
+        uniq, counts = np.unique(row_hashes(chunk), return_counts=True)
+        within = n - len(uniq)
+
+        pos = np.searchsorted(self._seen, uniq)
+        pos_c = np.minimum(pos, max(0, len(self._seen) - 1))
+        found = (pos < len(self._seen)) & (self._seen[pos_c] == uniq) if len(self._seen) else np.zeros(len(uniq), dtype=bool)
+
+        self.dup_count += within + int(found.sum())
+        if self.confirm:
+            repeated = uniq[found | (counts > 1)]
+            if len(repeated):
+                self._repeated = np.union1d(self._repeated, repeated)
+        new = uniq[~found]
+        if len(new):
+            self._seen = np.union1d(self._seen, new)
+        return self
+
+    @property
+    def needs_confirm(self) -> bool:
+        """confirm modunda ikinci gecis gerekiyor mu (tekrar eden hash yoksa duplicate da yok)."""
+        return self.confirm and not self.confirmed and len(self._repeated) > 0
+
+    def confirm_rows(self, chunks: Iterable[pd.DataFrame]) -> "DuplicateIndex":
+        """
+        Ikinci gecis: update'e verilen parcalar ayni sirayla tekrar verilir. Sadece
+        tekrar eden hash'lerin satirlari bellekte tutulur; dup_count kesinlesir.
+        """
+        by_hash = {}   # hash -> [satir anahtarlari]
+        dups = collisions = 0
+        for chunk in chunks:
+            hashes = row_hashes(chunk)
+            mask = np.isin(hashes, self._repeated)
+            if not mask.any():
+                continue
+            for h, row in zip(hashes[mask].tolist(), chunk[mask].itertuples(index=False, name=None)):
+                key = _row_key(row)
+                bucket = by_hash.get(h)
+                if bucket is None:
+                    by_hash[h] = [key]
+                elif key in bucket:
+                    dups += 1
+                else:
+                    # ayni hash, farkli satir
+                    collisions += 1
+                    bucket.append(key)
+        self.dup_count, self.collisions, self.confirmed = dups, collisions, True
+        return self
+
+    @property
+    def dup_ratio(self) -> float:
+        return (self.dup_count / self.rows * 100) if self.rows else 0.0
@@ -1,30 +1,613 @@
 from __future__ import annotations
+import codecs
+import importlib
+import os
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain, islice
+from typing import Callable, Iterator
+
 import pandas as pd
 
 from .header_detector import detect_header_row
+from .perf import Stopwatch
+
+DEFAULT_CHUNK_SIZE = 50_000
+PROGRESS_EVERY_ROWS = 5_000
+
+# openpyxl values_only modunda hata hucreleri string olarak gelir ("#N/A" vb.)
+_ERROR_CODES = frozenset(("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"))
+
+# bos hucre degeri (pandas gibi None yerine NaN)
+_NA = float("nan")
+
+
+def read_excel_all_sheets(path: str, auto_header: bool = True, preview_rows: int = 30,
+                          sheet_names: list | None = None, progress=None, columns: list | None = None) -> dict:
+    """
+    Tum sheet'leri (ya da sadece sheet_names'i) okur. Okuyucu motoru dosya imzasindan
+    secilir (get_engine). Dosya tek sefer acilir; header preview'i ve tam okuma ayni
+    satir akisindan gelir (sheet basina tek parse).
+    progress(sheet_name, okunan_satir) her PROGRESS_EVERY_ROWS satirda cagrilir;
+    hata firlatirsa (ör. iptal) okuma durur ve dosya kapanir.
+    columns verilirse sadece bu kolonlar doner (parquet digerlerini diskten hic okumaz).
+    """
+    engine = get_engine(path)
+    if engine.read is not None:
+        result = engine.read(path, auto_header=auto_header, preview_rows=preview_rows,
+                             sheet_names=sheet_names, progress=progress)
+        return {sn: _select_columns(info, columns) for sn, info in result.items()} if columns else result
+
+    result = {}
+    sheets = _stream(engine, path, auto_header, preview_rows, sys.maxsize, sheet_names, progress, columns)
+    try:
+        while True:
+            read_sw = Stopwatch()
+            with read_sw:
+                item = next(sheets, None)
+                if item is None:
+                    break
+                sheet_name, info = item
+                # chunk_size sinirsiz: tek parca, dtype cikarimi tum kolon uzerinden yapilir
+                chunks = list(info["chunks"])
+            result[sheet_name] = {
+                "df": chunks[0] if chunks else pd.DataFrame(),
+                "header_row": info["header_row"],
+                "header_confidence": info["header_confidence"],
+                "timings": _read_timings(read_sw, info),
+            }
+    finally:
+        sheets.close()
+
+    return result
+
+
+def _read_timings(read_sw: Stopwatch, info: dict) -> dict:
+    # okuma suresi header tespitini icermesin (ayri asama)
+    header_sw = info.get("timings", {}).get("header_tespiti")
+    if header_sw is None:
+        return {"okuma": read_sw}
+    return {"okuma": read_sw.exclude(header_sw), "header_tespiti": header_sw}
+
+
+# -----------------------------
+# Okuyucu motorlari
+# -----------------------------
+
+@dataclass(frozen=True)
+class ReaderEngine:
+    """
+    Bir dosya turunun okuyucusu. Her motor ayni sozlesmeyi uretir:
+    stream(path, auto_header, preview_rows, chunk_size, sheet_names, progress, columns)
+    -> (sheet_name, {"chunks", "header_row", "header_confidence", "timings"}).
+    read verilmisse read_excel_all_sheets onu kullanir (tek seferde parse eden motorlar).
+    """
+    name: str
+    sheet_names: Callable[[str], list]
+    stream: Callable[..., Iterator[tuple[str, dict]]]
+    dimensions: Callable[[str], dict] | None = None
+    read: Callable[..., dict] | None = None
+    column_projection: bool = False  # columns'u okuma sirasinda uygular mi
+
+
+def _lazy(module: str, attr: str) -> Callable:
+    # motor modulu (ve pyarrow gibi bagimliliklari) ilk kullanimda yuklenir
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module, __package__), attr)(*args, **kwargs)
+    return call
+
+
+ENGINES: dict = {}
+# dosya basindaki imza -> motor; imza yoksa once metin kontrolu, uzanti en son
+SIGNATURES: dict = {}
+EXTENSIONS: dict = {}
+TEXT_SNIFF_BYTES = 512
+
+
+def register_engine(engine: ReaderEngine, signatures: tuple = (), extensions: tuple = ()) -> None:
+    ENGINES[engine.name] = engine
+    for magic in signatures:
+        SIGNATURES[magic] = engine.name
+    for ext in extensions:
+        EXTENSIONS[ext.lower()] = engine.name
+
+
+def detect_engine(path: str) -> str:
+    """
+    Motor adi: once dosya imzasi (zip -> xlsx, OLE2 -> xls, PAR1 -> parquet), sonra
+    icerik metinse csv, en son uzanti. Zip imzali .xlsb/.ods pandas motoruna gider;
+    imzasi olmayan .xlsx/.xls (Excel'e "kaydedilmis" CSV) metinse csv sayilir.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, "rb") as f:
+            head = f.read(TEXT_SNIFF_BYTES)
+    except OSError:
+        head = b""
+
+    for magic, name in SIGNATURES.items():
+        if head.startswith(magic):
+            if name == "xlsx" and EXTENSIONS.get(ext) not in (None, "xlsx"):
+                return EXTENSIONS[ext]
+            return name
+    if _looks_like_text(head):
+        return "csv"
+    if ext in EXTENSIONS:
+        return EXTENSIONS[ext]
+    return "pandas"  # eski davranis: pd.ExcelFile anlamli bir hata verir
+
+
+def _looks_like_text(head: bytes) -> bool:
+    # imzasiz ikili dosyalarda (ör. bozuk xls) NUL byte bulunur; UTF-16 metin BOM'la gelir
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return True
+    return bool(head) and b"\x00" not in head
+
+
+def get_engine(path: str) -> ReaderEngine:
+    return ENGINES[detect_engine(path)]
+
+
+def _stream(engine: ReaderEngine, path: str, auto_header: bool, preview_rows: int, chunk_size: int,
+            sheet_names: list | None, progress, columns: list | None) -> Iterator[tuple[str, dict]]:
+    sheets = engine.stream(path, auto_header=auto_header, preview_rows=preview_rows, chunk_size=chunk_size,
+                           sheet_names=sheet_names, progress=progress,
+                           columns=columns if engine.column_projection else None)
+    if not columns or engine.column_projection:
+        return sheets
+    return ((sn, _select_columns(info, columns)) for sn, info in sheets)
 
 
-def read_excel_all_sheets(path: str, auto_header: bool = True, preview_rows: int = 30) -> dict:
-    xls = pd.ExcelFile(path)
+def _select_columns(info: dict, columns: list) -> dict:
+    # kolon secimini okumada yapamayan motorlar icin (xlsx/xls): okunduktan sonra
+    def pick(df: pd.DataFrame) -> pd.DataFrame:
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise KeyError(f"Kolon bulunamadi: {missing}")
+        return df[list(columns)]
+
+    info = dict(info)
+    if "df" in info:
+        info["df"] = pick(info["df"])
+    else:
+        info["chunks"] = map(pick, info["chunks"])
+    return info
+
+
+def single_sheet(path: str, sheet_names: list | None) -> list:
+    """Tek sheet'li dosyalar (csv, parquet): sheet adi uzantisiz dosya adidir."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    if sheet_names is None:
+        return [name]
+    for sn in sheet_names:
+        if sn != name:
+            raise KeyError(f"Worksheet {sn} does not exist.")
+    return [name] if sheet_names else []
+
+
+def _is_xlsx(path: str) -> bool:
+    return detect_engine(path) == "xlsx"
+
+
+def _read_with_pandas(path: str, auto_header: bool = True, preview_rows: int = 30,
+                      sheet_names: list | None = None, progress=None) -> dict:
+    # .xls vb. openpyxl disi formatlar: dosya yine tek kez acilir, her sheet tek kez parse edilir
     result = {}
+    with pd.ExcelFile(path) as xls:
+        for sheet_name in (sheet_names if sheet_names is not None else xls.sheet_names):
+            read_sw = Stopwatch()
+            header_sw = Stopwatch()
+            with read_sw:
+                raw = xls.parse(sheet_name, header=None)
+
+            header_row_0 = 0
+            confidence = 0.0
+
+            if auto_header:
+                with header_sw:
+                    header_row_0, confidence = detect_header_row(raw.head(preview_rows), max_rows=preview_rows)
+
+            with read_sw:
+                if len(raw) > header_row_0:
+                    header = [_NA if pd.isna(v) else v for v in raw.iloc[header_row_0].tolist()]
+                    df = raw.iloc[header_row_0 + 1:].reset_index(drop=True)
+                    df.columns = _make_columns(header, raw.shape[1])
+                    df = df.infer_objects().dropna(how="all")
+                else:
+                    df = pd.DataFrame()
+
+            if progress is not None:
+                progress(sheet_name, len(df))  # pandas parse'i tek seferde; sheet sonunda bildirilir
+
+            result[sheet_name] = {
+                "df": df,
+                "header_row": int(header_row_0 + 1),  # 1-based for humans
+                "header_confidence": float(confidence),
+                "timings": {"okuma": read_sw, "header_tespiti": header_sw} if auto_header else {"okuma": read_sw},
+            }
+
+    return result
+
+
+# -----------------------------
+# Streaming (read-only) okuma
+# -----------------------------
+
+def _open_workbook(path: str):
+    from openpyxl import load_workbook
+
+    # read_only: satirlar XML'den akarak okunur, tum hucre modeli bellege alinmaz
+    return load_workbook(path, read_only=True, data_only=True)
+
+
+def _convert_value(v):
+    # pandas'in openpyxl okuyucusuyla ayni donusumler
+    if v is None:
+        return _NA
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, str) and v in _ERROR_CODES:
+        return _NA
+    return v
+
+
+def _iter_rows(ws) -> Iterator[list]:
+    for row in ws.iter_rows(values_only=True):
+        vals = [_convert_value(v) for v in row]
+        # sondaki bos hucreleri kirp (pandas ile ayni)
+        while vals and vals[-1] is _NA:
+            vals.pop()
+        yield vals
+
+
+def _make_columns(header: list, width: int) -> list:
+    names = []
+    for i in range(width):
+        v = header[i] if i < len(header) else None
+        if v is None or v is _NA or (isinstance(v, str) and v.strip() == ""):
+            names.append(f"Unnamed: {i}")
+        else:
+            names.append(v)
+
+    # pandas dedup: x, x -> x, x.1
+    counts = defaultdict(int)
+    for i, col in enumerate(names):
+        cur = counts[col]
+        while cur > 0:
+            counts[col] = cur + 1
+            col = f"{col}.{cur}"
+            cur = counts[col]
+        names[i] = col
+        counts[col] = cur + 1
+
+    return names
+
+
+def _chunks_from_rows(rows: Iterator[list], header_row_0: int, chunk_size: int, width: int = 0,
+                     progress=None) -> Iterator[pd.DataFrame]:
+    """
+    Ham satirlardan (header dahil) sabit boyutlu DataFrame parcalari uretir.
+    progress(okunan_satir) her PROGRESS_EVERY_ROWS veri satirinda ve sonda cagrilir.
+    """
+    chunk_size = max(1, int(chunk_size))
+
+    # header oncesi satirlar atlanir
+    for _ in islice(rows, header_row_0):
+        pass
+
+    header = next(rows, None)
+    if header is None:
+        return
 
-    for sheet_name in xls.sheet_names:
-        header_row_0 = 0
-        confidence = 0.0
+    width = max(width, len(header))
+    columns = _make_columns(header, width)
 
-        if auto_header:
-            # preview read (no header)
-            preview_df = pd.read_excel(path, sheet_name=sheet_name, header=None, nrows=preview_rows)
+    row_no = 0
+    buf = []
+    next_report = PROGRESS_EVERY_ROWS
+    for vals in rows:
+        if len(vals) > width:
+            # dimension'dan genis satir: yeni kolonlar Unnamed olarak eklenir
+            width = len(vals)
+            columns = _make_columns(header, width)
+        buf.append(vals)
+        if progress is not None and row_no + len(buf) >= next_report:
+            progress(row_no + len(buf))
+            next_report += PROGRESS_EVERY_ROWS
+        if len(buf) >= chunk_size:
+            yield _build_chunk(buf, columns, row_no)
+            row_no += len(buf)
+            buf = []
+
+    if progress is not None:
+        progress(row_no + len(buf))
+
+    if buf or row_no == 0:
+        # header var ama veri yoksa kolonlari tasiyan bos bir parca dondur
+        yield _build_chunk(buf, columns, row_no)
+
+
+def _build_chunk(buf: list, columns: list, start: int) -> pd.DataFrame:
+    width = len(columns)
+    data = [r + [_NA] * (width - len(r)) if len(r) < width else r for r in buf]
+    df = pd.DataFrame(data, columns=columns, index=pd.RangeIndex(start, start + len(data)))
+    return df.dropna(how="all")
+
+
+def _sheet_width(ws) -> int:
+    try:
+        return int(ws.max_column or 0)
+    except Exception:
+        return 0
+
+
+def iter_sheet_chunks(path: str, sheet_name: str, header_row_0: int = 0,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Tek bir sheet'i openpyxl read-only ile okur ve en fazla chunk_size satirlik
+    DataFrame parcalari dondurur. Bellek kullanimi sheet boyutundan bagimsizdir.
+    """
+    wb = _open_workbook(path)
+    try:
+        ws = wb[sheet_name]
+        yield from _chunks_from_rows(_iter_rows(ws), header_row_0, chunk_size, _sheet_width(ws))
+    finally:
+        wb.close()
+
+
+def _sheet_info(ws, auto_header: bool, preview_rows: int, chunk_size: int, progress=None) -> dict:
+    rows = _iter_rows(ws)
+
+    header_row_0 = 0
+    confidence = 0.0
+    timings = {}
+
+    if auto_header:
+        # preview ayni satir akisindan alinir, sonra akisa geri eklenir
+        preview = list(islice(rows, preview_rows))
+        rows = chain(preview, rows)
+        with Stopwatch() as header_sw:
+            preview_df = pd.DataFrame(preview) if preview else pd.DataFrame()
             header_row_0, confidence = detect_header_row(preview_df, max_rows=preview_rows)
+        timings["header_tespiti"] = header_sw
+
+    return {
+        "chunks": _chunks_from_rows(rows, header_row_0, chunk_size, _sheet_width(ws), progress),
+        "header_row": int(header_row_0 + 1),  # 1-based for humans
+        "header_confidence": float(confidence),
+        "timings": timings,
+    }
+
+
+def _closing(resource, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    # parcalar bitince (ya da birakilinca) workbook / sheet akisi kapanir
+    try:
+        yield from chunks
+    finally:
+        resource.close()
+
+
+def stream_excel_all_sheets(path: str, auto_header: bool = True, preview_rows: int = 30,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_names: list | None = None,
+                            progress=None, columns: list | None = None) -> Iterator[tuple[str, dict]]:
+    """
+    read_excel_all_sheets'in streaming karsiligi: her sheet icin
+    (sheet_name, {"chunks", "header_row", "header_confidence"}) uretir.
+    "chunks" bir sonraki sheet'e gecmeden once tuketilmelidir.
+    """
+    yield from _stream(get_engine(path), path, auto_header, preview_rows, chunk_size, sheet_names,
+                       progress, columns)
+
+
+def _stream_xlsx(path: str, auto_header: bool = True, preview_rows: int = 30,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_names: list | None = None,
+                 progress=None, columns: list | None = None) -> Iterator[tuple[str, dict]]:
+    wb = _open_workbook(path)
+    try:
+        for sheet_name in (sheet_names if sheet_names is not None else wb.sheetnames):
+            sheet_progress = partial(progress, sheet_name) if progress is not None else None
+            yield sheet_name, _sheet_info(wb[sheet_name], auto_header, preview_rows, chunk_size, sheet_progress)
+    finally:
+        wb.close()
+
+
+def _stream_pandas(path: str, auto_header: bool = True, preview_rows: int = 30,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_names: list | None = None,
+                   progress=None, columns: list | None = None) -> Iterator[tuple[str, dict]]:
+    # pandas sheet'i tek seferde parse eder; her sheet tek parca olarak akar
+    for sheet_name, info in _read_with_pandas(path, auto_header=auto_header, preview_rows=preview_rows,
+                                              sheet_names=sheet_names, progress=progress).items():
+        yield sheet_name, _as_stream(info)
+
+
+def _as_stream(info: dict) -> dict:
+    return {
+        "chunks": iter([info["df"]]),
+        "header_row": info["header_row"],
+        "header_confidence": info["header_confidence"],
+        "timings": info.get("timings", {}),
+    }
+
+
+# -----------------------------
+# Tek sheet okuma (paralel isleme icin)
+# -----------------------------
+
+def list_sheet_names(path: str) -> list[str]:
+    return list(get_engine(path).sheet_names(path))
+
+
+def _xlsx_sheet_names(path: str) -> list[str]:
+    wb = _open_workbook(path)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _pandas_sheet_names(path: str) -> list[str]:
+    with pd.ExcelFile(path) as xls:
+        return list(xls.sheet_names)
 
-        # full read using detected header
-        df = pd.read_excel(path, sheet_name=sheet_name, header=header_row_0)
-        df = df.dropna(how="all")
 
-        result[sheet_name] = {
-            "df": df,
-            "header_row": int(header_row_0 + 1),  # 1-based for humans
-            "header_confidence": float(confidence),
-        }
+def read_excel_sheet(path: str, sheet_name: str, auto_header: bool = True, preview_rows: int = 30,
+                     columns: list | None = None, progress=None) -> dict:
+    """Tek sheet'i okur; read_excel_all_sheets ile ayni {"df", "header_row", "header_confidence"}."""
+    return read_excel_all_sheets(path, auto_header=auto_header, preview_rows=preview_rows,
+                                 sheet_names=[sheet_name], progress=progress, columns=columns)[sheet_name]
 
+
+def stream_excel_sheet(path: str, sheet_name: str, auto_header: bool = True, preview_rows: int = 30,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, columns: list | None = None,
+                       progress=None) -> dict:
+    """Tek sheet icin streaming okuma; dosya "chunks" tukenince kapanir."""
+    sheets = stream_excel_all_sheets(path, auto_header=auto_header, preview_rows=preview_rows,
+                                     chunk_size=chunk_size, sheet_names=[sheet_name], progress=progress,
+                                     columns=columns)
+    try:
+        _, info = next(sheets)
+    except Exception:
+        sheets.close()
+        raise
+    info["chunks"] = _closing(sheets, info["chunks"])
+    return info
+
+
+# -----------------------------
+# Sheet parmak izleri (xlsx zip dizini)
+# -----------------------------
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _part_fp(zf, name: str) -> str:
+    try:
+        info = zf.getinfo(name)
+    except KeyError:
+        return "-"
+    return f"{info.CRC:08x}:{info.file_size}"
+
+
+def sheet_fingerprints(path: str) -> dict:
+    """
+    xlsx icin sheet_adi -> parmak izi. Sheet part'inin, sharedStrings'in ve
+    styles'in (tarih formatlari) zip dizinindeki CRC + boyutundan olusur;
+    sheet XML'leri acilmaz. xlsx degilse bos sozluk doner.
+
+    sharedStrings ve styles workbook'ta tektir ve her sheet'in izine girer: herhangi
+    bir sheet'te metin degisirse (ya da yeni stil eklenirse) tum sheet'lerin izi
+    degisir ve hepsi yeniden okunur. Sadece sayi/tarih degisen sheet'ler tek basina
+    gecersiz olur. Sheet'in kullandigi string indekslerini izlemek sheet XML'ini
+    okumayi gerektirir; bu yuzden yapilmaz.
+    """
+    import zipfile
+
+    if not _is_xlsx(path) or not zipfile.is_zipfile(path):
+        return {}
+
+    with zipfile.ZipFile(path) as zf:
+        shared = _part_fp(zf, "xl/sharedStrings.xml")
+        styles = _part_fp(zf, "xl/styles.xml")
+        return {name: f"{_part_fp(zf, part)}|ss={shared}|st={styles}"
+                for name, part in _sheet_parts(zf).items()}
+
+
+def _sheet_parts(zf) -> dict:
+    """sheet_adi -> zip icindeki sheet XML yolu (workbook.xml + rels'ten; kucuk dosyalar)."""
+    import posixpath
+    from xml.etree import ElementTree as ET
+
+    wb_root = ET.fromstring(zf.read("xl/workbook.xml"))
+    rels_root = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+
+    targets = {}
+    for rel in rels_root.iter(f"{_NS_PKG_REL}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id")] = target
+
+    return {sh.get("name"): targets.get(sh.get(f"{_NS_REL}id"), "")
+            for sh in wb_root.iter(f"{_NS_MAIN}sheet")}
+
+
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"')
+_CELL_REF_RE = re.compile(rb'<(?:\w+:)?c\s+r="([A-Z]+)\d+"')
+# <dimension> yoksa kolon sayisi ilk satirlardaki hucre referanslarindan (alt sinir)
+_SCAN_BYTES = 64 * 1024
+
+
+def _col_number(letters: bytes) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ch - 64)
+    return n
+
+
+def sheet_dimensions(path: str) -> dict:
+    """
+    sheet_adi -> {"rows", "cols", ...} boyut tahmini (sheet okunmadan; planlama ve
+    ilerleme icin). Header satiri dahil sayilardir; motor boyut veremiyorsa bos sozluk.
+    """
+    engine = get_engine(path)
+    return engine.dimensions(path) if engine.dimensions is not None else {}
+
+
+def _xlsx_dimensions(path: str) -> dict:
+    """
+    xlsx icin sheet_adi -> {"rows", "cols", "xml_bytes"}: rows/cols sheet XML'inin
+    basindaki <dimension> kaydindan (sadece ilk birkac KB okunur), kayit yoksa ya da
+    guvenilmezse None; xml_bytes sheet XML'inin acilmis boyutu (zip dizininden).
+    <dimension> yoksa cols ilk ~64 KB'taki hucre referanslarindan gelir (alt sinir),
+    rows None kalir.
+    """
+    import zipfile
+
+    if not zipfile.is_zipfile(path):
+        return {}
+
+    result = {}
+    with zipfile.ZipFile(path) as zf:
+        for name, part in _sheet_parts(zf).items():
+            rows = cols = None
+            try:
+                xml_bytes = zf.getinfo(part).file_size
+                with zf.open(part) as f:
+                    head = f.read(4096)
+            except KeyError:
+                xml_bytes, head = 0, b""
+            m = _DIMENSION_RE.search(head)
+            if m:
+                c1, r1, c2, r2 = m.groups()
+                if c2 is None:
+                    c2, r2 = c1, r1
+                rows, cols = int(r2) - int(r1) + 1, _col_number(c2) - _col_number(c1) + 1
+                if rows * cols == 1 and xml_bytes > 4096:
+                    # bazi yazicilar dolu sheet'e de "A1" yazar
+                    rows = cols = None
+            if rows is None and xml_bytes:
+                with zf.open(part) as f:
+                    refs = _CELL_REF_RE.findall(f.read(_SCAN_BYTES))
+                cols = max((_col_number(r) for r in refs), default=None)
+            result[name] = {"rows": rows, "cols": cols, "xml_bytes": xml_bytes}
     return result
+
+
+register_engine(ReaderEngine("xlsx", _xlsx_sheet_names, _stream_xlsx, dimensions=_xlsx_dimensions),
+                signatures=(b"PK\x03\x04",), extensions=(".xlsx", ".xlsm", ".xltx", ".xltm"))
+register_engine(ReaderEngine("pandas", _pandas_sheet_names, _stream_pandas, read=_read_with_pandas),
+                signatures=(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",), extensions=(".xls", ".xlsb", ".ods"))
+register_engine(ReaderEngine("csv", _lazy(".csv_reader", "csv_sheet_names"), _lazy(".csv_reader", "stream_csv"),
+                             dimensions=_lazy(".csv_reader", "csv_dimensions"), column_projection=True),
+                extensions=(".csv", ".tsv", ".tab", ".txt"))
+register_engine(ReaderEngine("parquet", _lazy(".parquet_reader", "parquet_sheet_names"),
+                             _lazy(".parquet_reader", "stream_parquet"),
+                             dimensions=_lazy(".parquet_reader", "parquet_dimensions"), column_projection=True),
+                signatures=(b"PAR1",), extensions=(".parquet", ".pq"))
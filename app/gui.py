@@ -4,8 +4,11 @@ import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+from .progress import Cancelled, CancelToken
 from .utils import ensure_dir
-from .core import generate_reports
+
+# pencere acildiktan sonra arka planda yuklenir (bkz. App._warm_imports)
+WARM_MODULES = ("pandas", "openpyxl", "jinja2", "app.core", "app.report_xlsx", "app.report_html")
 
 
 class App(tk.Tk):
@@ -38,9 +41,32 @@ class App(tk.Tk):
 
         self.out_xlsx = None
         self.out_html = None
+        self.cancel_token = None
 
         self._build_ui()
 
+        # agir import'lar pencere cizildikten sonra arka planda
+        self._warm_thread = None
+        self.after(0, self._start_warm_imports)
+
+    def _start_warm_imports(self):
+        self._warm_thread = threading.Thread(target=self._warm_imports, daemon=True)
+        self._warm_thread.start()
+
+    def _warm_imports(self):
+        import importlib
+        import time
+
+        t0 = time.perf_counter()
+        try:
+            for name in WARM_MODULES:
+                importlib.import_module(name)
+        except Exception as e:
+            # hata rapor olusturulurken tekrar ortaya cikar
+            self.after(0, self.log, f"Kutuphane yuklenemedi: {e}")
+            return
+        self.after(0, self.log, f"Kutuphaneler hazir ({time.perf_counter() - t0:.1f}s).")
+
     def _build_ui(self):
         # Üst alan
         top = ttk.Frame(self, padding=12)
@@ -79,9 +105,15 @@ class App(tk.Tk):
         self.run_btn = ttk.Button(actions, text="Raporu Olustur", command=self.run_report)
         self.run_btn.pack(side="left")
 
-        self.progress = ttk.Progressbar(actions, mode="indeterminate")
+        self.cancel_btn = ttk.Button(actions, text="Iptal", command=self.cancel_report, state="disabled")
+        self.cancel_btn.pack(side="left", padx=(8, 0))
+
+        self.progress = ttk.Progressbar(actions, mode="determinate", maximum=100)
         self.progress.pack(side="left", padx=10, fill="x", expand=True)
 
+        self.progress_lbl = ttk.Label(actions, text="", width=28)
+        self.progress_lbl.pack(side="left")
+
         ttk.Button(actions, text="Output klasorunu ac", command=self.open_output).pack(side="right")
 
         # Log alani
@@ -144,7 +176,8 @@ class App(tk.Tk):
     def pick_file(self):
         path = filedialog.askopenfilename(
             title="Excel dosyasi seç",
-            filetypes=[("Excel Files", "*.xlsx *.xls"), ("All Files", "*.*")]
+            filetypes=[("Excel / CSV / Parquet", "*.xlsx *.xlsm *.xls *.csv *.tsv *.parquet"),
+                       ("All Files", "*.*")]
         )
         if path:
             self.excel_path_var.set(path)
@@ -157,11 +190,40 @@ class App(tk.Tk):
     def set_busy(self, busy: bool):
         if busy:
             self.run_btn.config(state="disabled")
-            self.progress.start(10)
+            self.cancel_btn.config(state="normal")
+            self.progress.config(mode="determinate", value=0)
+            self.progress_lbl.config(text="")
         else:
             self.progress.stop()
+            self.progress.config(mode="determinate")
+            self.cancel_btn.config(state="disabled")
             self.run_btn.config(state="normal")
 
+    def cancel_report(self):
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.cancel_btn.config(state="disabled")
+            self.log("Iptal istendi; islem bir sonraki adimda duracak...")
+
+    def _on_progress(self, ev: dict):
+        oran = ev["oran"]
+        if oran is None:
+            # toplam satir tahmini yok (ör. dimension kaydi olmayan dosya): belirsiz mod
+            if str(self.progress.cget("mode")) != "indeterminate":
+                self.progress.config(mode="indeterminate")
+                self.progress.start(10)
+        else:
+            if str(self.progress.cget("mode")) != "determinate":
+                self.progress.stop()
+                self.progress.config(mode="determinate")
+            self.progress.config(value=oran * 100)
+        text = ev["asama"]
+        if ev["sheet_adi"]:
+            text += f" | {ev['sheet_adi']}"
+        if oran is not None:
+            text += f" | %{oran * 100:.0f}"
+        self.progress_lbl.config(text=text)
+
     def run_report(self):
         excel_path = self.excel_path_var.get().strip()
         if not excel_path or not os.path.exists(excel_path):
@@ -177,6 +239,7 @@ class App(tk.Tk):
 
         self.log_text.delete("1.0", "end")
         self.summary_lbl.config(text="Çalişiyor...")
+        self.cancel_token = CancelToken()
         self.set_busy(True)
 
         # UI donmasın diye ayrı thread
@@ -189,6 +252,9 @@ class App(tk.Tk):
 
     def _run_report_worker(self, excel_path: str, threshold: int, n_each: int):
         try:
+            # warm-up bitmediyse import kilidinde bekler, bittiyse aninda doner
+            from .core import generate_reports
+
             result = generate_reports(
                 excel_path=excel_path,
                 output_dir=self.output_dir,
@@ -196,13 +262,21 @@ class App(tk.Tk):
                 sample_threshold=threshold,
                 sample_n_each=n_each,
                 auto_header=self.future_header_detect_var.get(),
-                log_cb=lambda m: self.after(0, self.log, m)
+                log_cb=lambda m: self.after(0, self.log, m),
+                progress_cb=lambda ev: self.after(0, self._on_progress, ev),
+                cancel_token=self.cancel_token,
             )
             self.out_xlsx = result["out_xlsx"]
             self.out_html = result["out_html"]
             s = result["summary"]
             text = f"Sheet={s['sheet_sayisi']} | Satır={s['toplam_satir']} | WARN={s['warn']} | ERROR={s['error']}"
             self.after(0, self.summary_lbl.config, {"text": text})
+            failed = [f"{f}: {w['error']}" for f, w in result.get("writers", {}).items() if w["error"]]
+            if failed:
+                self.after(0, messagebox.showwarning, "Uyari", "Bazi raporlar yazilamadi:\n" + "\n".join(failed))
+        except Cancelled:
+            self.after(0, self.log, "Islem iptal edildi.")
+            self.after(0, self.summary_lbl.config, {"text": "İptal edildi."})
         except Exception as e:
             self.after(0, messagebox.showerror, "Hata", str(e))
             self.after(0, self.summary_lbl.config, {"text": "Hata oluştu."})
@@ -1,4 +1,7 @@
 from __future__ import annotations
+import re
+
+import numpy as np
 import pandas as pd
 
 
@@ -58,53 +61,112 @@ def score_row(row_values: list[str]) -> float:
     return score
 
 
+_ASCII_ALPHA = re.compile(r"[A-Za-z]")
+
+
+def _has_alpha(v: str) -> bool:
+    # ASCII icin regex (hizli yol), digerleri icin str.isalpha ile ayni kural
+    if v.isascii():
+        return _ASCII_ALPHA.search(v) is not None
+    return any(ch.isalpha() for ch in v)
+
+
+def _is_fake(v: str) -> int:
+    # score_row ile ayni kural: Unnamed..., ColumnN
+    vv = v.strip()
+    cnt = 0
+    if vv.lower().startswith("unnamed"):
+        cnt += 1
+    if vv.lower().startswith("column") and vv[6:].strip().isdigit():
+        cnt += 1
+    return cnt
+
+
+_to_str = np.frompyfunc(_cell_to_str, 1, 1)
+
+
+def _score_matrix(strs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Tum aday satirlari tek seferde skorlar (score_row ile birebir ayni aritmetik).
+    Donus: (base skorlar, satir basina dolu hucre sayisi)
+    """
+    n = strs.shape[0]
+    nonempty = strs != ""
+    non_empty = nonempty.sum(axis=1)
+
+    if strs.size:
+        # hucre ozellikleri sadece farkli string'ler icin hesaplanir, sonra matrise yayilir
+        codes, uniques = pd.factorize(strs.ravel())
+        codes = codes.reshape(strs.shape)
+        u = uniques.tolist()
+        alpha_u = np.array([_has_alpha(v) for v in u], dtype=bool)
+        len_u = np.array([len(v) for v in u], dtype=np.int64)
+        fake_u = np.array([_is_fake(v) if v != "" else 0 for v in u], dtype=np.int64)
+
+        text_like = (alpha_u[codes] & nonempty).sum(axis=1)
+        total_len = len_u[codes].sum(axis=1)
+        fake_cnt = fake_u[codes].sum(axis=1)
+    else:
+        text_like = total_len = fake_cnt = np.zeros(n, dtype=np.int64)
+
+    uniq = np.array([len(set(row[mask].tolist())) for row, mask in zip(strs, nonempty)], dtype=np.int64)
+
+    safe = np.maximum(non_empty, 1)
+    text_ratio = text_like / safe
+    uniq_ratio = uniq / safe
+    avg_len = total_len / safe
+    length_penalty = np.where(avg_len > 30, (avg_len - 30) / 30.0, 0.0)
+    fake_ratio = fake_cnt / safe
+
+    score = np.zeros(n, dtype=np.float64)
+    score += non_empty * 2.0
+    score += text_ratio * 10.0
+    score += uniq_ratio * 6.0
+    score -= length_penalty * 6.0
+    score -= fake_ratio * 18.0  # sahte headerlari sert dusur
+
+    score = np.where(non_empty == 0, -1e9, score)
+    return score, non_empty
+
+
 def detect_header_row(preview_df: pd.DataFrame, max_rows: int = 30) -> tuple[int, float]:
     n = min(len(preview_df), max_rows)
     if n == 0:
         return 0, 0.0
 
-    scores = []
+    # hucre matrisi bir kez string'e cevrilir; tum satirlar dizi islemleriyle skorlanir
+    # (satirlar iloc ile alinir ki hucre tipleri eski satir bazli okuma ile ayni olsun)
+    cells = np.empty((n, preview_df.shape[1]), dtype=object)
+    for i in range(n):
+        cells[i, :] = preview_df.iloc[i].tolist()
+    strs = _to_str(cells).astype(object) if cells.size else cells
+    base, counts = _score_matrix(strs)
 
-    def non_empty_count(row) -> int:
-        cnt = 0
-        for x in row:
-            s = _cell_to_str(x)
-            if s != "":
-                cnt += 1
-        return cnt
+    idx = np.arange(n)
 
-    for i in range(n):
-        row = preview_df.iloc[i].tolist()
-        row_strs = [_cell_to_str(x) for x in row]
-        base = score_row(row_strs)
-
-        # follow-up: header altinda data gelmeli, bos satir gelirse penalti
-        next_rows = []
-        for j in range(i + 1, min(n, i + 4)):  # sonraki 3 satir
-            next_rows.append(non_empty_count(preview_df.iloc[j].tolist()))
-        after_mean = (sum(next_rows) / len(next_rows)) if next_rows else 0.0
-
-        # bos run: headerdan sonra ardarda tamamen bos satir var mi?
-        empty_run = 0
-        for j in range(i + 1, n):
-            if non_empty_count(preview_df.iloc[j].tolist()) == 0:
-                empty_run += 1
-            else:
-                break
-
-        penalty = 0.0
-        if after_mean < 2:
-            penalty += 8.0
-        if empty_run >= 2:
-            penalty += 12.0
-
-        scores.append(base - penalty)
-
-    best_i = int(max(range(len(scores)), key=lambda k: scores[k]))
-    best_score = scores[best_i]
-
-    sorted_scores = sorted(scores)
-    mid = sorted_scores[len(sorted_scores) // 2]
+    # follow-up: header altinda data gelmeli (sonraki 3 satirin dolu ortalamasi)
+    csum = np.concatenate([[0], np.cumsum(counts)])
+    end = np.minimum(n, idx + 4)
+    span = end - (idx + 1)
+    after_sum = csum[end] - csum[np.minimum(idx + 1, n)]
+    after_mean = np.where(span > 0, after_sum / np.maximum(span, 1), 0.0)
+
+    # bos run: headerdan sonra ardarda tamamen bos satir sayisi (suffix hesap)
+    next_filled = np.where(counts > 0, idx, n)
+    next_filled = np.minimum.accumulate(next_filled[::-1])[::-1]
+    nf_after = np.append(next_filled, n)[idx + 1]
+    empty_run = nf_after - (idx + 1)
+
+    penalty = np.zeros(n, dtype=np.float64)
+    penalty += np.where(after_mean < 2, 8.0, 0.0)
+    penalty += np.where(empty_run >= 2, 12.0, 0.0)
+
+    scores = base - penalty
+
+    best_i = int(np.argmax(scores))
+    best_score = float(scores[best_i])
+
+    mid = float(np.sort(scores)[n // 2])
     gap = best_score - mid
 
     if best_score <= 0:
@@ -1,15 +1,8 @@
 from __future__ import annotations
 import os
-import pandas as pd
 
 from .ui import pick_excel_file
 from .utils import ensure_dir, now_stamp
-from .excel_reader import read_excel_all_sheets
-from .sampler import sample_df
-from .profiler import profile_columns
-from .quality_checks import quality_warnings, duplicate_analysis
-from .report_xlsx import write_report_xlsx
-from .report_html import write_report_html
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
 TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
@@ -22,6 +15,16 @@ def run():
         print("Dosya seçilmedi. Çikiliyor.")
         return
 
+    # agir kutuphaneler dosya secildikten sonra yuklenir (dialog hemen acilsin)
+    import pandas as pd
+
+    from .excel_reader import read_excel_all_sheets
+    from .sampler import sample_df
+    from .profiler import profile_columns
+    from .quality_checks import quality_warnings, duplicate_analysis
+    from .report_xlsx import write_report_xlsx
+    from .report_html import write_report_html
+
     stamp = now_stamp()
     base_name = os.path.splitext(os.path.basename(path))[0]
     out_xlsx = os.path.join(OUTPUT_DIR, f"{base_name}_report_{stamp}.xlsx")
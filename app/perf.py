@@ -0,0 +1,217 @@
+"""
+Asama bazli olcum: duvar saati, CPU (thread) suresi, RSS bellek ve satir/sn.
+
+Bellek tracemalloc yerine RSS orneklenerek olculur (tracemalloc her tahsisi
+izledigi icin isi birkac kat yavaslatir). Ornekleyici thread sadece bir asama
+acikken ~50 ms'de bir RSS okur; uretimde acik birakilabilir.
+"""
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PERF_COLUMNS = ["sheet_adi", "asama", "sure_sn", "cpu_sn", "satir", "satir_per_sn", "rss_mb", "rss_tepe_mb"]
+
+_SAMPLE_INTERVAL = 0.05
+
+
+def _rss_reader():
+    try:
+        import psutil
+        proc = psutil.Process()
+        return lambda: proc.memory_info().rss
+    except ImportError:
+        pass
+
+    if os.path.exists("/proc/self/statm"):
+        page = os.sysconf("SC_PAGE_SIZE")
+
+        def read_statm():
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * page
+        return read_statm
+
+    try:
+        import resource
+    except ImportError:
+        return lambda: None
+    # anlik deger yok; surec boyunca tepe RSS (Linux KB, macOS byte)
+    scale = 1 if sys.platform == "darwin" else 1024
+    return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class _RssMonitor:
+    """Acik asamalar boyunca tepe RSS'i izleyen tek daemon thread (process basina)."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.read = _rss_reader()
+        self._lock = threading.Lock()
+        self._active = {}  # token -> tepe
+        self._wake = threading.Event()
+        self._thread = None
+        self._next = 0
+
+    def start(self) -> int:
+        rss = self.read() or 0
+        with self._lock:
+            self._next += 1
+            token = self._next
+            self._active[token] = rss
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rss-monitor", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return token
+
+    def stop(self, token: int) -> tuple[int, int]:
+        rss = self.read() or 0
+        with self._lock:
+            peak = max(self._active.pop(token, 0), rss)
+            if not self._active:
+                self._wake.clear()
+        return rss, peak
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            time.sleep(_SAMPLE_INTERVAL)
+            rss = self.read() or 0
+            with self._lock:
+                for token, peak in self._active.items():
+                    if rss > peak:
+                        self._active[token] = rss
+
+
+_MONITOR = None
+_MONITOR_LOCK = threading.Lock()
+
+
+def _monitor() -> _RssMonitor:
+    global _MONITOR
+    with _MONITOR_LOCK:
+        if _MONITOR is None or _MONITOR.pid != os.getpid():
+            # fork sonrasi thread kopyalanmaz; yeni process kendi monitorunu kurar
+            _MONITOR = _RssMonitor()
+    return _MONITOR
+
+
+class Stopwatch:
+    """
+    Birden fazla aralikta biriken olcum (ör. streaming'de parca parca okuma).
+    with sw: ... bloklari sure/CPU/tepe RSS'i toplar.
+    """
+
+    def __init__(self, cpu_clock=time.thread_time):
+        # thread_time: paralel yazicilar birbirinin CPU'sunu saymasin;
+        # tum isi kapsayan olcumlerde time.process_time verilir
+        self.cpu_clock = cpu_clock
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rss = 0
+        self.rss_peak = 0
+        self._start = None
+        self._token = None
+
+    def include(self, other: "Stopwatch") -> "Stopwatch":
+        """Ayri olculmus bir araligi bu olcume ekler."""
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.rss = other.rss if other.rss else self.rss
+        self.rss_peak = max(self.rss_peak, other.rss_peak)
+        return self
+
+    def exclude(self, other: "Stopwatch") -> "Stopwatch":
+        """Ic ice olculmus bir alt asamanin suresini cikarir."""
+        self.wall = max(0.0, self.wall - other.wall)
+        self.cpu = max(0.0, self.cpu - other.cpu)
+        return self
+
+    def start(self) -> "Stopwatch":
+        self._token = _monitor().start()
+        self._start = (time.perf_counter(), self.cpu_clock())
+        return self
+
+    def stop(self) -> "Stopwatch":
+        wall0, cpu0 = self._start
+        self.wall += time.perf_counter() - wall0
+        self.cpu += self.cpu_clock() - cpu0
+        self.rss, peak = _monitor().stop(self._token)
+        self.rss_peak = max(self.rss_peak, peak)
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+class PerfRecorder:
+    """
+    Asama olaylarini toplar; callback verilirse her olay tamamlaninca
+    (sozluk olarak) callback'e gider.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.events = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, stage: str, sheet: str = "", rows: int | None = None):
+        """with perf.stage("profil", sheet) as ev: ... ; ev["satir"] sonradan da verilebilir."""
+        ev = {"satir": rows}
+        sw = Stopwatch()
+        with sw:
+            yield ev
+        self.add(stage, sheet, sw, rows=ev["satir"])
+
+    def add(self, stage: str, sheet: str, sw: Stopwatch, rows: int | None = None) -> dict:
+        ev = {
+            "sheet_adi": sheet,
+            "asama": stage,
+            "sure_sn": round(sw.wall, 4),
+            "cpu_sn": round(sw.cpu, 4),
+            "satir": None if rows is None else int(rows),
+            "satir_per_sn": round(rows / sw.wall, 1) if rows and sw.wall > 0 else None,
+            "rss_mb": round(sw.rss / 2 ** 20, 1) if sw.rss else None,
+            "rss_tepe_mb": round(sw.rss_peak / 2 ** 20, 1) if sw.rss_peak else None,
+        }
+        self.extend([ev])
+        return ev
+
+    def extend(self, events: list) -> None:
+        """Baska bir recorder'in (ör. worker process) olaylarini ekler."""
+        for ev in events:
+            with self._lock:
+                self.events.append(ev)
+            if callable(self.callback):
+                self.callback(dict(ev))
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.events, columns=PERF_COLUMNS)
+
+    def summary(self) -> list:
+        """Asama basina toplam (HTML paneli icin); sirasi ilk gorulme sirasi."""
+        out = {}
+        for ev in self.events:
+            s = out.setdefault(ev["asama"], {"asama": ev["asama"], "sure_sn": 0.0, "cpu_sn": 0.0,
+                                             "satir": 0, "rss_tepe_mb": None, "adet": 0})
+            s["sure_sn"] += ev["sure_sn"]
+            s["cpu_sn"] += ev["cpu_sn"]
+            s["satir"] += ev["satir"] or 0
+            s["adet"] += 1
+            if ev["rss_tepe_mb"] is not None:
+                s["rss_tepe_mb"] = max(s["rss_tepe_mb"] or 0.0, ev["rss_tepe_mb"])
+        rows = []
+        for s in out.values():
+            s["sure_sn"] = round(s["sure_sn"], 3)
+            s["cpu_sn"] = round(s["cpu_sn"], 3)
+            s["satir_per_sn"] = round(s["satir"] / s["sure_sn"], 1) if s["satir"] and s["sure_sn"] > 0 else None
+            rows.append(s)
+        return rows
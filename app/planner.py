@@ -0,0 +1,153 @@
+"""
+Sheet bazli calisma plani: sheet yuklenmeden once boyutu tahmin edilir ve
+bellek butcesine gore uc plandan biri secilir.
+
+- bellek_tam:          sheet DataFrame olarak okunur, tum satirlar profillenir
+- streaming_tam:       parca parca okunur, tum satirlar sinirli bellekli ozetlerle
+                       (HLL / Space-Saving / KLL) profillenir; DataFrame tutulmaz
+- streaming_ornekleme: parca parca okunur, sadece butceye sigan ornek tutulur
+
+Boyut xlsx <dimension> kaydindan (satir x kolon), kayit yoksa sheet XML'inin
+boyutundan; parquet'te footer metadata'sindan, csv'de dosyanin ilk 64 KB'lik
+orneginden gelir. Boyut bilinmiyorsa (ör. .xls) elle verilen streaming /
+sample_threshold ayarlari kullanilir (bellek_esik / streaming_esik).
+"""
+from __future__ import annotations
+
+PLAN_IN_MEMORY = "bellek_tam"
+PLAN_STREAM_EXACT = "streaming_tam"
+PLAN_STREAM_SAMPLE = "streaming_ornekleme"
+# elle ayar: satir sayisi sample_threshold'u asarsa orneklenir (eski davranis)
+PLAN_MANUAL_MEMORY = "bellek_esik"
+PLAN_MANUAL_STREAM = "streaming_esik"
+
+PLAN_MODES = ("auto", "manual")
+
+# Olculmus tepe degerler (pandas 3 / openpyxl, 0.5-1.6M hucre): okuma sirasinda
+# satir listeleri + DataFrame ~80-115 byte/hucre; pay birakilir.
+IN_MEMORY_BYTES_PER_CELL = 120
+# streaming_tam kolon basina sabit bellekli ozet kullanir (exact set/Counter yuksek
+# kardinaliteli metinde hucre basina ~250 byte tutar, bellekte okumadan fazla)
+STREAM_PROFILE_OPTIONS = {"distinct_mode": "hll", "topk_mode": "sketch", "quantile_mode": "kll"}
+# HLL (p=14) 16 KB + Space-Saving + KLL; pay birakilir
+SKETCH_BYTES_PER_COLUMN = 64 * 1024
+# DuplicateIndex: satir basina 8 byte hash, birlestirme sirasinda gecici kopya
+DUP_BYTES_PER_ROW = 16
+# <dimension> yoksa: sheet XML'i dolu hucre basina ~15-45 byte; dusuk tutulur ki
+# bos hucreli sheet'lerde hucre sayisi az tahmin edilmesin
+XML_BYTES_PER_CELL = 20
+
+# sheet_dimensions "source" -> plan_nedeni'nde gorunen kaynak
+SOURCE_LABELS = {"dimension": "dimension", "xml": "XML boyutu", "metadata": "parquet metadata",
+                 "ornek": "ilk 64 KB ornegi"}
+
+DEFAULT_BUDGET_FRACTION = 0.5
+FALLBACK_BUDGET_MB = 2048
+
+
+def available_memory_bytes() -> int | None:
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def memory_budget_bytes(memory_budget_mb: float | None = None, workers: int = 1) -> int:
+    """Verilmezse bos RAM'in yarisi (bilinmiyorsa 2 GB); paralel isciler arasinda bolunur."""
+    if memory_budget_mb is None:
+        available = available_memory_bytes()
+        budget = available * DEFAULT_BUDGET_FRACTION if available else FALLBACK_BUDGET_MB * 2 ** 20
+    else:
+        budget = float(memory_budget_mb) * 2 ** 20
+    return int(budget / max(1, int(workers or 1)))
+
+
+def estimate_cells(dims: dict | None) -> tuple[int | None, int | None, str]:
+    """(hucre, kolon, kaynak); kaynak SOURCE_LABELS anahtari ya da ""."""
+    if not dims:
+        return None, None, ""
+    if dims.get("rows") is not None and dims.get("cols") is not None:
+        return dims["rows"] * dims["cols"], dims["cols"], dims.get("source", "dimension")
+    if dims.get("xml_bytes"):
+        return max(1, dims["xml_bytes"] // XML_BYTES_PER_CELL), dims.get("cols"), "xml"
+    return None, None, ""
+
+
+def _mb(n: float) -> str:
+    return f"{n / 2 ** 20:,.0f} MB"
+
+
+def plan_sheet(dims: dict | None, budget: int, chunk_size: int, sample_n_each: int,
+               streaming: bool = False, sample_threshold: int = 200_000) -> dict:
+    """
+    Donus: {"plan", "plan_nedeni", "tahmini_hucre", "tahmini_bellek_mb",
+            "streaming", "sample_threshold", "profile_options"}; sample_threshold None =
+    ornekleme yok; profile_options None degilse kullanicinin profil ayarlarinin ustune yazilir.
+    """
+    cells, cols, source = estimate_cells(dims)
+    if cells is None:
+        return {
+            "plan": PLAN_MANUAL_STREAM if streaming else PLAN_MANUAL_MEMORY,
+            "plan_nedeni": f"boyut bilgisi yok; elle ayar (esik={sample_threshold} satir)",
+            "tahmini_hucre": None,
+            "tahmini_bellek_mb": None,
+            "streaming": bool(streaming),
+            "sample_threshold": sample_threshold,
+            "profile_options": None,
+        }
+
+    in_memory = cells * IN_MEMORY_BYTES_PER_CELL
+    # bir parca her zaman bellekte; kolon sayisi bilinmiyorsa tum sheet tek parca sayilir
+    chunk_cells = min(cells, chunk_size * cols) if cols else cells
+    chunk = chunk_cells * IN_MEMORY_BYTES_PER_CELL
+    rows = cells // cols if cols else cells
+    stream_exact = (cols or 1) * SKETCH_BYTES_PER_COLUMN + rows * DUP_BYTES_PER_ROW + chunk
+    src = SOURCE_LABELS.get(source, source)
+    info = {"tahmini_hucre": int(cells), "tahmini_bellek_mb": round(in_memory / 2 ** 20, 1),
+            "profile_options": None}
+
+    if in_memory <= budget:
+        return {**info, "plan": PLAN_IN_MEMORY, "streaming": False, "sample_threshold": None,
+                "plan_nedeni": f"~{cells:,} hucre ({src}), tahmini {_mb(in_memory)} <= butce {_mb(budget)}"}
+    if stream_exact <= budget:
+        return {**info, "plan": PLAN_STREAM_EXACT, "streaming": True, "sample_threshold": None,
+                "profile_options": dict(STREAM_PROFILE_OPTIONS),
+                "plan_nedeni": f"~{cells:,} hucre ({src}), tahmini {_mb(in_memory)} > butce {_mb(budget)}; "
+                               f"tum satirlar parca parca, sinirli ozetlerle ({_mb(stream_exact)})"}
+
+    # ornek: butceye sigan satir kadar tampon, en az head/rastgele/tail ornekleri
+    row_bytes = (cols or max(1, cells // max(1, chunk_size))) * IN_MEMORY_BYTES_PER_CELL
+    threshold = max(3 * sample_n_each, int(max(0, budget - chunk) // row_bytes))
+    return {**info, "plan": PLAN_STREAM_SAMPLE, "streaming": True, "sample_threshold": threshold,
+            "plan_nedeni": f"~{cells:,} hucre ({src}), tam profil bile butceyi ({_mb(budget)}) asiyor "
+                           f"({_mb(stream_exact)}); {threshold:,} satir ustu orneklenir"}
+
+
+def plan_workbook(dimensions: dict, sheet_names: list, budget: int, chunk_size: int, sample_n_each: int,
+                  streaming: bool = False, sample_threshold: int = 200_000, mode: str = "auto") -> dict:
+    """sheet_adi -> plan (plan_sheet); mode="manual" boyuta bakmaz."""
+    if mode not in PLAN_MODES:
+        raise ValueError(f"Bilinmeyen plan modu: {mode}")
+    plans = {}
+    for sn in sheet_names:
+        dims = dimensions.get(sn) if mode == "auto" else None
+        plans[sn] = plan_sheet(dims, budget, chunk_size, sample_n_each, streaming, sample_threshold)
+        if mode == "manual":
+            plans[sn]["plan_nedeni"] = f"elle ayar (streaming={streaming}, esik={sample_threshold} satir)"
+    return plans
+
+
+def describe_plans(plans: dict) -> str:
+    """HTML sampling_note icin kisa ozet."""
+    parts = [f"{sn}: {p['plan']} ({p['plan_nedeni']})" for sn, p in plans.items()]
+    return "Calisma plani — " + "; ".join(parts) if parts else ""
+
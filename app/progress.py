@@ -0,0 +1,125 @@
+"""
+Ilerleme bildirimi ve is birligine dayali iptal.
+
+generate_reports(progress_cb=..., cancel_token=...) ile kullanilir:
+progress_cb her olayda {"asama", "sheet_adi", "satir", "toplam_satir", "oran"}
+sozlugunu alir; cancel_token.cancel() cagrildiginda is bir sonraki parca ya da
+asama sinirinda Cancelled ile durur.
+"""
+from __future__ import annotations
+import threading
+
+# toplam ilerlemede sheet isleme payi; kalan kisim rapor yazimi
+PROCESS_WEIGHT = 0.9
+
+
+class Cancelled(Exception):
+    """Calisma kullanici tarafindan iptal edildi."""
+
+
+class CancelToken:
+    """
+    Thread-safe iptal bayragi; GUI thread'i cancel() der, is thread'i check() eder.
+    event verilirse (multiprocessing.Event) ayni bayrak worker process'lerde de okunur.
+    """
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise Cancelled("Islem iptal edildi.")
+
+
+class ProgressTracker:
+    """
+    Satir bazli ilerleme. Toplam satir tahmini sheet_dimensions'tan (xlsx <dimension>,
+    parquet metadata, csv ornegi) gelir; tahmin yoksa oran None doner (belirsiz ilerleme).
+    """
+
+    def __init__(self, callback=None, token: CancelToken | None = None):
+        self.callback = callback
+        self.token = token
+        self.estimates = {}   # sheet -> tahmini veri satiri
+        self.done = {}        # sheet -> islenen satir
+        self.writers_total = 0
+        self.writers_done = 0
+        self._stage = ""
+        self._sheet = ""
+        self._lock = threading.Lock()
+
+    def set_estimates(self, dimensions: dict, sheet_names=None) -> None:
+        names = list(dimensions) if sheet_names is None else list(sheet_names)
+        for sn in names:
+            rows = (dimensions.get(sn) or {}).get("rows")
+            # dimension header satirini da icerir
+            self.estimates[sn] = max(0, rows - 1) if rows is not None else None
+
+    @property
+    def total(self) -> int | None:
+        if not self.estimates or any(v is None for v in self.estimates.values()):
+            return None
+        return int(sum(self.estimates.values()))
+
+    def check(self) -> None:
+        if self.token is not None:
+            self.token.check()
+
+    def stage(self, stage: str, sheet: str = "") -> None:
+        """Asama degisimi: once iptal kontrolu, sonra bildirim."""
+        self.check()
+        self._stage, self._sheet = stage, sheet
+        self._emit()
+
+    def rows(self, sheet: str, n: int) -> None:
+        """sheet'te simdiye kadar islenen satir sayisi (artan)."""
+        self.check()
+        with self._lock:
+            self.done[sheet] = int(n)
+        self._sheet = sheet
+        self._emit()
+
+    def finish_sheet(self, sheet: str, n: int | None = None) -> None:
+        """Sheet bitti: tahmin gercek sayiya cekilir (dimension kaydi eksik/yanlis olabilir)."""
+        with self._lock:
+            if n is not None:
+                self.done[sheet] = int(n)
+            self.estimates[sheet] = self.done.get(sheet, 0)
+        self._sheet = sheet
+        self._emit()
+
+    def writer_done(self) -> None:
+        with self._lock:
+            self.writers_done += 1
+        self._emit()
+
+    def ratio(self) -> float | None:
+        total = self.total
+        processed = sum(self.done.values())
+        if self.writers_total and self.writers_done >= self.writers_total:
+            return 1.0
+        if total is None:
+            return None
+        part = min(1.0, processed / total) if total else 1.0
+        ratio = part * PROCESS_WEIGHT
+        if self.writers_total:
+            ratio += (1 - PROCESS_WEIGHT) * self.writers_done / self.writers_total
+        return round(min(ratio, 1.0), 4)
+
+    def _emit(self) -> None:
+        if not callable(self.callback):
+            return
+        self.callback({
+            "asama": self._stage,
+            "sheet_adi": self._sheet,
+            "satir": int(sum(self.done.values())),
+            "toplam_satir": self.total,
+            "oran": self.ratio(),
+        })
@@ -1,8 +1,13 @@
 from __future__ import annotations
 import pandas as pd
 
-def quality_warnings(sheet_name: str, df: pd.DataFrame, col_profile: pd.DataFrame) -> pd.DataFrame:
+from .duplicates import DuplicateIndex
+
+def quality_warnings(sheet_name: str, df: pd.DataFrame, col_profile: pd.DataFrame,
+                     n_rows: int | None = None) -> pd.DataFrame:
+    # n_rows: df tum sheet degilse (streaming tam profil) gercek satir sayisi
     warnings = []
+    n_rows = len(df) if n_rows is None else n_rows
 
     for _, r in col_profile.iterrows():
         miss = r["bos_oran"]
@@ -15,14 +20,21 @@ def quality_warnings(sheet_name: str, df: pd.DataFrame, col_profile: pd.DataFram
         elif miss >= 95.0:
             warnings.append((sheet_name, "WARN", "Neredeyse boş kolon", col, f"%{miss} boş", miss))
 
-        if dtype_label == "text" and uniq_ratio >= 90.0 and len(df) > 50:
-            warnings.append((sheet_name, "INFO", "Çok yüksek unique orani", col, f"%{uniq_ratio} unique (free-text olabilir)", uniq_ratio))
+        if dtype_label == "text" and uniq_ratio >= 90.0 and n_rows > 50:
+            scope = " (ornekte)" if r.get("unique_kaynagi") == "ornek" else ""
+            warnings.append((sheet_name, "INFO", "Çok yüksek unique orani", col, f"%{uniq_ratio} unique{scope} (free-text olabilir)", uniq_ratio))
 
     return pd.DataFrame(warnings, columns=["sheet_adi","seviye","konu","kolon_adi","detay","etkilenen_oran"])
 
-def duplicate_analysis(sheet_name: str, df: pd.DataFrame) -> pd.DataFrame:
-    n = len(df)
-    dup_count = int(df.duplicated().sum()) if n else 0
+def duplicate_analysis(sheet_name: str, df: pd.DataFrame, confirm: bool = False) -> pd.DataFrame:
+    index = DuplicateIndex(confirm=confirm).update(df)
+    if index.needs_confirm:
+        index.confirm_rows([df])
+    return duplicate_report(sheet_name, index)
+
+def duplicate_report(sheet_name: str, index: DuplicateIndex) -> pd.DataFrame:
+    n = index.rows
+    dup_count = int(index.dup_count)
     dup_ratio = (dup_count / n * 100) if n else 0.0
     return pd.DataFrame([{
         "sheet_adi": sheet_name,
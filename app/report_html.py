@@ -1,17 +1,44 @@
 from __future__ import annotations
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 import os
+import threading
 
-def write_report_html(template_dir: str, template_name: str, out_path: str, context: dict) -> None:
+WRITE_BUFFER_BYTES = 256 * 1024
+
+# template klasoru -> Environment (derlenmis template'ler env icinde cache'lenir)
+_ENVS: dict = {}
+_ENVS_LOCK = threading.Lock()
+_BYTECODE_CACHE = None
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    # kullaniciya ozel temp klasoru; yeni process'ler template'i yeniden derlemez
+    global _BYTECODE_CACHE
+    if _BYTECODE_CACHE is None:
+        _BYTECODE_CACHE = FileSystemBytecodeCache()
+    return _BYTECODE_CACHE
+
+
+def get_environment(template_dir: str) -> Environment:
     template_dir = os.path.abspath(template_dir)
+    with _ENVS_LOCK:
+        env = _ENVS.get(template_dir)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=True,
+                bytecode_cache=_bytecode_cache(),
+                auto_reload=True,  # template degisirse mtime ile fark edilir
+            )
+            _ENVS[template_dir] = env
+    return env
 
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=True
-    )
-    template = env.get_template(template_name)
-    html = template.render(**context)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
+def write_report_html(template_dir: str, template_name: str, out_path: str, context: dict) -> None:
+    template = get_environment(template_dir).get_template(template_name)
+
+    # sayfa tek string olarak kurulmaz; parcalar tampondan dosyaya akar
+    with open(out_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
+        f.writelines(template.generate(**context))
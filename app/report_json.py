@@ -0,0 +1,26 @@
+from __future__ import annotations
+import json
+
+import pandas as pd
+
+
+def _records(df: pd.DataFrame) -> list:
+    # NaN -> null, tarihler ISO
+    return json.loads(df.to_json(orient="records", date_format="iso", force_ascii=False)) if len(df.columns) else []
+
+
+def write_report_json(out_path: str,
+                      genel_ozet: pd.DataFrame,
+                      sheet_list: pd.DataFrame,
+                      col_profile: pd.DataFrame,
+                      warnings_df: pd.DataFrame,
+                      dup_df: pd.DataFrame) -> None:
+    payload = {
+        "genel_ozet": _records(genel_ozet),
+        "sheet_listesi": _records(sheet_list),
+        "kolon_profili": _records(col_profile),
+        "veri_kalite_uyarilari": _records(warnings_df),
+        "duplicate_analizi": _records(dup_df),
+    }
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1)
@@ -0,0 +1,180 @@
+"""
+Makine tarafindan okunacak rapor ciktilari: Parquet / Arrow IPC (pyarrow gerekir)
+ve NDJSON.
+
+Tablolar ve kolonlari REPORT_SCHEMA'da sabittir; her cikti schema_version'i
+tasir. Kolon eklemek/cikarmak ya da tip degistirmek REPORT_SCHEMA_VERSION'i
+arttirir. Profilde semada olmayan ek kolonlar (ör. ozel quantile listesi) sona
+"string" olarak eklenir; semadaki ama profilde olmayan kolonlar null gelir.
+"""
+from __future__ import annotations
+import json
+import os
+
+import pandas as pd
+
+REPORT_SCHEMA_NAME = "excel-data-profiler-report"
+REPORT_SCHEMA_VERSION = 3  # 2: sheet_listesi.plan / plan_nedeni, 3: kolon_profili.unique_kaynagi
+
+# min/max/pN sayisal kolonlarda sayi, tarih kolonlarinda YYYY-MM-DD tasir;
+# tek tipte kalsin diye metin olarak yazilir (tahmini_tip'e gore cevrilebilir)
+REPORT_SCHEMA = {
+    "genel_ozet": [
+        ("dosya", "string"),
+        ("sheet_sayisi", "int64"),
+        ("toplam_satir", "int64"),
+        ("toplam_kolon", "int64"),
+        ("benzersiz_kolon", "int64"),
+        ("warn_sayisi", "int64"),
+        ("error_sayisi", "int64"),
+        ("ornekleme", "string"),
+    ],
+    "sheet_listesi": [
+        ("sheet_adi", "string"),
+        ("satir_sayisi", "int64"),
+        ("sutun_sayisi", "int64"),
+        ("header_satiri", "int64"),
+        ("header_confidence", "float64"),
+        ("yeniden_kullanildi", "string"),
+        ("plan", "string"),
+        ("plan_nedeni", "string"),
+    ],
+    "kolon_profili": [
+        ("sheet_adi", "string"),
+        ("kolon_adi", "string"),
+        ("tahmini_tip", "string"),
+        ("dolu_sayi", "int64"),
+        ("bos_sayi", "int64"),
+        ("bos_oran", "float64"),
+        ("unique_sayi", "int64"),
+        ("unique_oran", "float64"),
+        ("unique_hata_payi", "float64"),
+        ("unique_kaynagi", "string"),
+        ("min", "string"),
+        ("max", "string"),
+        ("ortalama", "float64"),
+        ("median", "float64"),
+        ("p1", "string"),
+        ("p5", "string"),
+        ("p25", "string"),
+        ("p75", "string"),
+        ("p95", "string"),
+        ("p99", "string"),
+        ("en_sik_1", "string"),
+        ("en_sik_1_sayi", "int64"),
+        ("en_sik_1_alt_sinir", "int64"),
+        ("en_sik_2", "string"),
+        ("en_sik_2_sayi", "int64"),
+        ("en_sik_2_alt_sinir", "int64"),
+        ("en_sik_3", "string"),
+        ("en_sik_3_sayi", "int64"),
+        ("en_sik_3_alt_sinir", "int64"),
+        ("ornek_degerler", "string"),
+    ],
+    "veri_kalite_uyarilari": [
+        ("sheet_adi", "string"),
+        ("seviye", "string"),
+        ("konu", "string"),
+        ("kolon_adi", "string"),
+        ("detay", "string"),
+        ("etkilenen_oran", "float64"),
+    ],
+    "duplicate_analizi": [
+        ("sheet_adi", "string"),
+        ("tam_satir_duplicate_sayisi", "int64"),
+        ("tam_satir_duplicate_oran", "float64"),
+    ],
+}
+
+_PANDAS_DTYPES = {"string": "string", "int64": "Int64", "float64": "Float64"}
+_ARROW_TYPES = {"string": lambda pa: pa.string(), "int64": lambda pa: pa.int64(),
+                "float64": lambda pa: pa.float64()}
+
+
+def _to_text(v):
+    if v is None or (isinstance(v, float) and v != v) or v is pd.NaT:
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v)) if abs(v) < 2 ** 53 else repr(v)
+    return str(v)
+
+
+def conform(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame'i tablonun semasina getirir (kolon sirasi + nullable tipler)."""
+    schema = REPORT_SCHEMA[table]
+    known = [c for c, _ in schema]
+    out = {}
+    for col, typ in schema:
+        if col in df.columns:
+            s = df[col]
+            if typ == "string":
+                s = s.map(_to_text, na_action="ignore")
+            elif typ == "int64":
+                s = pd.to_numeric(s, errors="coerce").round()
+            else:
+                s = pd.to_numeric(s, errors="coerce")
+            out[col] = s.astype(_PANDAS_DTYPES[typ])
+        else:
+            out[col] = pd.Series(pd.NA, index=df.index, dtype=_PANDAS_DTYPES[typ])
+    for col in df.columns:
+        if col not in known:
+            out[col] = df[col].map(_to_text, na_action="ignore").astype("string")
+    return pd.DataFrame(out, index=df.index).reset_index(drop=True)
+
+
+def report_tables(genel_ozet, sheet_list, col_profile, warnings_df, dup_df) -> dict:
+    frames = dict(zip(REPORT_SCHEMA, (genel_ozet, sheet_list, col_profile, warnings_df, dup_df)))
+    return {name: conform(name, df) for name, df in frames.items()}
+
+
+def _metadata(table: str) -> dict:
+    return {
+        "schema": REPORT_SCHEMA_NAME,
+        "schema_version": str(REPORT_SCHEMA_VERSION),
+        "table": table,
+    }
+
+
+def write_report_arrow(out_dir: str, tables: dict, fmt: str = "parquet") -> None:
+    """
+    Her tablo ayri dosya: <out_dir>/<tablo>.parquet ya da .arrow (Arrow IPC).
+    Sema metadata'si dosyaya gomulur.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Parquet/Arrow ciktisi icin pyarrow gerekli (pip install pyarrow).") from e
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, df in tables.items():
+        # arrow tipleri semadan: pandas surumune gore string/large_string degismesin
+        types = dict(REPORT_SCHEMA.get(name, []))
+        schema = pa.schema([(c, _ARROW_TYPES[types.get(c, "string")](pa)) for c in df.columns])
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_metadata(name)})
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, os.path.join(out_dir, f"{name}.parquet"))
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, os.path.join(out_dir, f"{name}.arrow"), compression="uncompressed")
+
+
+def write_report_ndjson(out_path: str, tables: dict) -> None:
+    """
+    Ilk satir sema kaydi, sonra her tablo satiri bir JSON nesnesi:
+        {"table": "kolon_profili", "sheet_adi": ..., ...}
+    """
+    with open(out_path, "w", encoding="utf-8") as f:
+        meta = dict(_metadata("_meta"), schema_version=REPORT_SCHEMA_VERSION,
+                    tables={t: [c for c, _ in cols] for t, cols in REPORT_SCHEMA.items()})
+        meta["table"] = "_meta"
+        f.write(json.dumps(meta, ensure_ascii=False) + "\n")
+        for name, df in tables.items():
+            if not len(df):
+                continue
+            body = df.to_json(orient="records", lines=True, force_ascii=False, double_precision=15)
+            prefix = '{"table":' + json.dumps(name) + ","
+            for line in body.splitlines():
+                if line:
+                    f.write(prefix + line[1:] + "\n")
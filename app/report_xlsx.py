@@ -1,15 +1,117 @@
 from __future__ import annotations
+import math
+
 import pandas as pd
 
+XLSX_WRITE_MODES = ("stream", "pandas")
+DEFAULT_BATCH_ROWS = 5_000
+
+_MIN_WIDTH = 8
+_MAX_WIDTH = 60
+_WIDTH_SAMPLE_ROWS = 200
+
+
 def write_report_xlsx(out_path: str,
                       genel_ozet: pd.DataFrame,
                       sheet_list: pd.DataFrame,
                       col_profile: pd.DataFrame,
                       warnings_df: pd.DataFrame,
-                      dup_df: pd.DataFrame) -> None:
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-        genel_ozet.to_excel(writer, index=False, sheet_name="00_Genel_Ozet")
-        sheet_list.to_excel(writer, index=False, sheet_name="01_Sheet_Listesi")
-        col_profile.to_excel(writer, index=False, sheet_name="02_Kolon_Profili")
-        warnings_df.to_excel(writer, index=False, sheet_name="03_Verı_Kalıte_Uyarıları")
-        dup_df.to_excel(writer, index=False, sheet_name="04_Duplicate_Analizi")
+                      dup_df: pd.DataFrame,
+                      perf_df: pd.DataFrame | None = None,
+                      mode: str = "stream",
+                      batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+    """
+    mode="stream": openpyxl write_only calisma sayfalari; satirlar batch_rows'luk
+    parcalar halinde diske akar, hucre nesne modeli bellekte tutulmaz.
+    mode="pandas": eski pd.ExcelWriter(engine="openpyxl") yolu.
+    perf_df verilirse 05_Performans sheet'i olarak eklenir.
+    """
+    sheets = [
+        ("00_Genel_Ozet", genel_ozet),
+        ("01_Sheet_Listesi", sheet_list),
+        ("02_Kolon_Profili", col_profile),
+        ("03_Verı_Kalıte_Uyarıları", warnings_df),
+        ("04_Duplicate_Analizi", dup_df),
+    ]
+    if perf_df is not None:
+        sheets.append(("05_Performans", perf_df))
+
+    if mode == "pandas":
+        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+            for name, df in sheets:
+                df.to_excel(writer, index=False, sheet_name=name)
+        return
+    if mode != "stream":
+        raise ValueError(f"Bilinmeyen xlsx yazma modu: {mode}")
+
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    header_style = _header_style()
+    for name, df in sheets:
+        _write_sheet(wb.create_sheet(title=name), df, header_style, batch_rows)
+    wb.save(out_path)
+
+
+def _header_style() -> dict:
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    thin = Side(style="thin", color="999999")
+    return {
+        "font": Font(bold=True),
+        "fill": PatternFill("solid", fgColor="DDEBF7"),
+        "border": Border(left=thin, right=thin, top=thin, bottom=thin),
+        "alignment": Alignment(horizontal="center", vertical="top"),
+    }
+
+
+def _write_sheet(ws, df: pd.DataFrame, header_style: dict, batch_rows: int) -> None:
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    # write_only: genislik ve freeze ilk satirdan once ayarlanmali
+    for i, width in enumerate(_column_widths(df), start=1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+    if len(df.columns):
+        ws.freeze_panes = "A2"
+
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=_cell_value(col))
+        for attr, style in header_style.items():
+            setattr(cell, attr, style)
+        header.append(cell)
+    ws.append(header)
+
+    step = max(1, int(batch_rows))
+    for start in range(0, len(df), step):
+        batch = df.iloc[start:start + step]
+        # kolon bazli python'a cevirme (hucre bazli iloc'tan cok daha hizli)
+        cols = [[_cell_value(v) for v in batch.iloc[:, j].tolist()] for j in range(batch.shape[1])]
+        for row in zip(*cols):
+            ws.append(row)
+
+
+def _column_widths(df: pd.DataFrame) -> list:
+    # sabit genislik: baslik + ilk satirlarin metin uzunlugu, sinirli
+    head = df.head(_WIDTH_SAMPLE_ROWS)
+    widths = []
+    for j, col in enumerate(df.columns):
+        lengths = [len(str(col))]
+        lengths += [len(str(v)) for v in head.iloc[:, j].tolist() if _cell_value(v) is not None]
+        widths.append(min(_MAX_WIDTH, max(_MIN_WIDTH, max(lengths) + 2)))
+    return widths
+
+
+def _cell_value(v):
+    # pandas.to_excel ile ayni: NaN/NaT/None -> bos hucre, inf -> "inf"
+    if v is None or v is pd.NaT:
+        return None
+    if hasattr(v, "dtype") and hasattr(v, "item"):
+        v = v.item()  # numpy skalerleri
+    if isinstance(v, float):
+        if math.isnan(v):
+            return None
+        if math.isinf(v):
+            return "inf" if v > 0 else "-inf"
+    return v
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
 def sample_df(df: pd.DataFrame, threshold: int = 200_000, n_each: int = 5_000) -> tuple[pd.DataFrame, bool]:
@@ -20,3 +21,113 @@ def sample_df(df: pd.DataFrame, threshold: int = 200_000, n_each: int = 5_000) -
         out = pd.concat([head, tail], ignore_index=True)
 
     return out, True
+
+
+class StreamSampler:
+    """
+    Satirlar okunurken ornekleme yapar (sample_df'in streaming karsiligi).
+
+    threshold asilana kadar parcalar tutulur; asildiginda ilk n_each satir
+    (head), son n_each satir (tail) ve aradaki satirlardan seed'li uniform bir
+    reservoir (Algorithm R) tutulur. Orneklenmeyen satirlar saklanmaz.
+    Satir sayisi ve kolon bazli bos sayilari tum satirlar uzerinden tam hesaplanir.
+    """
+
+    def __init__(self, threshold: int = 200_000, n_each: int = 5_000, random_state: int = 42):
+        self.threshold = threshold
+        self.n_each = n_each
+        self.rng = np.random.default_rng(random_state)
+
+        self.rows = 0
+        self.missing = {}      # kolon -> tam bos sayisi
+        self.sampled = False
+
+        self._buffer = []      # threshold asilana kadar tum parcalar
+        self._head = None
+        self._tail = None
+        self._reservoir = None
+        self._middle_seen = 0
+
+    def update(self, chunk: pd.DataFrame) -> "StreamSampler":
+        n = len(chunk)
+        if n == 0 and self.rows > 0:
+            return self
+
+        for col in chunk.columns:
+            if col not in self.missing:
+                # sonradan gelen kolon: onceki satirlarda bostu
+                self.missing[col] = self.rows
+        na = chunk.isna().sum()
+        for col, cnt in na.items():
+            self.missing[col] += int(cnt)
+        for col in self.missing:
+            if col not in chunk.columns:
+                self.missing[col] += n
+        self.rows += n
+
+        if not self.sampled:
+            self._buffer.append(chunk)
+            if self.rows > self.threshold:
+                self._start_sampling()
+            return self
+
+        self._push(chunk)
+        return self
+
+    def _start_sampling(self) -> None:
+        self.sampled = True
+        df = pd.concat(self._buffer)
+        self._buffer = []
+        self._head = df.iloc[:self.n_each]
+        self._tail = df.iloc[:0]
+        self._push(df.iloc[self.n_each:])
+
+    def _push(self, chunk: pd.DataFrame) -> None:
+        # tail'e ekle, tasan (artik ortada kalan) satirlar reservoir'a gider
+        combined = pd.concat([self._tail, chunk]) if len(self._tail) else chunk
+        cut = max(0, len(combined) - self.n_each)
+        self._tail = combined.iloc[cut:]
+        if cut:
+            self._reservoir_add(combined.iloc[:cut])
+
+    def _reservoir_add(self, rows: pd.DataFrame) -> None:
+        k = self.n_each
+        m = len(rows)
+        if k <= 0:
+            self._middle_seen += m
+            return
+
+        seen = self._middle_seen
+        pos = np.arange(seen, seen + m)   # orta bolgedeki global sira
+
+        res_len = 0 if self._reservoir is None else len(self._reservoir)
+        # slot -> havuzdaki (eski reservoir + yeni satirlar) konum
+        slot_map = np.arange(res_len)
+
+        fill = pos < k
+        fill_n = int(fill.sum())
+        if fill_n:
+            slot_map = np.concatenate([slot_map, res_len + np.arange(fill_n)])
+
+        rest = np.nonzero(~fill)[0]
+        if len(rest):
+            j = self.rng.integers(0, pos[rest] + 1)
+            hit = j < k
+            # ayni slota birden fazla yazim: sonuncusu kazanir (Algorithm R sirasi)
+            for slot, r in zip(j[hit].tolist(), rest[hit].tolist()):
+                slot_map[slot] = res_len + r
+
+        pool = pd.concat([self._reservoir, rows]) if res_len else rows
+        self._reservoir = pool.iloc[slot_map]
+        self._middle_seen += m
+
+    def result(self) -> tuple[pd.DataFrame, bool]:
+        if not self.sampled:
+            if not self._buffer:
+                return pd.DataFrame(), False
+            return (pd.concat(self._buffer) if len(self._buffer) > 1 else self._buffer[0]), False
+
+        # reservoir orijinal satir sirasina gore (sample_df'teki gibi head, orta, tail)
+        mid = self._reservoir.sort_index() if self._reservoir is not None else None
+        parts = [self._head] + ([mid] if mid is not None and len(mid) else []) + [self._tail]
+        return pd.concat(parts, ignore_index=True), True
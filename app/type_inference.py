@@ -0,0 +1,212 @@
+"""
+Metin kolonlar icin anlamsal tip cikarimi.
+
+guess_dtype sadece pandas dtype'ina bakar; Excel/CSV'de metin olarak saklanmis
+sayilar ("1.234,56"), tarihler ("17.10.2026") ve EVET/HAYIR bayraklari "text"
+kalir. infer_text_column once kolonun sinirli bir orneginde (INFER_SAMPLE_SIZE)
+vektorel regex/str islemleriyle aday tipi bulur, sonra adayi tum kolonda
+dogrular ve donusturur. Tek bir deger bile uymazsa kolon "text" kalir
+(karisik kolonlar icin dtype_label ile ayni kural). Parca parca okunan
+kolonlarda kural (tip + ayirici/bicim) ilk dolu parcada bir kez secilir
+(infer_text_rule), sonraki parcalar ona gore okunur (apply_text_rule).
+
+Sayilar: ondalik ayirici kolon bazinda secilir ("1.234,5" Turkce, "1,234.5"
+Ingilizce). "." ancak kolonda "," ondalikli ya da birden cok noktali ("1.234.567")
+bir deger varsa binlik sayilir; yoksa ("3.125", "12.500") ondalik noktadir.
+Basinda sifir olan degerler ("00123") kod sayilir, sayiya cevrilmez.
+"""
+from __future__ import annotations
+import re
+
+import numpy as np
+import pandas as pd
+
+INFER_SAMPLE_SIZE = 500
+
+# pandas infer_dtype sonuclari: sadece metin iceren (ya da metin + sayi) kolonlara bakilir
+_TEXTUAL_KINDS = frozenset(("string", "mixed-integer", "mixed-integer-float", "mixed"))
+
+# desenler modul seviyesinde bir kez derlenir; pyarrow string kolonlarda
+# Series.str.fullmatch vektorel (RE2) calisir
+_LEADING_ZERO_RE = re.compile(r"[+-]?0\d.*")
+_NUMBER_RES = {
+    # ondalik ayirici -> (desen, binlik ayirici)
+    ",": (re.compile(r"[+-]?(?:\d+|\d{1,3}(?:\.\d{3})+)(?:,\d+)?"), "."),
+    ".": (re.compile(r"[+-]?(?:\d+|\d{1,3}(?:,\d{3})+)(?:\.\d+)?"), ","),
+}
+_MULTI_DOT_RE = re.compile(r"[+-]?\d{1,3}(?:\.\d{3}){2,}(?:,\d+)?")
+# yil dort haneli olmali ("17.10.26" belirsiz, metin kalir)
+_DATE_SHAPE_RE = re.compile(r"(?:\d{4}[./-]\d{1,2}[./-]\d{1,2}|\d{1,2}[./-]\d{1,2}[./-]\d{4})"
+                            r"(?:[ T]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?")
+# sirayla denenir; ornekteki tum degerleri cozen ilk bicim secilir (gun/ay once Turkce)
+DATE_FORMATS = (
+    "ISO8601",
+    "%d.%m.%Y", "%d.%m.%Y %H:%M", "%d.%m.%Y %H:%M:%S",
+    "%d/%m/%Y", "%d/%m/%Y %H:%M", "%d/%m/%Y %H:%M:%S",
+    "%d-%m-%Y",
+    "%Y/%m/%d", "%Y.%m.%d",
+    "%m/%d/%Y",
+)
+_TR_MONTHS = {
+    "ocak": 1, "şubat": 2, "subat": 2, "mart": 3, "nisan": 4, "mayıs": 5, "mayis": 5, "haziran": 6,
+    "temmuz": 7, "ağustos": 8, "agustos": 8, "eylül": 9, "eylul": 9, "ekim": 10, "kasım": 11,
+    "kasim": 11, "aralık": 12, "aralik": 12,
+}
+_MONTH_ALT = "|".join(_TR_MONTHS)
+_MONTH_NAME_RE = re.compile(rf"\d{{1,2}}\s+(?:{_MONTH_ALT})\s+\d{{4}}")
+_MONTH_RE = re.compile(rf"(?:{_MONTH_ALT})")
+BOOL_VALUES = frozenset(("EVET", "HAYIR", "TRUE", "FALSE", "DOĞRU", "YANLIŞ"))
+_TEXT_RULE = ("text", None)
+
+
+def _sample(s: pd.Series, n: int) -> pd.Series:
+    # bastan ve kolon boyunca esit aralikli; sadece ilk satirlara bakmak yaniltir
+    if len(s) <= n:
+        return s
+    return s.iloc[np.unique(np.linspace(0, len(s) - 1, n).astype(np.int64))]
+
+
+def _as_text(s: pd.Series) -> pd.Series:
+    # pandas 3'te str (pyarrow) dtype: regex'ler vektorel calisir
+    return s.astype(str).str.strip()
+
+
+def _number_decimal(text: pd.Series) -> str | None:
+    """Tum degerler sayi ise ondalik ayirici ("," ya da "."), degilse None."""
+    if text.str.fullmatch(_LEADING_ZERO_RE).any():
+        return None
+    # tek noktali "3.125" iki bicime de uyar; nokta sadece kanit varsa binlik ayiricidir
+    if text.str.fullmatch(_NUMBER_RES[","][0]).all() and (
+            text.str.contains(",", regex=False).any() or text.str.fullmatch(_MULTI_DOT_RE).any()):
+        return ","
+    if text.str.fullmatch(_NUMBER_RES["."][0]).all():
+        return "."
+    return None
+
+
+def _to_number(text: pd.Series, decimal: str) -> tuple[str, pd.Series]:
+    thousands = _NUMBER_RES[decimal][1]
+    has_decimal = text.str.contains(decimal, regex=False)
+    plain = text.str.replace(thousands, "", regex=False)
+    if decimal != ".":
+        plain = plain.str.replace(decimal, ".", regex=False)
+    label = "float" if has_decimal.any() else "int"
+    try:
+        # desen dogrulandi: dogrudan cast (pyarrow'da to_numeric'ten ~4x hizli)
+        return label, plain.astype("float64" if label == "float" else "int64")
+    except (OverflowError, ValueError, TypeError):
+        # int64'e sigmayan tam sayilar
+        return "float", pd.to_numeric(plain, errors="coerce").astype("float64")
+
+
+def _date_format(text: pd.Series) -> str | None:
+    if text.str.fullmatch(_DATE_SHAPE_RE).all():
+        for fmt in DATE_FORMATS:
+            if _to_date(text, fmt).notna().all():
+                return fmt
+        return None
+    if text.str.lower().str.fullmatch(_MONTH_NAME_RE).all():
+        return "month_name"
+    return None
+
+
+def _to_date(text: pd.Series, fmt: str) -> pd.Series:
+    if fmt == "month_name":
+        # "17 Ekim 2026" -> "17 10 2026" (locale'e bagli %B yerine)
+        text = text.str.lower().str.replace(_MONTH_RE, lambda m: str(_TR_MONTHS[m.group(0)]), regex=True)
+        fmt = "%d %m %Y"
+    return pd.to_datetime(text, format=fmt, errors="coerce")
+
+
+def _detect(text: pd.Series) -> tuple[str, object]:
+    # (etiket, donusum parametresi)
+    if text.str.upper().isin(BOOL_VALUES).all():
+        return "bool", None
+    decimal = _number_decimal(text)
+    if decimal is not None:
+        return "number", decimal
+    fmt = _date_format(text)
+    if fmt is not None:
+        return "date", fmt
+    return "text", None
+
+
+def infer_text_rule(s: pd.Series, sample_size: int = INFER_SAMPLE_SIZE) -> tuple[tuple, str, pd.Series | None]:
+    """
+    s: bos olmayan degerler (object/str/category kolon). Aday tip ornekte bulunur,
+    tum kolonda dogrulanir. Donus: (kural, etiket, donusmus seri). Kural
+    ("number", ondalik) | ("date", bicim) | ("bool", None) | ("text", None);
+    sonraki parcalar apply_text_rule ile ayni kurala gore okunur.
+    """
+    if len(s) == 0:
+        return _TEXT_RULE, "text", None
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # sikistirilmis kolon: sadece kategoriler incelenir, sonuc kodlarla yayilir
+        rule, label, converted = infer_text_rule(pd.Series(s.cat.categories), sample_size)
+        return rule, label, _expand_categories(s, converted)
+
+    sample = _sample(s, sample_size)
+    if pd.api.types.infer_dtype(sample, skipna=True) not in _TEXTUAL_KINDS:
+        return _TEXT_RULE, "text", None
+    kind, param = _detect(_as_text(sample))
+    if kind == "text":
+        return _TEXT_RULE, "text", None
+
+    # ornekte bulunan aday tum kolonda dogrulanir
+    text = _as_text(s)
+    if kind == "number":
+        # ayirici tum kolona gore yeniden secilir (ornekte sadece "1.234" olabilir)
+        param = _number_decimal(text)
+        if param is None:
+            return _TEXT_RULE, "text", None
+    rule = (kind, param)
+    label, converted = _apply(text, rule)
+    return (rule if label != "text" else _TEXT_RULE), label, converted
+
+
+def apply_text_rule(s: pd.Series, rule: tuple) -> tuple[str, pd.Series | None]:
+    """
+    Onceki parcada bulunan kurali uygular (tip ve ayirici yeniden aranmaz; ayni
+    kolonun parcalari farkli ayiriciyla okunmasin). Tek deger uymazsa ("text", None).
+    """
+    if len(s) == 0 or rule[0] == "text":
+        return "text", None
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        label, converted = apply_text_rule(pd.Series(s.cat.categories), rule)
+        return label, _expand_categories(s, converted)
+    if pd.api.types.infer_dtype(s, skipna=True) not in _TEXTUAL_KINDS:
+        return "text", None
+    text = _as_text(s)
+    if rule[0] == "number" and (text.str.fullmatch(_LEADING_ZERO_RE).any()
+                                or not text.str.fullmatch(_NUMBER_RES[rule[1]][0]).all()):
+        return "text", None
+    return _apply(text, rule)
+
+
+def infer_text_column(s: pd.Series, sample_size: int = INFER_SAMPLE_SIZE) -> tuple[str, pd.Series | None]:
+    """
+    Tek parcalik kisayol: (etiket, donusmus seri); etiket "int" | "float" | "date" |
+    "bool" | "text". int/float/date'te seri sayisal / datetime64'tur (istatistik
+    yolu bunu kullanir); bool ve text'te None.
+    """
+    _, label, converted = infer_text_rule(s, sample_size)
+    return label, converted
+
+
+def _apply(text: pd.Series, rule: tuple) -> tuple[str, pd.Series | None]:
+    # text: _as_text ile hazirlanmis; sayi kurali cagiran tarafta dogrulanmis olmali
+    kind, param = rule
+    if kind == "bool":
+        return ("bool", None) if text.str.upper().isin(BOOL_VALUES).all() else ("text", None)
+    if kind == "number":
+        return _to_number(text, param)
+    dates = _to_date(text, param)
+    if not dates.notna().all():
+        return "text", None
+    return "date", dates
+
+
+def _expand_categories(s: pd.Series, converted: pd.Series | None) -> pd.Series | None:
+    if converted is None:
+        return None
+    return pd.Series(converted.to_numpy()[s.cat.codes.to_numpy()], index=s.index)
@@ -5,7 +5,8 @@ def pick_excel_file() -> str | None:
     root.withdraw()
     file_path = filedialog.askopenfilename(
         title="Excel dosyasi seç",
-        filetypes=[("Excel Files", "*.xlsx *.xls"), ("All Files", "*.*")]
+        filetypes=[("Excel / CSV / Parquet", "*.xlsx *.xlsm *.xls *.csv *.tsv *.parquet"),
+                   ("All Files", "*.*")]
     )
     root.destroy()
     return file_path if file_path else None
@@ -0,0 +1,125 @@
+"""
+Rapor yazicilari: istenen her format bagimsiz bir gorev olarak thread havuzunda
+calisir; hepsi ayni (degistirilmeyen) ReportData nesnesinden beslenir.
+"""
+from __future__ import annotations
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+import pandas as pd
+
+from .perf import PerfRecorder, Stopwatch
+from .progress import ProgressTracker
+
+
+@dataclass(frozen=True)
+class ReportData:
+    """Yazicilarin ortak girdisi. Yazicilar DataFrame'leri degistirmemeli."""
+    genel_ozet: pd.DataFrame
+    sheet_list: pd.DataFrame
+    col_profile: pd.DataFrame
+    warnings: pd.DataFrame
+    duplicates: pd.DataFrame
+    template_dir: str = ""
+    template_name: str = "report_template.html"
+    html_context: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    perf: pd.DataFrame | None = None  # 05_Performans (yazma oncesi asamalar)
+    _tables_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _tables: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def frames(self) -> tuple:
+        return (self.genel_ozet, self.sheet_list, self.col_profile, self.warnings, self.duplicates)
+
+    def tables(self) -> dict:
+        # parquet/arrow/ndjson ayni sema donusumunu paylasir; bir kez hesaplanir
+        with self._tables_lock:
+            if not self._tables:
+                from .report_tables import report_tables
+                self._tables.update(report_tables(*self.frames))
+            return self._tables
+
+
+def _write_xlsx(data: ReportData, out_path: str) -> None:
+    from .report_xlsx import write_report_xlsx
+    write_report_xlsx(out_path, *data.frames, perf_df=data.perf)
+
+
+def _write_html(data: ReportData, out_path: str) -> None:
+    from .report_html import write_report_html  # jinja2 sadece HTML istenirse yuklenir
+    write_report_html(data.template_dir, data.template_name, out_path, dict(data.html_context))
+
+
+def _write_json(data: ReportData, out_path: str) -> None:
+    from .report_json import write_report_json
+    write_report_json(out_path, *data.frames)
+
+
+def _write_parquet(data: ReportData, out_path: str) -> None:
+    from .report_tables import write_report_arrow
+    write_report_arrow(out_path, data.tables(), fmt="parquet")
+
+
+def _write_arrow(data: ReportData, out_path: str) -> None:
+    from .report_tables import write_report_arrow
+    write_report_arrow(out_path, data.tables(), fmt="arrow")
+
+
+def _write_ndjson(data: ReportData, out_path: str) -> None:
+    from .report_tables import write_report_ndjson
+    write_report_ndjson(out_path, data.tables())
+
+
+WRITERS = {
+    "xlsx": _write_xlsx,
+    "html": _write_html,
+    "json": _write_json,
+    "parquet": _write_parquet,
+    "arrow": _write_arrow,
+    "ndjson": _write_ndjson,
+}
+
+
+def _timed(fmt: str, data: ReportData, out_path: str, log, perf: PerfRecorder,
+           progress: ProgressTracker) -> dict:
+    progress.check()  # iptal edildiyse baslamamis yazicilar calismaz
+    sw = Stopwatch()
+    error = None
+    with sw:
+        try:
+            WRITERS[fmt](data, out_path)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    perf.add(f"yazma_{fmt}", "", sw)
+    seconds = round(sw.wall, 3)
+    if error:
+        log(f"{fmt} yazilamadi: {error}")
+    else:
+        log(f"{fmt} yazildi ({seconds}s)")
+    progress.writer_done()
+    return {"seconds": seconds, "cpu_seconds": round(sw.cpu, 3), "error": error}
+
+
+def run_writers(data: ReportData, outputs: dict, max_workers: int | None = None, log=None,
+                perf: PerfRecorder | None = None, progress: ProgressTracker | None = None) -> dict:
+    """
+    outputs: format -> cikti yolu (sadece istenenler). Her yazici ayri thread'de
+    calisir; bir yazicinin hatasi digerlerini durdurmaz.
+    Donus: format -> {"seconds": float, "cpu_seconds": float, "error": str | None}
+    """
+    log = log if callable(log) else (lambda m: None)
+    perf = perf if perf is not None else PerfRecorder()
+    progress = progress if progress is not None else ProgressTracker()
+    jobs = [(fmt, path) for fmt, path in outputs.items() if path]
+    if not jobs:
+        return {}
+    progress.writers_total = len(jobs)
+    if len(jobs) == 1 or max_workers == 1:
+        return {fmt: _timed(fmt, data, path, log, perf, progress) for fmt, path in jobs}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs), thread_name_prefix="report-writer") as pool:
+        futures = {fmt: pool.submit(_timed, fmt, data, path, log, perf, progress) for fmt, path in jobs}
+        return {fmt: fut.result() for fmt, fut in futures.items()}
@@ -0,0 +1,99 @@
+"""
+Header tespiti benchmark'i: eski satir bazli (O(n^2) satir donusumu) ve
+vektorel detect_header_row karsilastirmasi; sonuclarin ayni oldugu da kontrol edilir.
+
+Kullanim:
+    python -m benchmarks.bench_header --rows 200 --cols 300
+"""
+from __future__ import annotations
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from app.header_detector import _cell_to_str, detect_header_row, score_row
+
+
+def legacy_detect_header_row(preview_df: pd.DataFrame, max_rows: int = 30) -> tuple[int, float]:
+    # onceki implementasyon (referans)
+    n = min(len(preview_df), max_rows)
+    if n == 0:
+        return 0, 0.0
+
+    scores = []
+
+    def non_empty_count(row) -> int:
+        return sum(1 for x in row if _cell_to_str(x) != "")
+
+    for i in range(n):
+        row_strs = [_cell_to_str(x) for x in preview_df.iloc[i].tolist()]
+        base = score_row(row_strs)
+
+        next_rows = [non_empty_count(preview_df.iloc[j].tolist()) for j in range(i + 1, min(n, i + 4))]
+        after_mean = (sum(next_rows) / len(next_rows)) if next_rows else 0.0
+
+        empty_run = 0
+        for j in range(i + 1, n):
+            if non_empty_count(preview_df.iloc[j].tolist()) == 0:
+                empty_run += 1
+            else:
+                break
+
+        penalty = 0.0
+        if after_mean < 2:
+            penalty += 8.0
+        if empty_run >= 2:
+            penalty += 12.0
+        scores.append(base - penalty)
+
+    best_i = int(max(range(len(scores)), key=lambda k: scores[k]))
+    best_score = scores[best_i]
+    mid = sorted(scores)[len(scores) // 2]
+    gap = best_score - mid
+    conf = 0.0 if best_score <= 0 else max(0.0, min(1.0, gap / 15.0))
+    return best_i, conf
+
+
+def make_preview(rows: int, cols: int, seed: int = 0) -> pd.DataFrame:
+    rnd = random.Random(seed)
+    junk = rnd.randint(0, 5)
+    data = []
+    for _ in range(junk):
+        data.append([rnd.choice(["Rapor", None, "", "Tarih: 01.01.2024", "Column1"]) for _ in range(cols)])
+    for _ in range(rnd.randint(0, 3)):
+        data.append([None] * cols)
+    data.append([rnd.choice([f"kolon_{c}", f"Unnamed: {c}", f"Column{c}", None]) for c in range(cols)])
+    while len(data) < rows:
+        data.append([rnd.choice([rnd.randint(0, 999), rnd.random(), "abc", None, "x" * 40]) for _ in range(cols)])
+    return pd.DataFrame(data)
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--rows", type=int, default=200)
+    p.add_argument("--cols", type=int, default=300)
+    p.add_argument("--cases", type=int, default=20, help="esitlik kontrolu icin rastgele preview sayisi")
+    args = p.parse_args(argv)
+
+    for seed in range(args.cases):
+        df = make_preview(40, 12, seed)
+        assert legacy_detect_header_row(df, 40) == detect_header_row(df, 40), f"sonuc farkli (seed={seed})"
+
+    df = make_preview(args.rows, args.cols)
+    t0 = time.perf_counter()
+    old = legacy_detect_header_row(df, max_rows=args.rows)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new = detect_header_row(df, max_rows=args.rows)
+    t_new = time.perf_counter() - t0
+    assert old == new, (old, new)
+
+    print(f"preview={args.rows}x{args.cols} esitlik kontrolu={args.cases} vaka OK")
+    print(f"legacy    : {t_old:.3f}s")
+    print(f"vectorized: {t_new:.3f}s")
+    print(f"speedup   : {t_old / max(t_new, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Acilis (import) suresi benchmark'i: her giris noktasi temiz bir interpreter'da
+`python -X importtime -c "import <modul>"` ile olculur. Sure butcesi asilirsa ya da
+hafif giris noktalari agir kutuphaneleri (pandas, numpy, openpyxl, jinja2) yuklerse
+cikis kodu 1 olur; CI'da regresyon kontrolu olarak kullanilabilir.
+
+Kullanim:
+    python -m benchmarks.bench_import --repeat 5
+    python -m benchmarks.bench_import --budget app.gui=150 --budget app.core=1500
+"""
+from __future__ import annotations
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "jinja2")
+
+# modul -> (butce ms, agir kutuphane yasak mi)
+DEFAULT_BUDGETS = {
+    "app.gui": (150.0, True),
+    "app.main": (150.0, True),
+    "app.cli": (100.0, True),
+    "app.core": (1500.0, False),
+}
+
+
+def measure(module: str) -> tuple[float, set]:
+    """Modulun kumulatif import suresi (ms) ve yuklenen tum modul adlari."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} import edilemedi:\n{proc.stderr}")
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cum = int(parts[1])
+        except ValueError:
+            continue  # baslik satiri
+        cumulative[parts[2].strip()] = cum
+
+    if module not in cumulative:
+        raise RuntimeError(f"{module} importtime ciktisinda yok")
+    return cumulative[module] / 1000.0, set(cumulative)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5, help="en iyi sure alinir")
+    ap.add_argument("--budget", action="append", default=[], metavar="MODUL=MS",
+                    help="butceyi degistir/ekle")
+    args = ap.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        name, ms = item.split("=", 1)
+        budgets[name] = (float(ms), budgets.get(name, (0.0, False))[1])
+
+    failed = False
+    print(f"{'modul':<12} {'en iyi ms':>10} {'butce ms':>10}  durum")
+    for module, (budget, light) in budgets.items():
+        best = None
+        loaded = set()
+        for _ in range(max(1, args.repeat)):
+            ms, loaded = measure(module)
+            best = ms if best is None else min(best, ms)
+
+        status = "ok"
+        heavy = sorted(m for m in loaded if m.split(".")[0] in HEAVY_MODULES) if light else []
+        if heavy:
+            status = "AGIR IMPORT: " + ", ".join(sorted({m.split(".")[0] for m in heavy}))
+        elif best > budget:
+            status = "BUTCE ASILDI"
+        failed = failed or status != "ok"
+        print(f"{module:<12} {best:>10.1f} {budget:>10.1f}  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
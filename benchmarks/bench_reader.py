@@ -0,0 +1,79 @@
+"""
+Okuyucu benchmark'i: eski (sheet basina path ile 2x pd.read_excel) ve yeni
+(tek handle, tek parse) read_excel_all_sheets karsilastirmasi.
+
+Kullanim:
+    python -m benchmarks.bench_reader --sheets 20 --rows 2000
+"""
+from __future__ import annotations
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from app.excel_reader import read_excel_all_sheets
+from app.header_detector import detect_header_row
+
+
+def make_workbook(path: str, sheets: int, rows: int, cols: int = 8) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"Sheet{s + 1}")
+        ws.append(["Rapor", None, None])
+        ws.append([])
+        ws.append([f"kolon_{c}" for c in range(cols)])
+        for i in range(rows):
+            ws.append([i, f"ad_{i % 37}", i * 1.5, "EVET" if i % 2 else "HAYIR"] + [i % 11] * (cols - 4))
+    wb.save(path)
+
+
+def legacy_read(path: str, auto_header: bool = True, preview_rows: int = 30) -> dict:
+    # eski davranis: ExcelFile sadece sheet listesi icin, her sheet 2 kez path ile okunur
+    xls = pd.ExcelFile(path)
+    result = {}
+    for sheet_name in xls.sheet_names:
+        header_row_0 = 0
+        confidence = 0.0
+        if auto_header:
+            preview_df = pd.read_excel(path, sheet_name=sheet_name, header=None, nrows=preview_rows)
+            header_row_0, confidence = detect_header_row(preview_df, max_rows=preview_rows)
+        df = pd.read_excel(path, sheet_name=sheet_name, header=header_row_0).dropna(how="all")
+        result[sheet_name] = {"df": df, "header_row": header_row_0 + 1, "header_confidence": confidence}
+    return result
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--sheets", type=int, default=20)
+    p.add_argument("--rows", type=int, default=2000)
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        make_workbook(path, args.sheets, args.rows)
+
+        t_old = _best_of(lambda: legacy_read(path, auto_header=True), args.repeat)
+        t_new = _best_of(lambda: read_excel_all_sheets(path, auto_header=True), args.repeat)
+
+    print(f"sheets={args.sheets} rows/sheet={args.rows}")
+    print(f"legacy (2x read_excel/sheet): {t_old:.3f}s")
+    print(f"single parse               : {t_new:.3f}s")
+    print(f"speedup                    : {t_old / max(t_new, 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Uctan uca benchmark paketi: messy_workbooks senaryolarinda generate_reports
+calistirilir; asama sureleri (perf olaylari), toplam sure ve tepe bellek JSON'a
+yazilir ve istenirse kayitli bir baseline ile karsilastirilir.
+
+Her kosu temiz bir process'te (spawn) yapilir; tepe RSS onceki senaryolardan
+etkilenmez. --repeat > 1 ise her olcum icin en iyi (en kucuk) deger alinir.
+Esik asilirsa cikis kodu 1 olur; CI'da regresyon kontrolu olarak kullanilabilir.
+
+Kullanim:
+    python -m benchmarks.bench_suite --scale 0.05 --out bench.json
+    python -m benchmarks.bench_suite --scale 0.05 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_suite --scale 0.05 --baseline benchmarks/baseline.json --time-threshold 0.25
+"""
+from __future__ import annotations
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+
+from benchmarks.messy_workbooks import DEFAULT_SEED, GENERATOR_VERSION, SCENARIOS, ensure_workbook, scaled
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(PROJECT_ROOT, "templates")
+DEFAULT_DATA_DIR = os.path.join(PROJECT_ROOT, "benchmarks", ".data")
+
+RESULT_VERSION = 1
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1)
+
+
+def _run_one(path: str, options: dict, conn) -> None:
+    # child process: olcum sozlugunu (ya da hatayi) pipe'tan gonderir
+    try:
+        from app.core import generate_reports
+
+        events = []
+        with tempfile.TemporaryDirectory() as out_dir:
+            t0 = time.perf_counter()
+            res = generate_reports(excel_path=path, output_dir=out_dir, template_dir=TEMPLATE_DIR,
+                                   perf_cb=events.append, **options)
+            seconds = time.perf_counter() - t0
+        failed = {f: w["error"] for f, w in res["writers"].items() if w["error"]}
+        if failed:
+            raise RuntimeError(f"yazici hatasi: {failed}")
+
+        stages = {}
+        for ev in events:
+            if ev["asama"] != "toplam":
+                stages[ev["asama"]] = stages.get(ev["asama"], 0.0) + ev["sure_sn"]
+        rss_events = [ev["rss_tepe_mb"] for ev in events if ev["rss_tepe_mb"] is not None]
+        peak = _peak_rss_mb()
+        conn.send({
+            "seconds": round(seconds, 4),
+            "stages": {k: round(v, 4) for k, v in stages.items()},
+            # ru_maxrss yoksa asama orneklerinin tepesi
+            "peak_rss_mb": peak if peak is not None else (max(rss_events) if rss_events else None),
+            "rows": int(res["summary"]["toplam_satir"]),
+        })
+    except BaseException as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def measure(path: str, options: dict, repeat: int = 1) -> dict:
+    """Senaryoyu repeat kez ayri process'te kosar; her metrigin en iyisini doner."""
+    ctx = mp.get_context("spawn")
+    runs = []
+    for _ in range(max(1, repeat)):
+        recv, send = ctx.Pipe(duplex=False)
+        proc = ctx.Process(target=_run_one, args=(path, options, send))
+        proc.start()
+        send.close()
+        try:
+            res = recv.recv()
+        except EOFError:
+            res = {"error": f"process beklenmedik sekilde sonlandi (exit {proc.exitcode})"}
+        proc.join()
+        if "error" in res:
+            return res
+        runs.append(res)
+
+    stages = {}
+    for r in runs:
+        for k, v in r["stages"].items():
+            stages[k] = min(stages.get(k, v), v)
+    peaks = [r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None]
+    return {
+        "seconds": min(r["seconds"] for r in runs),
+        "stages": stages,
+        "peak_rss_mb": min(peaks) if peaks else None,
+        "rows": runs[0]["rows"],
+        "repeat": len(runs),
+    }
+
+
+def _environment() -> dict:
+    import numpy
+    import openpyxl
+    import pandas
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "openpyxl": openpyxl.__version__,
+    }
+
+
+def run_suite(scenarios: list, options: dict, scale: float = 1.0, seed: int = DEFAULT_SEED,
+              repeat: int = 1, data_dir: str = DEFAULT_DATA_DIR, log=print) -> dict:
+    results = {}
+    for name in scenarios:
+        path = ensure_workbook(data_dir, name, scale, seed, log=log)
+        spec = scaled(SCENARIOS[name], scale)
+        log(f"{name}: {spec.rows} satir x {spec.cols} kolon ...")
+        res = measure(path, options, repeat)
+        res["spec"] = asdict(spec)
+        results[name] = res
+        if "error" in res:
+            log(f"{name}: HATA {res['error']}")
+        else:
+            log(f"{name}: {res['seconds']:.2f}s, tepe {res['peak_rss_mb']} MB")
+    return {
+        "version": RESULT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {"scale": scale, "seed": seed, "generator_version": GENERATOR_VERSION,
+                   "repeat": repeat, "options": options},
+        "environment": _environment(),
+        "scenarios": results,
+    }
+
+
+def compare(current: dict, baseline: dict, time_threshold: float = 0.2, memory_threshold: float = 0.2,
+            min_seconds: float = 0.05) -> list:
+    """
+    Baseline'a gore satirlar: (senaryo, metrik, baseline, simdiki, degisim orani, durum).
+    Sure farki min_seconds'tan kucukse (olcum gurultusu) regresyon sayilmaz.
+    """
+    rows = []
+    for name, cur in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None or "error" in base:
+            rows.append((name, "-", None, None, None, "baseline yok"))
+            continue
+        if "error" in cur:
+            rows.append((name, "-", None, None, None, "HATA"))
+            continue
+
+        metrics = [("toplam_sn", base["seconds"], cur["seconds"], time_threshold, min_seconds)]
+        for stage in sorted(set(base["stages"]) | set(cur["stages"])):
+            metrics.append((f"asama:{stage}", base["stages"].get(stage), cur["stages"].get(stage),
+                            time_threshold, min_seconds))
+        metrics.append(("tepe_rss_mb", base["peak_rss_mb"], cur["peak_rss_mb"], memory_threshold, 1.0))
+
+        for metric, b, c, threshold, floor in metrics:
+            if b is None or c is None:
+                rows.append((name, metric, b, c, None, "yeni" if b is None else "yok"))
+                continue
+            change = (c - b) / b if b > 0 else None
+            status = "ok"
+            if change is not None and change > threshold and c - b > floor:
+                status = "REGRESYON"
+            elif change is not None and change < -threshold and b - c > floor:
+                status = "iyilesme"
+            rows.append((name, metric, b, c, change, status))
+    return rows
+
+
+def _config_mismatch(current: dict, baseline: dict) -> list:
+    keys = ("scale", "seed", "generator_version", "options")
+    return [k for k in keys if current["config"].get(k) != baseline.get("config", {}).get(k)]
+
+
+def _print_comparison(rows: list) -> None:
+    print(f"{'senaryo':<14} {'metrik':<26} {'baseline':>10} {'simdiki':>10} {'degisim':>9}  durum")
+    for name, metric, b, c, change, status in rows:
+        b_txt = "-" if b is None else f"{b:.3f}"
+        c_txt = "-" if c is None else f"{c:.3f}"
+        ch_txt = "-" if change is None else f"{change * 100:+.1f}%"
+        print(f"{name:<14} {metric:<26} {b_txt:>10} {c_txt:>10} {ch_txt:>9}  {status}")
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                   help="tekrarlanabilir; verilmezse hepsi")
+    p.add_argument("--scale", type=float, default=1.0, help="satir sayisi carpani (ör. 0.05 hizli kosu)")
+    p.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="uretilen workbook cache klasoru")
+    p.add_argument("--streaming", action="store_true")
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--no-auto-header", action="store_true")
+    p.add_argument("--format", default="xlsx,html", help="rapor formatlari (virgulle)")
+    p.add_argument("--out", help="sonuc JSON dosyasi")
+    p.add_argument("--baseline", help="karsilastirilacak baseline JSON")
+    p.add_argument("--save-baseline", metavar="PATH", help="sonucu baseline olarak kaydet")
+    p.add_argument("--time-threshold", type=float, default=0.2, help="izin verilen yavaslama orani")
+    p.add_argument("--memory-threshold", type=float, default=0.2, help="izin verilen bellek artisi orani")
+    p.add_argument("--min-seconds", type=float, default=0.05, help="bunun altindaki sure farklari gurultu")
+    args = p.parse_args(argv)
+
+    options = {
+        "auto_header": not args.no_auto_header,
+        "streaming": args.streaming,
+        "workers": args.workers,
+        "formats": [f.strip() for f in args.format.split(",") if f.strip()],
+    }
+    result = run_suite(args.scenario or list(SCENARIOS), options, args.scale, args.seed,
+                       args.repeat, args.data_dir)
+
+    for path in (args.out, args.save_baseline):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"yazildi: {path}")
+
+    failed = any("error" in r for r in result["scenarios"].values())
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        mismatch = _config_mismatch(result, baseline)
+        if mismatch:
+            print(f"UYARI: baseline farkli ayarlarla alinmis ({', '.join(mismatch)}); karsilastirma anlamsiz olabilir")
+        rows = compare(result, baseline, args.time_threshold, args.memory_threshold, args.min_seconds)
+        _print_comparison(rows)
+        failed = failed or any(r[5] in ("REGRESYON", "HATA") for r in rows)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
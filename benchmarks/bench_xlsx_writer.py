@@ -0,0 +1,100 @@
+"""
+Rapor xlsx yazici benchmark'i: pd.ExcelWriter (openpyxl nesne modeli) ve
+write_only streaming modu; sure ve tracemalloc tepe bellegi olculur, iki
+dosyanin hucre degerlerinin ayni oldugu da kontrol edilir.
+
+Kullanim:
+    python -m benchmarks.bench_xlsx_writer --columns 30000
+"""
+from __future__ import annotations
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from app.report_xlsx import write_report_xlsx
+
+
+def make_report(columns: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    n = columns
+    col_profile = pd.DataFrame({
+        "sheet_adi": [f"Sheet{i % 40}" for i in range(n)],
+        "kolon_adi": [f"kolon_{i}" for i in range(n)],
+        "tahmini_tip": rng.choice(["numeric", "text", "datetime", "empty"], n),
+        "dolu_sayi": rng.integers(0, 100_000, n),
+        "bos_sayi": rng.integers(0, 100_000, n),
+        "bos_oran": rng.random(n) * 100,
+        "unique_sayi": rng.integers(0, 100_000, n),
+        "unique_oran": rng.random(n) * 100,
+        "min": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "max": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "ortalama": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "median": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "en_sik_1": [f"deger_{i % 977}" for i in range(n)],
+        "en_sik_1_sayi": rng.integers(0, 1000, n),
+        "ornek_degerler": [", ".join(f"v{j}" for j in range(i % 5, i % 5 + 5)) for i in range(n)],
+    })
+    warnings_df = pd.DataFrame({
+        "seviye": rng.choice(["INFO", "WARN", "ERROR"], n),
+        "sheet_adi": col_profile["sheet_adi"],
+        "kolon_adi": col_profile["kolon_adi"],
+        "konu": "Eksik veri",
+        "detay": [f"Bos oran %{v:.1f}" for v in col_profile["bos_oran"]],
+    })
+    genel_ozet = pd.DataFrame([{"dosya": "bench.xlsx", "sheet_sayisi": 40, "toplam_satir": 10 ** 6}])
+    sheet_list = pd.DataFrame({"sheet_adi": [f"Sheet{i}" for i in range(40)], "satir_sayisi": 25_000})
+    dup_df = pd.DataFrame({"sheet_adi": sheet_list["sheet_adi"], "duplicate_satir": 0, "duplicate_oran": 0.0})
+    return genel_ozet, sheet_list, col_profile, warnings_df, dup_df
+
+
+def run(mode: str, path: str, frames: tuple) -> tuple[float, float]:
+    # sure ve bellek ayri kosularda (tracemalloc yazmayi birkac kat yavaslatir)
+    t0 = time.perf_counter()
+    write_report_xlsx(path, *frames, mode=mode)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    write_report_xlsx(path, *frames, mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def same_values(a: str, b: str) -> bool:
+    x = pd.read_excel(a, sheet_name=None)
+    y = pd.read_excel(b, sheet_name=None)
+    if list(x) != list(y):
+        return False
+    for name in x:
+        try:
+            pd.testing.assert_frame_equal(x[name], y[name])
+        except AssertionError:
+            return False
+    return True
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--columns", type=int, default=30_000, help="kolon profili satir sayisi")
+    args = ap.parse_args()
+
+    frames = make_report(args.columns)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for mode in ("pandas", "stream"):
+            path = os.path.join(tmp, f"{mode}.xlsx")
+            results[mode] = run(mode, path, frames)
+            print(f"{mode:<7} {results[mode][0]:7.2f}s  tepe bellek {results[mode][1]:8.1f} MB")
+
+        (t_old, m_old), (t_new, m_new) = results["pandas"], results["stream"]
+        print(f"hiz: {t_old / t_new:.1f}x, bellek: {m_old / m_new:.1f}x daha az")
+        print("hucre degerleri ayni:", same_values(os.path.join(tmp, "pandas.xlsx"), os.path.join(tmp, "stream.xlsx")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Deterministik "daginik" test workbook ureticisi.
+
+Ayni senaryo + seed + olcek her zaman ayni dosyayi uretir; bench_suite
+sonuclari bu sayede makineler/commit'ler arasinda karsilastirilabilir.
+Uretilen dosyalar --data-dir altinda cache'lenir (1M satirlik sheet'i her
+calismada yeniden yazmamak icin); GENERATOR_VERSION degisirse yeniden uretilir.
+
+Kullanim:
+    python -m benchmarks.messy_workbooks --out /tmp/wb --scale 0.05
+    python -m benchmarks.messy_workbooks --out /tmp/wb --scenario tall --scenario wide
+"""
+from __future__ import annotations
+import argparse
+import datetime as dt
+import os
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+# uretim mantigi degisirse arttir: cache'teki eski dosyalar kullanilmaz
+GENERATOR_VERSION = 1
+
+DEFAULT_SEED = 20240101
+
+# kolon turleri sirayla dagitilir; "mixed" orani ayrica verilir
+COLUMN_KINDS = ("int", "float", "text", "date", "flag", "code")
+
+
+@dataclass(frozen=True)
+class WorkbookSpec:
+    """Tek sheet'lik senaryo tanimi; oranlar 0..1."""
+    rows: int
+    cols: int
+    junk_rows: int = 0            # header'in ustundeki baslik/aciklama/bos satirlar
+    fake_header_ratio: float = 0.0  # bos (pandas: "Unnamed: N") ya da "ColumnN" header orani
+    mixed_ratio: float = 0.0      # karisik tipli (sayi/metin/tarih) kolon orani
+    missing_ratio: float = 0.0    # hucre bazinda bos orani
+    dup_ratio: float = 0.0        # kucuk bir havuzdan kopyalanan satir orani
+
+
+SCENARIOS = {
+    "tall": WorkbookSpec(rows=1_000_000, cols=8, missing_ratio=0.05),
+    "wide": WorkbookSpec(rows=300, cols=2_500, missing_ratio=0.1),
+    "junk_header": WorkbookSpec(rows=50_000, cols=12, junk_rows=6),
+    "fake_headers": WorkbookSpec(rows=50_000, cols=20, junk_rows=2, fake_header_ratio=0.4),
+    "mixed_types": WorkbookSpec(rows=100_000, cols=12, mixed_ratio=0.5),
+    "sparse": WorkbookSpec(rows=200_000, cols=15, missing_ratio=0.7),
+    "duplicates": WorkbookSpec(rows=200_000, cols=10, dup_ratio=0.6),
+}
+
+_CATEGORIES = np.array([f"kategori_{i:02d}" for i in range(50)], dtype=object)
+_CITIES = np.array(["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Konya", "Şanlıurfa", "Çorum"],
+                   dtype=object)
+_BASE_DATE = dt.datetime(2015, 1, 1)
+
+
+def scaled(spec: WorkbookSpec, scale: float) -> WorkbookSpec:
+    """Satir sayisini olcekler (kolonlar sabit); hizli CI kosulari icin."""
+    if scale == 1:
+        return spec
+    return WorkbookSpec(**{**asdict(spec), "rows": max(100, int(spec.rows * scale))})
+
+
+def _column(kind: str, n: int, rng: np.random.Generator) -> np.ndarray:
+    if kind == "int":
+        values = rng.integers(0, 1_000_000, n).tolist()
+    elif kind == "float":
+        values = np.round(rng.normal(1_000.0, 250.0, n), 2).tolist()
+    elif kind == "text":
+        values = _CITIES[rng.integers(0, len(_CITIES), n)].tolist()
+    elif kind == "date":
+        days = rng.integers(0, 3_650, n)
+        values = [_BASE_DATE + dt.timedelta(days=int(d)) for d in days]
+    elif kind == "flag":
+        values = np.where(rng.random(n) < 0.5, "EVET", "HAYIR").astype(object).tolist()
+    elif kind == "code":
+        values = _CATEGORIES[rng.integers(0, len(_CATEGORIES), n)].tolist()
+    elif kind == "mixed":
+        # ayni kolonda sayi, sayi gibi metin, serbest metin ve tarih
+        pick = rng.integers(0, 4, n)
+        ints = rng.integers(0, 10_000, n)
+        values = []
+        for p, i in zip(pick.tolist(), ints.tolist()):
+            if p == 0:
+                values.append(i)
+            elif p == 1:
+                values.append(f"{i:,}".replace(",", "."))
+            elif p == 2:
+                values.append(f"not {i % 97}")
+            else:
+                values.append(_BASE_DATE + dt.timedelta(days=i % 3_650))
+    else:
+        raise ValueError(f"Bilinmeyen kolon turu: {kind}")
+    out = np.empty(n, dtype=object)
+    out[:] = values
+    return out
+
+
+def _kinds(spec: WorkbookSpec) -> list:
+    n_mixed = int(round(spec.cols * spec.mixed_ratio))
+    kinds = [COLUMN_KINDS[c % len(COLUMN_KINDS)] for c in range(spec.cols)]
+    # karisik kolonlar araya serpistirilir (hep sonda olmasin)
+    step = spec.cols / n_mixed if n_mixed else 0
+    for k in range(n_mixed):
+        kinds[int(k * step)] = "mixed"
+    return kinds
+
+
+def _header(spec: WorkbookSpec, rng: np.random.Generator) -> list:
+    header = [f"kolon_{c + 1}" for c in range(spec.cols)]
+    n_fake = int(round(spec.cols * spec.fake_header_ratio))
+    for i, c in enumerate(sorted(rng.choice(spec.cols, n_fake, replace=False).tolist())):
+        header[c] = None if i % 2 == 0 else f"Column{c + 1}"
+    return header
+
+
+def _junk_rows(spec: WorkbookSpec) -> list:
+    templates = [
+        ["Aylik Satis Raporu"],
+        [],
+        ["Olusturma tarihi:", "2024-01-31", None, "Kaynak: ERP"],
+        ["Not: rakamlar KDV haric"],
+        [None, None, "Donem", "2024/01"],
+        [],
+    ]
+    return [templates[i % len(templates)] for i in range(spec.junk_rows)]
+
+
+def generate_rows(spec: WorkbookSpec, seed: int = DEFAULT_SEED):
+    """Sheet satirlarini (junk + header + veri) sirayla uretir."""
+    rng = np.random.default_rng(seed)
+    n = spec.rows
+    header = _header(spec, rng)
+
+    # duplicate: satirlarin bir kismi ilk %5'lik havuzdan kopyalanir
+    order = np.arange(n)
+    if spec.dup_ratio > 0:
+        mask = rng.random(n) < spec.dup_ratio
+        order[mask] = rng.integers(0, max(1, n // 20), int(mask.sum()))
+
+    columns = []
+    for kind in _kinds(spec):
+        col = _column(kind, n, rng)[order]
+        if spec.missing_ratio > 0:
+            col[rng.random(n) < spec.missing_ratio] = None
+        columns.append(col)
+
+    yield from _junk_rows(spec)
+    yield header
+    for i in range(n):
+        yield [col[i] for col in columns]
+
+
+def write_workbook(path: str, spec: WorkbookSpec, seed: int = DEFAULT_SEED, sheet_name: str = "Data") -> str:
+    from openpyxl import Workbook
+
+    tmp = path + ".tmp"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    for row in generate_rows(spec, seed):
+        ws.append(row)
+    wb.save(tmp)
+    os.replace(tmp, path)  # yarim kalan dosya cache'e girmesin
+    return path
+
+
+def workbook_path(data_dir: str, name: str, scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    return os.path.join(data_dir, f"{name}_x{scale:g}_seed{seed}_v{GENERATOR_VERSION}.xlsx")
+
+
+def ensure_workbook(data_dir: str, name: str, scale: float = 1.0, seed: int = DEFAULT_SEED, log=print) -> str:
+    """Senaryo dosyasini gerekirse uretir, yolunu doner."""
+    path = workbook_path(data_dir, name, scale, seed)
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        spec = scaled(SCENARIOS[name], scale)
+        log(f"uretiliyor: {os.path.basename(path)} ({spec.rows} satir x {spec.cols} kolon)")
+        write_workbook(path, spec, seed)
+    return path
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--out", required=True, help="workbook klasoru")
+    p.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                   help="tekrarlanabilir; verilmezse hepsi")
+    p.add_argument("--scale", type=float, default=1.0, help="satir sayisi carpani")
+    p.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = p.parse_args(argv)
+
+    for name in args.scenario or SCENARIOS:
+        print(ensure_workbook(args.out, name, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
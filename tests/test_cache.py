@@ -0,0 +1,121 @@
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from app import cache as cache_mod
+from app.cache import ProfileCache
+from app.core import generate_reports
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+
+@pytest.fixture(autouse=True)
+def key_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "keys" / "cache.key")
+    monkeypatch.setattr(cache_mod, "DEFAULT_KEY_PATH", path)
+    return path
+
+
+def _entries(cache_dir):
+    return [os.path.join(cache_dir, n) for n in os.listdir(cache_dir) if n.endswith(".pkl.z")]
+
+
+def test_roundtrip_and_key_file(tmp_path, key_path):
+    cache = ProfileCache(str(tmp_path / "c"))
+    cache.put("k", {"df": pd.DataFrame({"a": [1, 2]})})
+    assert cache.get("k")["df"]["a"].tolist() == [1, 2]
+    assert cache.get("yok") is None
+    assert os.stat(key_path).st_mode & 0o077 == 0
+
+
+def test_tampered_or_foreign_entries_are_not_unpickled(tmp_path):
+    cache_dir = str(tmp_path / "c")
+    ProfileCache(cache_dir).put("k", [1, 2, 3])
+    entry = _entries(cache_dir)[0]
+    data = bytearray(open(entry, "rb").read())
+    data[-1] ^= 1
+    open(entry, "wb").write(bytes(data))
+    assert ProfileCache(cache_dir).get("k") is None
+    assert not os.path.exists(entry)
+
+    # baska anahtarla imzalanmis kayit da gecersiz
+    ProfileCache(cache_dir, key_path=str(tmp_path / "other.key")).put("k", [1])
+    assert ProfileCache(cache_dir).get("k") is None
+
+
+def test_key_inside_cache_dir_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ProfileCache(str(tmp_path / "c"), key_path=str(tmp_path / "c" / "cache.key"))
+
+
+def test_lru_eviction(tmp_path):
+    cache = ProfileCache(str(tmp_path / "c"), max_bytes=600)
+    for i in range(5):
+        cache.put(f"k{i}", os.urandom(200))
+    assert cache.get("k0") is None
+    assert cache.get("k4") is not None
+
+
+def test_report_cache_hit_and_invalidation(tmp_path):
+    path = tmp_path / "w.xlsx"
+    pd.DataFrame({"a": range(30)}).to_excel(path, index=False)
+    logs = []
+    run = lambda **kw: generate_reports(str(path), str(tmp_path / "out"), TEMPLATE_DIR, formats=("json",),
+                                        cache_dir=str(tmp_path / "c"), log_cb=logs.append, **kw)
+
+    first = run()
+    assert not any("Cache'ten alindi" in m for m in logs)
+    logs.clear()
+    assert run()["summary"] == first["summary"]
+    assert any("Cache'ten alindi" in m for m in logs)
+
+    # ayar degisirse anahtar da degisir
+    logs.clear()
+    run(sample_threshold=10)
+    assert not any("Cache'ten alindi" in m for m in logs)
+
+    # icerik degisirse eski sonuc kullanilmaz
+    pd.DataFrame({"a": range(40)}).to_excel(path, index=False)
+    logs.clear()
+    assert run()["summary"]["toplam_satir"] == 40
+    assert not any("Cache'ten alindi" in m for m in logs)
+
+
+def _two_sheets(path, b_values, label="x"):
+    with pd.ExcelWriter(path) as w:
+        pd.DataFrame({"a": range(20), "t": [label] * 20}).to_excel(w, sheet_name="A", index=False)
+        pd.DataFrame({"b": b_values}).to_excel(w, sheet_name="B", index=False)
+
+
+def test_unchanged_sheets_reused_but_text_edit_invalidates_all(tmp_path):
+    from app.excel_reader import sheet_fingerprints
+
+    path = tmp_path / "w.xlsx"
+    _two_sheets(path, range(10))
+    base = sheet_fingerprints(str(path))
+    _two_sheets(path, range(5, 15))
+    numbers = sheet_fingerprints(str(path))
+    assert numbers["A"] == base["A"] and numbers["B"] != base["B"]
+
+    logs = []
+    generate_reports(str(path), str(tmp_path / "out"), TEMPLATE_DIR, formats=("json",),
+                     cache_dir=str(tmp_path / "c"), log_cb=logs.append)
+    _two_sheets(path, range(7, 17))
+    logs.clear()
+    generate_reports(str(path), str(tmp_path / "out"), TEMPLATE_DIR, formats=("json",),
+                     cache_dir=str(tmp_path / "c"), log_cb=logs.append)
+    assert any("Degismeyen 1 sheet cache'ten alindi: A" in m for m in logs)
+
+    # sharedStrings workbook'ta ortak (Excel'in yazdigi dosyalarda): metin degisirse tum izler degisir
+    def with_shared(text):
+        out = tmp_path / f"ss-{text}.xlsx"
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(out, "w") as dst:
+            for item in src.infolist():
+                dst.writestr(item, src.read(item))
+            dst.writestr("xl/sharedStrings.xml", f"<sst><si><t>{text}</t></si></sst>")
+        return sheet_fingerprints(str(out))
+
+    before, after = with_shared("x"), with_shared("y")
+    assert after["A"] != before["A"] and after["B"] != before["B"]
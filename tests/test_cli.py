@@ -0,0 +1,60 @@
+import json
+import os
+
+import pandas as pd
+
+from app.cli import expand_inputs, main, run_batch
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+
+def _workbook(path, sheets=1):
+    with pd.ExcelWriter(path) as w:
+        for i in range(sheets):
+            pd.DataFrame({"a": range(20), "b": ["x", "y"] * 10}).to_excel(w, sheet_name=f"S{i}", index=False)
+    return str(path)
+
+
+def test_expand_inputs_filters_folders_and_globs(tmp_path):
+    good = _workbook(tmp_path / "a.xlsx")
+    (tmp_path / "notes.md").write_text("x")
+    (tmp_path / "~$a.xlsx").write_text("lock")
+    assert expand_inputs([str(tmp_path)]) == [good]
+    assert expand_inputs([str(tmp_path / "*.xlsx"), good]) == [good]
+
+
+def test_exit_codes_and_index(tmp_path):
+    good = _workbook(tmp_path / "good.xlsx")
+    bad = tmp_path / "bad.xlsx"
+    bad.write_bytes(b"PK\x03\x04 bozuk zip")
+    out = tmp_path / "out"
+
+    assert main(["profile", good, "--out", str(out), "--format", "json"]) == 0
+    assert main(["profile", good, str(bad), "--out", str(out), "--format", "json"]) == 1
+
+    rows = {os.path.basename(r["dosya"]): r for r in json.loads((out / "index.json").read_text(encoding="utf-8"))}
+    assert rows["good.xlsx"]["durum"] == "ok"
+    assert rows["good.xlsx"]["toplam_satir"] == 20
+    assert rows["bad.xlsx"]["durum"] == "error"
+    assert rows["bad.xlsx"]["hata"]
+    assert (out / "index.csv").exists()
+
+
+def test_no_inputs_exit_code(tmp_path):
+    assert main(["profile", str(tmp_path / "*.xlsx"), "--out", str(tmp_path / "out")]) == 2
+
+
+def test_file_job_can_start_its_own_pool(tmp_path):
+    # dosya process'i daemon degil: generate_reports(workers=2) kendi havuzunu acabilir
+    path = _workbook(tmp_path / "multi.xlsx", sheets=3)
+    options = {"template_dir": TEMPLATE_DIR, "formats": ("json",), "workers": 2}
+    rows = run_batch([path], str(tmp_path / "out"), options, workers=2, log=lambda m: None)
+    assert [r["status"] for r in rows] == ["ok"]
+    assert rows[0]["result"]["summary"]["sheet_sayisi"] == 3
+
+
+def test_fast_jobs_are_not_reported_as_crashes(tmp_path):
+    paths = [_workbook(tmp_path / f"f{i}.xlsx") for i in range(6)]
+    options = {"template_dir": TEMPLATE_DIR, "formats": ("json",)}
+    rows = run_batch(paths, str(tmp_path / "out"), options, workers=3, log=lambda m: None)
+    assert [r["status"] for r in rows] == ["ok"] * 6
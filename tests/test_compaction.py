@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.column_stats import guess_dtype
+from app.compaction import compact_frame
+from app.duplicates import row_hashes
+from app.profiler import profile_columns
+
+
+def _frame(n=2_000):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        "durum": rng.choice(["AKTIF", "PASIF", None], n),
+        "sube": rng.choice([f"Sube {i}" for i in range(12)], n),
+        "aciklama": [f"kayit {i} notu" for i in range(n)],
+        "adet": rng.integers(0, 100, n),
+        "buyuk": rng.integers(-2 ** 40, 2 ** 40, n),
+        "tutar": rng.random(n) * 1000,
+        "kod": pd.Series(rng.choice(["0012", "0100", "7"], n), dtype=object),
+        "bayrak": rng.choice(["EVET", "HAYIR"], n),
+        "tarih": rng.choice(["01.02.2025", "17.10.2026"], n),
+        "karisik": pd.Series(rng.choice([1, "1", "a", None], n), dtype=object),
+        "tarih_dt": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 30, n), unit="D"),
+        "ok": rng.random(n) < 0.5,
+    })
+
+
+def test_compaction_saves_memory_and_keeps_values():
+    df = _frame()
+    out, before, after = compact_frame(df)
+    assert after < before
+    assert isinstance(out["durum"].dtype, pd.CategoricalDtype)
+    assert out["adet"].dtype == np.int8
+    assert out["karisik"].dtype == object
+    for col in df.columns:
+        assert out[col].astype(object).where(out[col].notna(), None).tolist() == \
+            df[col].astype(object).where(df[col].notna(), None).tolist()
+
+
+@pytest.mark.parametrize("options", [{}, {"distinct_mode": "hll", "topk_mode": "sketch", "quantile_mode": "kll"}])
+def test_profiles_unchanged_after_compaction(options):
+    df = _frame()
+    out, _, _ = compact_frame(df)
+    pd.testing.assert_frame_equal(profile_columns("s", out, **options), profile_columns("s", df, **options))
+    assert [guess_dtype(out[c]) for c in out.columns] == [guess_dtype(df[c]) for c in df.columns]
+    assert (row_hashes(out) == row_hashes(df)).all()
@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+
+import pandas as pd
+import pytest
+
+from app import core
+from app.core import generate_reports
+from app.progress import Cancelled, CancelToken
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+
+def _workbook(path, sheets=3, rows=50):
+    with pd.ExcelWriter(path) as w:
+        for i in range(sheets):
+            pd.DataFrame({"a": range(rows), "b": ["x", "y"] * (rows // 2)}).to_excel(w, sheet_name=f"S{i}",
+                                                                                   index=False)
+    return str(path)
+
+
+def _cancel_on(stage, token):
+    def cb(event):
+        if event["asama"] == stage:
+            token.cancel()
+    return cb
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancel_stops_run_without_reports(tmp_path, workers):
+    path = _workbook(tmp_path / "w.xlsx")
+    token = CancelToken()
+    with pytest.raises(Cancelled):
+        generate_reports(path, str(tmp_path / "out"), TEMPLATE_DIR, workers=workers, formats=("json",),
+                         progress_cb=_cancel_on("okuma", token), cancel_token=token)
+    assert not (tmp_path / "out").exists() or not os.listdir(tmp_path / "out")
+
+
+def test_worker_checks_shared_cancel_event(tmp_path, monkeypatch):
+    path = _workbook(tmp_path / "w.xlsx", sheets=1)
+    event = multiprocessing.get_context().Event()
+    event.set()
+    monkeypatch.setattr(core, "_worker_cancel", None)
+    core._init_worker(event)
+    settings = {"streaming": True, "auto_header": False, "chunk_size": 10, "columns": None}
+    with pytest.raises(Cancelled):
+        core._sheet_task(path, "S0", settings)
+
+
+def test_in_memory_sheets_are_released_one_at_a_time():
+    sheets = {"a": {"df": pd.DataFrame()}, "b": {"df": pd.DataFrame()}}
+    seen = []
+    for name, _ in core._drain(sheets):
+        seen.append((name, sorted(sheets)))
+    assert seen == [("a", ["b"]), ("b", [])]
+
+
+def _mixed_workbook(path):
+    with pd.ExcelWriter(path) as w:
+        pd.DataFrame({"id": range(300), "ad": [f"n{i % 40}" for i in range(300)]}).to_excel(w, sheet_name="A",
+                                                                                              index=False)
+        pd.DataFrame({"t": pd.date_range("2026-01-01", periods=80), "x": [1.5, None] * 40}).to_excel(
+            w, sheet_name="B", index=False)
+        pd.DataFrame({"k": ["x", "x", "y"] * 50}).to_excel(w, sheet_name="C", index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parallel_output_equals_serial(tmp_path, streaming):
+    path = _mixed_workbook(tmp_path / "w.xlsx")
+    outputs, logs = {}, {}
+    for workers in (1, 3):
+        logs[workers] = []
+        res = generate_reports(path, str(tmp_path / f"out{workers}"), TEMPLATE_DIR, workers=workers,
+                               streaming=streaming, plan="manual", formats=("ndjson",),
+                               log_cb=logs[workers].append)
+        outputs[workers] = open(res["out_ndjson"], encoding="utf-8").read()
+    assert outputs[1] == outputs[3]
+    sheet_logs = {w: [m for m in lines if m.startswith("Sheet ")] for w, lines in logs.items()}
+    assert sheet_logs[1] == sheet_logs[3]
+    assert [m.split(": ")[1].split(" ")[0] for m in sheet_logs[3]] == ["A", "B", "C"]
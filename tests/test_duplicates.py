@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.duplicates import DuplicateIndex, row_hashes
+from app.quality_checks import duplicate_analysis
+
+
+def _count(chunks, confirm=False) -> int:
+    index = DuplicateIndex(confirm=confirm)
+    for chunk in chunks:
+        index.update(chunk)
+    if index.needs_confirm:
+        index.confirm_rows(chunks)
+    return index.dup_count
+
+
+def _frames():
+    rng = np.random.default_rng(7)
+    n = 600
+    mixed = pd.DataFrame({
+        "a": rng.integers(0, 10, n),
+        "b": rng.choice(["x", "y", None], n),
+        "c": np.where(rng.random(n) < 0.1, np.nan, rng.integers(0, 3, n) / 2),
+        "d": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 3, n), unit="D"),
+    })
+    return [
+        mixed,
+        pd.DataFrame({"a": [2 ** 53, 2 ** 53 + 1, 2 ** 53]}),
+        pd.DataFrame({"a": pd.Series([1, "1", 1.0, "1"], dtype=object)}),
+        pd.DataFrame({"a": [1.5, np.nan, 1.5, np.nan], "b": ["x", None, "x", None]}),
+        pd.DataFrame({"a": pd.Series(["p", "q", "p"], dtype="category")}),
+    ]
+
+
+@pytest.mark.parametrize("df", _frames())
+@pytest.mark.parametrize("confirm", [False, True])
+def test_matches_pandas_duplicated(df, confirm):
+    expected = int(df.duplicated().sum())
+    assert _count([df], confirm) == expected
+    # parca sinirlari sonucu degistirmez
+    assert _count([df.iloc[i:i + 2] for i in range(0, len(df), 2)], confirm) == expected
+
+
+def test_int_and_float_chunks_hash_alike():
+    assert (row_hashes(pd.DataFrame({"a": [1, 2]})) == row_hashes(pd.DataFrame({"a": [1.0, 2.0]}))).all()
+    assert row_hashes(pd.DataFrame({"a": [1.5]}))[0] != row_hashes(pd.DataFrame({"a": [1]}))[0]
+
+
+def test_confirm_keeps_only_repeated_hashes():
+    df = pd.DataFrame({"a": range(1000)})
+    index = DuplicateIndex(confirm=True).update(df)
+    assert not index.needs_confirm  # tekrar eden hash yok: ikinci gecis gereksiz
+    assert index.dup_count == 0
+
+
+def test_duplicate_analysis_report():
+    df = pd.DataFrame({"a": [1, 1, 2, 2], "b": ["x", "x", "y", "z"]})
+    row = duplicate_analysis("s", df, confirm=True).iloc[0]
+    assert row["tam_satir_duplicate_sayisi"] == 1
+    assert row["tam_satir_duplicate_oran"] == 25.0
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.header_detector import _cell_to_str, _score_matrix, detect_header_row, score_row
+from benchmarks.bench_header import legacy_detect_header_row, make_preview
+
+ROWS = [
+    ["kolon_a", "kolon_b", "Tutar", ""],
+    ["", "", "", ""],
+    ["Unnamed: 0", "Column1", "column 2", "Column"],
+    ["ğüşİ", "Ölçü", "123", "1.5"],
+    ["x" * 45, "y" * 31, "a", "a"],
+    ["1", "2", "3", "4"],
+    ["  ", "", "Ay", ""],
+]
+
+
+def test_score_matrix_matches_score_row():
+    strs = np.array([[_cell_to_str(v) for v in row] for row in ROWS], dtype=object)
+    base, counts = _score_matrix(strs)
+    assert base.tolist() == [score_row(r) for r in strs.tolist()]
+    assert counts.tolist() == [sum(v != "" for v in r) for r in strs.tolist()]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_detect_header_row_matches_legacy(seed):
+    df = make_preview(40, 12, seed)
+    assert detect_header_row(df, 40) == legacy_detect_header_row(df, 40)
+    assert detect_header_row(df, 7) == legacy_detect_header_row(df, 7)
+
+
+def test_detect_header_row_edge_cases():
+    assert detect_header_row(pd.DataFrame(), 30) == (0, 0.0)
+    empty = pd.DataFrame([[None, None]] * 5)
+    assert detect_header_row(empty) == legacy_detect_header_row(empty)
+    messy = pd.DataFrame([["Rapor", None, None], [None] * 3, [None] * 3,
+                          ["ad", "soyad", "yas"], ["a", "b", 1], ["c", "d", 2], ["e", "f", 3]])
+    row, conf = detect_header_row(messy)
+    assert row == 3 and conf > 0
+    assert (row, conf) == legacy_detect_header_row(messy)
@@ -0,0 +1,78 @@
+import pytest
+
+from app.core import _sampling_note
+from app.planner import (
+    IN_MEMORY_BYTES_PER_CELL,
+    PLAN_IN_MEMORY,
+    PLAN_MANUAL_MEMORY,
+    PLAN_MANUAL_STREAM,
+    PLAN_STREAM_EXACT,
+    PLAN_STREAM_SAMPLE,
+    plan_sheet,
+    plan_workbook,
+)
+
+DIMS = {"rows": 100_000, "cols": 10}
+CELLS = DIMS["rows"] * DIMS["cols"]
+
+
+def _plan(budget, dims=DIMS, **kwargs):
+    return plan_sheet(dims, budget, chunk_size=1000, sample_n_each=500, **kwargs)
+
+
+def test_fits_in_memory():
+    p = _plan(CELLS * IN_MEMORY_BYTES_PER_CELL)
+    assert (p["plan"], p["streaming"], p["sample_threshold"]) == (PLAN_IN_MEMORY, False, None)
+
+
+def test_streams_exact_with_sketches_when_frame_does_not_fit():
+    p = _plan(CELLS * IN_MEMORY_BYTES_PER_CELL // 2)
+    assert (p["plan"], p["streaming"], p["sample_threshold"]) == (PLAN_STREAM_EXACT, True, None)
+    assert p["profile_options"]["distinct_mode"] == "hll"
+
+
+def test_samples_when_even_sketches_do_not_fit():
+    p = _plan(1024 * 1024)
+    assert (p["plan"], p["streaming"]) == (PLAN_STREAM_SAMPLE, True)
+    assert p["sample_threshold"] >= 3 * 500
+    assert f"{p['sample_threshold']:,} satir" in p["plan_nedeni"]
+
+
+@pytest.mark.parametrize("streaming, expected", [(False, PLAN_MANUAL_MEMORY), (True, PLAN_MANUAL_STREAM)])
+def test_unknown_size_falls_back_to_manual_settings(streaming, expected):
+    p = _plan(1, dims=None, streaming=streaming, sample_threshold=123)
+    assert (p["plan"], p["sample_threshold"]) == (expected, 123)
+
+
+def test_xml_size_is_used_without_dimension():
+    p = _plan(10 ** 12, dims={"xml_bytes": 2_000_000, "cols": None})
+    assert p["plan"] == PLAN_IN_MEMORY
+    assert "XML boyutu" in p["plan_nedeni"]
+
+
+def test_workbook_modes():
+    dims = {"a": DIMS, "b": None}
+    auto = plan_workbook(dims, ["a", "b"], 10 ** 12, 1000, 500)
+    assert [p["plan"] for p in auto.values()] == [PLAN_IN_MEMORY, PLAN_MANUAL_MEMORY]
+    manual = plan_workbook(dims, ["a", "b"], 10 ** 12, 1000, 500, streaming=True, mode="manual")
+    assert {p["plan"] for p in manual.values()} == {PLAN_MANUAL_STREAM}
+    with pytest.raises(ValueError):
+        plan_workbook(dims, ["a"], 1, 1000, 500, mode="yok")
+
+
+def test_sampling_note_uses_each_sheets_threshold():
+    results = [
+        {"sampled": True, "sheet_row": {"sheet_adi": "a", "satir_sayisi": 90_000, "plan": PLAN_STREAM_SAMPLE,
+                                        "plan_nedeni": "butce"}},
+        {"sampled": True, "sheet_row": {"sheet_adi": "b", "satir_sayisi": 300_000}},
+        {"sampled": False, "sheet_row": {"sheet_adi": "c", "satir_sayisi": 10}},
+    ]
+    plans = {"a": {"sample_threshold": 40_000}, "b": {"sample_threshold": 200_000}}
+    note = _sampling_note(results, plans, 200_000, 5_000)
+    assert "a: 90,000 satir > esik 40,000" in note
+    assert "b: 300,000 satir > esik 200,000" in note
+    assert "c:" not in note.split("Calisma plani")[0]
+    assert "a: streaming_ornekleme (butce)" in note
+
+    quiet = _sampling_note(results[2:], {}, 200_000, 5_000)
+    assert quiet == "Tum satirlar analiz edildi, ornekleme kullanilmadi."
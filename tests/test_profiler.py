@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from app.profiler import profile_chunks, profile_columns
+
+SKETCH = dict(distinct_mode="hll", topk_mode="sketch", quantile_mode="kll")
+
+
+def _chunks(df: pd.DataFrame, size: int) -> list:
+    return [df.iloc[i:i + size] for i in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("options", [{}, SKETCH])
+@pytest.mark.parametrize("values", [
+    # ilk parca "," ondalikli: nokta her parcada binlik
+    ["1.234,56", "3.125", "3.125", "12.500"],
+    # sayisal parca + metin parca: kolon text, sayilar en sik degerlerde
+    ["7"] * 100 + ["x", "y", "y"],
+    ["17.10.2026", "01.02.2025", None, "03.04.2024"],
+    ["EVET", "HAYIR", "EVET", None],
+    ["a", "b", None, "a", "c"],
+])
+def test_chunks_equal_single_pass(values, options):
+    df = pd.DataFrame({"k": pd.Series(values, dtype=object)})
+    expected = profile_columns("s", df, **options)
+    for size in (1, 2, 100):
+        pd.testing.assert_frame_equal(profile_chunks("s", _chunks(df, size), **options), expected)
+
+
+def test_numeric_chunks_feed_top_values():
+    chunks = [pd.DataFrame({"k": [7] * 100}), pd.DataFrame({"k": ["x", "y", "y"]})]
+    row = profile_chunks("s", chunks).iloc[0]
+    assert row["tahmini_tip"] == "text"
+    assert (row["en_sik_1"], row["en_sik_1_sayi"]) == ("7", 100)
+    assert (row["en_sik_2"], row["en_sik_2_sayi"]) == ("y", 2)
+
+
+def test_separator_decided_once_per_column():
+    # ilk parca "." ondalik secer; ikinci parca bu kurala uymaz -> kolon text,
+    # "3.125" iki farkli sayi olarak istatistiklere karismaz
+    chunks = [pd.DataFrame({"k": ["3.125", "12.500"]}), pd.DataFrame({"k": ["1.234,56", "3.125"]})]
+    row = profile_chunks("s", chunks).iloc[0]
+    assert row["tahmini_tip"] == "text"
+    assert row["min"] is None and row["ortalama"] is None
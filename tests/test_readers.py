@@ -0,0 +1,109 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from app.excel_reader import (
+    detect_engine,
+    list_sheet_names,
+    read_excel_all_sheets,
+    sheet_dimensions,
+    stream_excel_all_sheets,
+)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": range(1, 501), "ad": [f"n{i}" for i in range(500)],
+                         "tutar": [i / 4 for i in range(500)]})
+
+
+def _stream_frame(path, **kwargs) -> pd.DataFrame:
+    parts = [c for _, info in stream_excel_all_sheets(path, auto_header=False, chunk_size=64, **kwargs)
+             for c in info["chunks"]]
+    return pd.concat(parts, ignore_index=True)
+
+
+def test_detect_engine_by_signature(tmp_path, frame):
+    frame.to_excel(tmp_path / "a.xlsx", index=False)
+    frame.to_csv(tmp_path / "a.csv", index=False)
+    frame.to_parquet(tmp_path / "a.parquet")
+    (tmp_path / "a.xlsx").rename(tmp_path / "zip.dat")
+    (tmp_path / "a.csv").rename(tmp_path / "misnamed.xlsx")
+    (tmp_path / "bin.xls").write_bytes(b"\x00\x01\x02 imzasiz ikili")
+    (tmp_path / "empty.csv").write_bytes(b"")
+
+    assert detect_engine(str(tmp_path / "zip.dat")) == "xlsx"
+    assert detect_engine(str(tmp_path / "a.parquet")) == "parquet"
+    # imza yok + metin: uzantiya bakilmadan csv
+    assert detect_engine(str(tmp_path / "misnamed.xlsx")) == "csv"
+    assert detect_engine(str(tmp_path / "bin.xls")) == "pandas"
+    assert detect_engine(str(tmp_path / "empty.csv")) == "csv"
+
+
+def test_misnamed_csv_is_read(tmp_path, frame):
+    path = tmp_path / "rapor.xlsx"
+    frame.to_csv(path, index=False)
+    df = read_excel_all_sheets(str(path), auto_header=True)["rapor"]["df"]
+    assert df.shape == frame.shape
+    assert list(df.columns) == list(frame.columns)
+
+
+def test_csv_sniffs_delimiter_encoding_and_header(tmp_path, frame):
+    path = tmp_path / "tr.csv"
+    body = "Aylik rapor\n\n" + frame.to_csv(index=False, sep=";") + "\n"
+    path.write_bytes(body.replace("n1;", "ğ1;").encode("cp1254"))
+    info = read_excel_all_sheets(str(path), auto_header=True)["tr"]
+    assert info["header_row"] == 3
+    assert list(info["df"].columns) == ["id", "ad", "tutar"]
+    assert len(info["df"]) == len(frame)
+
+
+def test_csv_reads_text_and_keeps_leading_zeros(tmp_path):
+    path = tmp_path / "kod.csv"
+    path.write_text("kod,adet\n00123,1\n00007,2\n", encoding="utf-8")
+    df = read_excel_all_sheets(str(path), auto_header=False)["kod"]["df"]
+    assert df["kod"].tolist() == ["00123", "00007"]
+    assert df["adet"].tolist() == ["1", "2"]  # tip cikarimi profilde karar verir
+
+
+def test_csv_row_wider_than_sample_is_skipped_with_warning(tmp_path):
+    path = tmp_path / "genis.csv"
+    rows = ["a,b,c"] + [f"{i},{i},{i}" for i in range(20000)]
+    rows[41] += ",fazla"           # ornek (ilk 64 KB) icinde: kolon eklenir
+    rows[19000] += ",x,y"          # ornekten sonra, daha genis: atlanir
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    with pytest.warns(UserWarning, match="1 satir atlandi"):
+        df = _stream_frame(str(path))
+    assert df.shape == (20000 - 1, 4)
+    assert df.iloc[40].tolist()[-1] == "fazla"
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet", "xlsx"])
+def test_stream_equals_read_and_column_selection(tmp_path, frame, suffix):
+    path = str(tmp_path / f"d.{suffix}")
+    if suffix == "xlsx":
+        frame.to_excel(path, index=False, sheet_name="d")
+    else:
+        getattr(frame, f"to_{suffix}")(path, index=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        full = read_excel_all_sheets(path, auto_header=False)["d"]["df"]
+        streamed = _stream_frame(path)
+    assert streamed.shape == full.shape == frame.shape
+    assert streamed.astype(str).equals(full.astype(str))
+
+    picked = _stream_frame(path, columns=["tutar", "id"])
+    assert list(picked.columns) == ["tutar", "id"]
+    with pytest.raises(KeyError):
+        read_excel_all_sheets(path, auto_header=False, columns=["yok"])
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet"])
+def test_single_sheet_engines(tmp_path, frame, suffix):
+    path = str(tmp_path / f"tek.{suffix}")
+    getattr(frame, f"to_{suffix}")(path, index=False)
+    assert list_sheet_names(path) == ["tek"]
+    dims = sheet_dimensions(path)["tek"]
+    assert dims["cols"] == 3
+    assert dims["rows"] == len(frame) + 1  # header dahil
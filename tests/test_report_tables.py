@@ -0,0 +1,77 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from app.core import generate_reports
+from app.report_tables import REPORT_SCHEMA, REPORT_SCHEMA_NAME, REPORT_SCHEMA_VERSION, conform
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+PANDAS_DTYPES = {"string": "string", "int64": "Int64", "float64": "Float64"}
+
+
+def test_conform_orders_types_and_fills_columns():
+    df = pd.DataFrame({"p99": [1.0, 2.5], "kolon_adi": ["a", "b"], "dolu_sayi": [3.0, None],
+                       "p90": [7, 8], "min": pd.Series([2 ** 60, None], dtype=object)})
+    out = conform("kolon_profili", df)
+    known = [c for c, _ in REPORT_SCHEMA["kolon_profili"]]
+    assert list(out.columns) == known + ["p90"]
+    assert [str(out[c].dtype) for c in known] == [PANDAS_DTYPES[t] for _, t in REPORT_SCHEMA["kolon_profili"]]
+    assert out["p99"].tolist() == ["1", "2.5"]
+    assert out["min"].iloc[0] == str(2 ** 60)
+    assert out["dolu_sayi"].iloc[1] is pd.NA
+    assert out["sheet_adi"].isna().all()
+    assert str(out["p90"].dtype) == "string"
+
+
+@pytest.fixture
+def report(tmp_path):
+    path = tmp_path / "w.xlsx"
+    with pd.ExcelWriter(path) as w:
+        pd.DataFrame({"a": [1, 1, 2, None], "b": ["x", "x", "y", "z"]}).to_excel(w, sheet_name="S", index=False)
+        pd.DataFrame({"t": pd.date_range("2026-01-01", periods=3)}).to_excel(w, sheet_name="T", index=False)
+    res = generate_reports(str(path), str(tmp_path / "out"), TEMPLATE_DIR,
+                           formats=("parquet", "arrow", "ndjson"))
+    return res
+
+
+def test_formats_are_selectable(report):
+    assert report["out_xlsx"] is None and report["out_html"] is None
+    assert all(report[f"out_{f}"] for f in ("parquet", "arrow", "ndjson"))
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_tables_follow_schema(report, fmt):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    for table, cols in REPORT_SCHEMA.items():
+        path = os.path.join(report[f"out_{fmt}"], f"{table}.{fmt}")
+        t = pq.read_table(path) if fmt == "parquet" else feather.read_table(path)
+        assert t.column_names[:len(cols)] == [c for c, _ in cols]
+        for c, typ in cols:
+            assert t.schema.field(c).type == {"string": pa.string(), "int64": pa.int64(),
+                                              "float64": pa.float64()}[typ]
+        meta = t.schema.metadata
+        assert meta[b"schema"].decode() == REPORT_SCHEMA_NAME
+        assert meta[b"schema_version"].decode() == str(REPORT_SCHEMA_VERSION)
+        assert meta[b"table"].decode() == table
+
+
+def test_ndjson_records_follow_schema(report):
+    with open(report["out_ndjson"], encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    meta = lines[0]
+    assert (meta["table"], meta["schema_version"]) == ("_meta", REPORT_SCHEMA_VERSION)
+    assert meta["tables"] == {t: [c for c, _ in cols] for t, cols in REPORT_SCHEMA.items()}
+    by_table = {}
+    for rec in lines[1:]:
+        by_table.setdefault(rec.pop("table"), []).append(rec)
+    for table, recs in by_table.items():
+        for rec in recs:
+            assert list(rec)[:len(REPORT_SCHEMA[table])] == meta["tables"][table]
+    # bos tablo (uyari yok) satir uretmez
+    assert set(by_table) == set(REPORT_SCHEMA) - {"veri_kalite_uyarilari"}
+    assert by_table["duplicate_analizi"][0]["tam_satir_duplicate_sayisi"] == 1
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core import _process_frame
+from app.sampler import StreamSampler
+
+
+def _frame(n=5000):
+    return pd.DataFrame({"i": np.arange(n), "v": np.where(np.arange(n) % 7 == 0, np.nan, 1.0)})
+
+
+def _sample(df, chunk_size, threshold=1000, n_each=100):
+    sampler = StreamSampler(threshold=threshold, n_each=n_each)
+    for start in range(0, len(df), chunk_size):
+        sampler.update(df.iloc[start:start + chunk_size])
+    return sampler
+
+
+def test_reservoir_is_seeded_and_repeatable():
+    df = _frame()
+    first, sampled = _sample(df, 250).result()
+    again, _ = _sample(df, 250).result()
+    assert sampled
+    pd.testing.assert_frame_equal(first, again)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 333, 5000])
+def test_head_tail_reservoir_and_exact_counts(chunk_size):
+    df = _frame()
+    sampler = _sample(df, chunk_size)
+    out, sampled = sampler.result()
+    ids = out["i"].tolist()
+
+    assert sampled and len(out) == 300
+    assert ids[:100] == list(range(100))
+    assert ids[-100:] == list(range(4900, 5000))
+    middle = ids[100:200]
+    assert middle == sorted(middle) and len(set(middle)) == 100
+    assert all(100 <= i < 4900 for i in middle)
+    # sayimlar orneklenmeyen satirlar dahil tam
+    assert sampler.rows == len(df)
+    assert sampler.missing == {"i": 0, "v": int(df["v"].isna().sum())}
+
+
+def test_under_threshold_keeps_every_row():
+    df = _frame(800)
+    out, sampled = _sample(df, 300).result()
+    assert not sampled
+    pd.testing.assert_frame_equal(out, df)
+
+
+def test_sampled_profile_marks_unique_scope():
+    df = pd.DataFrame({"k": [f"v{i}" for i in range(3000)]})
+    prof = _process_frame("s", {"df": df}, 1000, 100, None)["profile"].iloc[0]
+    assert prof["dolu_sayi"] == 3000
+    assert prof["unique_kaynagi"] == "ornek"
+    assert prof["unique_oran"] == round(prof["unique_sayi"] / 300 * 100, 2)
+
+    full = _process_frame("s", {"df": df}, None, 100, None)["profile"].iloc[0]
+    assert full["unique_kaynagi"] == "tum"
+    assert full["unique_oran"] == round(full["unique_sayi"] / full["dolu_sayi"] * 100, 2)
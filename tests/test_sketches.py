@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.profiler import profile_columns
+from app.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+@pytest.mark.parametrize("n", [50, 5_000, 200_000])
+@pytest.mark.parametrize("precision", [10, 14])
+def test_hll_estimate_within_error_bound(n, precision):
+    hll = HyperLogLog(precision).add(pd.Series([f"id-{i}" for i in range(n)]))
+    # 4 standart hata: sabit hash'lerle deterministik, pratikte hic asilmaz
+    assert abs(hll.estimate() - n) <= 4 * hll.relative_error * n + 1
+
+
+def test_hll_merge_equals_single_pass_and_ignores_repeats():
+    values = pd.Series(np.arange(30_000))
+    whole = HyperLogLog(12).add(values)
+    left = HyperLogLog(12).add(values[:10_000])
+    right = HyperLogLog(12).add(pd.concat([values[10_000:], values[:500]]))
+    assert np.array_equal(left.merge(right).registers, whole.registers)
+    # int ve float parcalar ayni degeri ayni hash'le sayar
+    assert np.array_equal(HyperLogLog(12).add(values.astype(float)).registers, whole.registers)
+
+
+def test_hll_rejects_bad_precision_and_mismatched_merge():
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+
+
+def test_profile_reports_hll_error_next_to_value():
+    df = pd.DataFrame({"k": [f"v{i % 20_000}" for i in range(60_000)]})
+    row = profile_columns("s", df, distinct_mode="hll", hll_precision=14).iloc[0]
+    assert row["unique_hata_payi"] == round(HyperLogLog(14).relative_error * 100, 2)
+    assert abs(row["unique_sayi"] - 20_000) <= 4 * row["unique_hata_payi"] / 100 * 20_000
+    assert profile_columns("s", df).iloc[0]["unique_hata_payi"] == 0.0
+
+
+def _zipf_chunks(n_chunks=8, size=5_000, seed=3):
+    rng = np.random.default_rng(seed)
+    return [pd.Series(rng.zipf(1.3, size).astype(str)) for _ in range(n_chunks)]
+
+
+@pytest.mark.parametrize("capacity", [4, 16, 64])
+def test_space_saving_bounds_hold_across_chunks_and_merges(capacity):
+    chunks = _zipf_chunks()
+    truth = pd.concat(chunks).value_counts()
+
+    # yarisi parca parca guncellenir, yarisi ayri ozetlenip birlestirilir
+    left, right = SpaceSaving(capacity), SpaceSaving(capacity)
+    for c in chunks[:4]:
+        left.update(c)
+    for c in chunks[4:]:
+        right.update(c)
+    sketch = left.merge(right)
+
+    assert len(sketch.counters) <= capacity
+    for value, (count, err) in sketch.counters.items():
+        assert count - err <= truth[value] <= count
+    untracked = truth.drop(list(sketch.counters), errors="ignore")
+    assert untracked.max() <= sketch.bound
+
+
+def test_space_saving_finds_heavy_hitters():
+    chunks = _zipf_chunks()
+    truth = pd.concat(chunks).value_counts()
+    sketch = SpaceSaving(16)
+    for c in chunks:
+        sketch.update(c)
+    top = sketch.top(3)
+    assert [v for v, _, _ in top] == truth.index[:3].tolist()
+    for value, count, lower in top:
+        assert lower <= truth[value] <= count
+
+
+def test_profile_reports_top_counts_with_lower_bound():
+    df = pd.DataFrame({"k": ["a"] * 50 + ["b"] * 30 + ["c"] * 20 + [f"x{i}" for i in range(100)]})
+    exact = profile_columns("s", df).iloc[0]
+    assert [exact[f"en_sik_{i}"] for i in (1, 2, 3)] == ["a", "b", "c"]
+    assert [exact[f"en_sik_{i}_sayi"] for i in (1, 2, 3)] == [50, 30, 20]
+    assert [exact[f"en_sik_{i}_alt_sinir"] for i in (1, 2, 3)] == [50, 30, 20]
+
+    sketch = profile_columns("s", df, topk_mode="sketch", topk_capacity=8).iloc[0]
+    assert [sketch[f"en_sik_{i}"] for i in (1, 2, 3)] == ["a", "b", "c"]
+    for i, true in zip((1, 2, 3), (50, 30, 20)):
+        assert sketch[f"en_sik_{i}_alt_sinir"] <= true <= sketch[f"en_sik_{i}_sayi"]
+
+
+QS = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def _rank_errors(sketch, values):
+    ordered = np.sort(values)
+    out = []
+    for q, v in zip(QS, sketch.quantiles(QS)):
+        lo = np.searchsorted(ordered, v, side="left") / len(ordered)
+        hi = np.searchsorted(ordered, v, side="right") / len(ordered)
+        out.append(0.0 if lo <= q <= hi else min(abs(q - lo), abs(q - hi)))
+    return out
+
+
+@pytest.mark.parametrize("k", [64, 200])
+def test_kll_rank_error_within_documented_bound(k):
+    rng = np.random.default_rng(11)
+    values = np.concatenate([rng.normal(0, 1, 60_000), rng.exponential(5, 40_000)])
+    sketch = KLLSketch(k)
+    for i in range(0, len(values), 7_000):
+        sketch.update_values(values[i:i + 7_000])
+    assert sketch.n == len(values)
+    assert max(_rank_errors(sketch, values)) <= sketch.rank_error
+
+    # ayri parcalardan birlestirilen sketch de ayni sinirda
+    left, right = KLLSketch(k).update_values(values[:30_000]), KLLSketch(k).update_values(values[30_000:])
+    assert max(_rank_errors(left.merge(right), values)) <= sketch.rank_error
+
+
+def test_kll_is_seeded_exact_when_small_and_ignores_nan():
+    values = np.random.default_rng(5).random(50_000)
+    assert KLLSketch().update_values(values).quantiles(QS) == KLLSketch().update_values(values).quantiles(QS)
+    small = KLLSketch().update_values(np.array([3.0, np.nan, 1.0, 2.0]))
+    assert small.n == 3
+    assert small.quantiles([0.0, 0.5, 1.0]) == [1.0, 2.0, 3.0]
+    assert KLLSketch().quantiles([0.5]) == [None]
+
+
+def test_profile_quantiles_for_numbers_and_dates():
+    n = 20_000
+    df = pd.DataFrame({"x": np.arange(n, dtype=float),
+                       "d": pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(n) % 1000, unit="D")})
+    exact = profile_columns("s", df).set_index("kolon_adi")
+    kll = profile_columns("s", df, quantile_mode="kll").set_index("kolon_adi")
+    bound = KLLSketch().rank_error * n
+    for col in ("median", "p1", "p25", "p75", "p99"):
+        assert abs(float(kll.loc["x", col]) - float(exact.loc["x", col])) <= bound
+    # tarih quantile'lari epoch uzerinden: 1000 farkli gunun rank hatasi kadar sapabilir
+    for col in ("p5", "p25", "p75", "p95"):
+        days = (pd.Timestamp(kll.loc["d", col]) - pd.Timestamp(exact.loc["d", col])).days
+        assert abs(days) <= KLLSketch().rank_error * 1000 + 1
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from app.type_inference import infer_text_column
+
+
+@pytest.mark.parametrize("values, label, expected", [
+    # tek noktali degerler: kanit yok, nokta ondaliktir
+    (["3.125", "12.500", "7.750"], "float", [3.125, 12.5, 7.75]),
+    (["1.5", "2.25"], "float", [1.5, 2.25]),
+    # "," ondalikli deger varsa nokta binlik ayiricidir
+    (["1.234,56", "3.125"], "float", [1234.56, 3125.0]),
+    (["3,5", "12.500"], "float", [3.5, 12500.0]),
+    # birden cok noktali grup: Turkce binlik
+    (["1.234.567", "3.125"], "int", [1234567, 3125]),
+    # Ingilizce binlik + ondalik
+    (["1,234.5", "3.125"], "float", [1234.5, 3.125]),
+    (["1,234", "5,000.25"], "float", [1234.0, 5000.25]),
+    # sadece virgul: Turkce ondalik
+    (["3,125", "7,5"], "float", [3.125, 7.5]),
+    (["12", "-7", "+3"], "int", [12, -7, 3]),
+    # basinda sifir: kod, sayi degil
+    (["00123", "45"], "text", None),
+    # iki bicim karisik: metin kalir
+    (["1.234.567", "1,234,567"], "text", None),
+])
+def test_number_rules(values, label, expected):
+    got_label, converted = infer_text_column(pd.Series(values, dtype=object))
+    assert got_label == label
+    if expected is None:
+        assert converted is None
+    else:
+        assert converted.tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("values, label", [
+    (["17.10.2026", "01.02.2025"], "date"),
+    (["2026-10-17", "2025-02-01"], "date"),
+    (["17 Ekim 2026", "1 Şubat 2025"], "date"),
+    (["17.10.26"], "text"),
+    (["EVET", "belki"], "text"),
+    (["EVET", "hayir", "true"], "bool"),
+    (["abc", "12"], "text"),
+])
+def test_other_rules(values, label):
+    assert infer_text_column(pd.Series(values, dtype=object))[0] == label